@@ -2,9 +2,14 @@
 FastAPI Main Application
 =========================
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import anyio.to_thread
+import orjson
 
 from app.settings import settings
 from app.routes import health, telemetry, ws, replay, research, incidents, bot, portfolio
@@ -15,9 +20,36 @@ from app.telemetry.builder import TelemetryBuilder
 builder = TelemetryBuilder()
 
 
+def _prime_alpaca_session():
+    """Create the shared Alpaca connector before the first portfolio request."""
+    portfolio.get_alpaca_connector()
+
+
+async def _warm_caches():
+    """Load cold caches in the background; /health reports ready when done."""
+    results = await asyncio.gather(
+        asyncio.to_thread(incidents.incident_store.load),
+        asyncio.to_thread(_prime_alpaca_session),
+        asyncio.to_thread(replay.replay_store.list_runs),
+        return_exceptions=True,
+    )
+    for name, result in zip(("incidents", "alpaca", "replay"), results):
+        if isinstance(result, Exception):
+            print(f"[WARN] Warm-up of {name} failed: {result}")
+    health.set_ready(True)
+    print("[OK] Background warm-up complete")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
+    # Startup: size both threadpools used for blocking I/O. asyncio.to_thread
+    # (broker calls, frame builds) runs on the loop's default executor; sync
+    # `def` endpoints run on anyio's limiter-bounded pool.
+    executor = ThreadPoolExecutor(max_workers=settings.THREADPOOL_SIZE, thread_name_prefix="blocking-io")
+    asyncio.get_running_loop().set_default_executor(executor)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
     # Startup: build initial frame
     try:
         builder.build_frame()
@@ -25,9 +57,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"[WARN] Could not build initial frame: {e}")
     
+    # Startup: warm remaining caches without blocking startup
+    warm_task = asyncio.create_task(_warm_caches())
+    
     yield
     
     # Shutdown
+    warm_task.cancel()
+    executor.shutdown(wait=False, cancel_futures=True)
     print("Shutting down telemetry service...")
 
 
@@ -35,7 +72,8 @@ app = FastAPI(
     title="RiskFusion Quant Car Telemetry",
     version="1.0.0",
     description="Real-time telemetry streaming for the Quant Car cockpit",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS for frontend
@@ -43,8 +81,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:3001", "http://127.0.0.1:3001", "http://localhost:3002", "http://127.0.0.1:3002"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],  # The API exposes no other verbs
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflights for a day
 )
 
 # Include routes
@@ -58,25 +97,41 @@ app.include_router(bot.router)
 app.include_router(portfolio.router)
 
 
+# Static service descriptor, serialized once
+_ROOT_BYTES = orjson.dumps({
+    "service": "RiskFusion Quant Car Telemetry",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "latest": "/telemetry/latest",
+        "stream": "/telemetry/stream",
+        "replay": "/replay/index"
+    }
+})
+
+
 @app.get("/")
 async def root():
-    return {
-        "service": "RiskFusion Quant Car Telemetry",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "latest": "/telemetry/latest",
-            "stream": "/telemetry/stream",
-            "replay": "/replay/index"
-        }
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
+
+    workers = settings.WORKERS
+    if settings.DEBUG and workers > 1:
+        print(f"[INFO] DEBUG reload enabled - running 1 worker instead of {workers}")
+        workers = 1
+
     uvicorn.run(
         "app.main:app",
         host=settings.HOST,
         port=settings.PORT,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        workers=workers,
+        loop=settings.LOOP,
+        http=settings.HTTP,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        backlog=settings.BACKLOG,
+        access_log=settings.ACCESS_LOG
     )
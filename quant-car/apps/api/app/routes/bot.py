@@ -1,28 +1,45 @@
 """
 Bot Control API - Start/Stop/Status endpoints for RiskFusion pipeline
 """
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Literal, Optional
 from datetime import datetime
-import subprocess
-import threading
+from collections import deque
+from itertools import islice
+import asyncio
 import os
 import signal
 
-router = APIRouter(prefix="/bot", tags=["bot"])
+from app.settings import settings
+
+
+def _require_single_worker():
+    """
+    Bot state below lives in one process. With several uvicorn workers each
+    would report its own status and could spawn its own bot, so refuse.
+    """
+    if settings.WORKERS > 1 and not settings.DEBUG:
+        raise HTTPException(
+            status_code=503,
+            detail="Bot control needs WORKERS=1: bot state is not shared between workers",
+        )
+
+
+router = APIRouter(prefix="/bot", tags=["bot"], dependencies=[Depends(_require_single_worker)])
 
 # Global state for bot process
 class BotState:
-    process: Optional[subprocess.Popen] = None
+    process: Optional[asyncio.subprocess.Process] = None
+    task: Optional[asyncio.Task] = None  # Keeps the runner task referenced
     status: Literal["stopped", "starting", "running", "stopping", "error"] = "stopped"
     started_at: Optional[datetime] = None
-    last_run_output: str = ""
+    log_lines: deque = deque(maxlen=2000)  # Ring buffer of recent output lines
     mode: Literal["paper", "live"] = "paper"
     error_message: Optional[str] = None
 
 bot_state = BotState()
-output_lock = threading.Lock()
+_bot_lock = asyncio.Lock()  # Serializes start/stop/run-once transitions
 
 
 class BotStatusResponse(BaseModel):
@@ -51,13 +68,19 @@ async def get_bot_status():
         mode=bot_state.mode,
         started_at=bot_state.started_at.isoformat() if bot_state.started_at else None,
         uptime_seconds=uptime,
-        last_output=bot_state.last_run_output[-2000:],  # Last 2000 chars
+        last_output=_tail_output(200),
         error_message=bot_state.error_message,
     )
 
 
-def run_bot_process(mode: str):
-    """Background task to run the bot"""
+def _tail_output(n_lines: int) -> str:
+    """Join the last n_lines of bot output (only materialized on request)."""
+    log_lines = bot_state.log_lines
+    return "".join(islice(log_lines, max(0, len(log_lines) - n_lines), None))
+
+
+async def run_bot_process(mode: str):
+    """Background task to run the bot (stdout is read on the event loop)"""
     global bot_state
     
     try:
@@ -80,32 +103,30 @@ def run_bot_process(mode: str):
         bot_state.started_at = datetime.utcnow()
         bot_state.mode = mode
         bot_state.error_message = None
-        bot_state.last_run_output = "--- NEW RUN INITIATED ---\n"
+        bot_state.log_lines.clear()
+        bot_state.log_lines.append("--- NEW RUN INITIATED ---\n")
         
         # Start process
-        bot_state.process = subprocess.Popen(
-            cmd,
+        bot_state.process = await asyncio.create_subprocess_exec(
+            *cmd,
             cwd=riskfusion_path,
             env=env,  # Pass modified env
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1024 * 1024,  # Max bytes per line before the reader errors
         )
         
         bot_state.status = "running"
         
         # Read output
-        for line in bot_state.process.stdout:
+        async for raw in bot_state.process.stdout:
+            line = raw.decode("utf-8", errors="replace")
             print(f"BOT LOG: {line.strip()}") # Debug to API console
-            with output_lock:
-                bot_state.last_run_output += line
-                # Keep reasonably sized
-                if len(bot_state.last_run_output) > 50000:
-                   bot_state.last_run_output = bot_state.last_run_output[-50000:]
+            # Single producer; deque.append is atomic so no lock is needed
+            bot_state.log_lines.append(line)
         
         # Process finished
-        returncode = bot_state.process.wait()
+        returncode = await bot_state.process.wait()
         if returncode != 0:
             bot_state.status = "error"
             bot_state.error_message = f"Process exited with code {returncode}"
@@ -119,12 +140,22 @@ def run_bot_process(mode: str):
         bot_state.process = None
 
 
+async def _launch(mode: str):
+    """
+    Check-and-spawn under the bot lock. Status flips to "starting" before the
+    lock is released, so a concurrent request can't launch a second process.
+    """
+    async with _bot_lock:
+        if bot_state.status in ["running", "starting"]:
+            raise HTTPException(status_code=400, detail="Bot is already running")
+        
+        bot_state.status = "starting"
+        bot_state.task = asyncio.create_task(run_bot_process(mode))
+
+
 @router.post("/start")
-async def start_bot(request: StartBotRequest, background_tasks: BackgroundTasks):
+async def start_bot(request: StartBotRequest):
     """Start the RiskFusion bot"""
-    if bot_state.status in ["running", "starting"]:
-        raise HTTPException(status_code=400, detail="Bot is already running")
-    
     if request.mode == "live":
         # Extra safety check for live mode
         if not os.environ.get("ALLOW_LIVE_TRADING"):
@@ -134,7 +165,7 @@ async def start_bot(request: StartBotRequest, background_tasks: BackgroundTasks)
             )
     
     # Start bot in background
-    background_tasks.add_task(run_bot_process, request.mode)
+    await _launch(request.mode)
     
     return {
         "message": f"Bot starting in {request.mode} mode",
@@ -145,37 +176,35 @@ async def start_bot(request: StartBotRequest, background_tasks: BackgroundTasks)
 @router.post("/stop")
 async def stop_bot():
     """Stop the running bot"""
-    if bot_state.status not in ["running", "starting"]:
-        raise HTTPException(status_code=400, detail="Bot is not running")
-    
-    bot_state.status = "stopping"
-    
-    if bot_state.process:
-        try:
-            # Try graceful shutdown first
-            bot_state.process.terminate()
+    async with _bot_lock:
+        if bot_state.status not in ["running", "starting"]:
+            raise HTTPException(status_code=400, detail="Bot is not running")
+        
+        bot_state.status = "stopping"
+        
+        if bot_state.process:
             try:
-                bot_state.process.wait(timeout=10)
-            except subprocess.TimeoutExpired:
-                # Force kill
-                bot_state.process.kill()
-        except Exception as e:
-            bot_state.error_message = f"Error stopping: {e}"
-    
-    bot_state.status = "stopped"
-    bot_state.process = None
+                # Try graceful shutdown first
+                bot_state.process.terminate()
+                try:
+                    await asyncio.wait_for(bot_state.process.wait(), 10)
+                except asyncio.TimeoutError:
+                    # Force kill
+                    bot_state.process.kill()
+            except Exception as e:
+                bot_state.error_message = f"Error stopping: {e}"
+        
+        bot_state.status = "stopped"
+        bot_state.process = None
     
     return {"message": "Bot stopped", "status": "stopped"}
 
 
 @router.post("/run-once")
-async def run_once(request: StartBotRequest, background_tasks: BackgroundTasks):
+async def run_once(request: StartBotRequest):
     """Run a single pipeline iteration (non-continuous)"""
-    if bot_state.status in ["running", "starting"]:
-        raise HTTPException(status_code=400, detail="Bot is already running")
-    
     # For single run, we just execute the pipeline once
-    background_tasks.add_task(run_bot_process, request.mode)
+    await _launch(request.mode)
     
     return {
         "message": f"Running single pipeline in {request.mode} mode",
@@ -2,17 +2,42 @@
 Health check endpoint
 =====================
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from datetime import datetime, timezone
+import time
+
+import orjson
 
 router = APIRouter()
 
+# Probes hit this constantly - re-render the body at most once per second
+_HEALTH_REFRESH_S = 1.0
+_health_bytes = b""
+_health_rendered_at = float("-inf")
+
+# Flipped once startup warm-up (incident index, broker client, replay runs) completes
+_ready = False
+
+
+def set_ready(ready: bool):
+    global _ready, _health_rendered_at
+    _ready = ready
+    _health_rendered_at = float("-inf")  # Re-render on next probe
+
 
 @router.get("/health")
 async def health_check():
     """Service health check."""
-    return {
-        "status": "ok",
-        "ts_utc": datetime.now(timezone.utc).isoformat(),
-        "version": "1.0.0"
-    }
+    global _health_bytes, _health_rendered_at
+    
+    now = time.monotonic()
+    if now - _health_rendered_at >= _HEALTH_REFRESH_S:
+        _health_bytes = orjson.dumps({
+            "status": "ok",
+            "ready": _ready,
+            "ts_utc": datetime.now(timezone.utc).isoformat(),
+            "version": "1.0.0"
+        })
+        _health_rendered_at = now
+    
+    return Response(content=_health_bytes, media_type="application/json")
@@ -5,18 +5,20 @@ from fastapi import APIRouter
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional, List
-import json
+import functools
 import uuid
 
 from pydantic import BaseModel
 
 from app.settings import settings
+from app.telemetry.incident_store import IncidentStore
 
 
 router = APIRouter(prefix="/incidents", tags=["incidents"])
 
 # Incident store path
 INCIDENTS_DIR = Path("./data/incidents")
+incident_store = IncidentStore(INCIDENTS_DIR)
 
 
 class Incident(BaseModel):
@@ -37,17 +39,8 @@ class Incident(BaseModel):
 @router.get("/index")
 async def list_incidents(run_id: Optional[str] = None):
     """List incidents, optionally filtered by run_id."""
-    incidents = []
-    
-    # Check for stored incidents
-    if INCIDENTS_DIR.exists():
-        for jsonl_file in INCIDENTS_DIR.glob("*.jsonl"):
-            with open(jsonl_file) as f:
-                for line in f:
-                    if line.strip():
-                        inc = json.loads(line)
-                        if run_id is None or inc.get("run_id") == run_id:
-                            incidents.append(inc)
+    # Index is presorted newest first
+    incidents = incident_store.list(run_id)
     
     # If no incidents found, return demo data
     if not incidents:
@@ -81,21 +74,20 @@ async def list_incidents(run_id: Optional[str] = None):
             },
         ]
     
-    return {"incidents": sorted(incidents, key=lambda x: x.get("opened_ts", ""), reverse=True)}
+    return {"incidents": incidents}
 
 
 @router.get("/{incident_id}")
 async def get_incident(incident_id: str):
     """Get full incident details."""
-    # Search for incident
-    if INCIDENTS_DIR.exists():
-        for jsonl_file in INCIDENTS_DIR.glob("*.jsonl"):
-            with open(jsonl_file) as f:
-                for line in f:
-                    if line.strip():
-                        inc = json.loads(line)
-                        if inc.get("id") == incident_id:
-                            return inc
+    return _lookup_incident(incident_id)
+
+
+def _lookup_incident(incident_id: str) -> dict:
+    """Stored incident by id, or the demo incident if none is stored."""
+    inc = incident_store.get(incident_id)
+    if inc is not None:
+        return inc
     
     # Return demo incident
     return {
@@ -135,7 +127,24 @@ async def get_incident_timeline(incident_id: str):
 @router.get("/{incident_id}/report.md")
 async def get_incident_report(incident_id: str):
     """Generate markdown postmortem report."""
-    inc = await get_incident(incident_id)
+    closed_ts = _lookup_incident(incident_id).get('closed_ts')
+    
+    if closed_ts is None:
+        # Open incidents can still change - render fresh
+        report = _render_report.__wrapped__(incident_id, None)
+    else:
+        report = _render_report(incident_id, closed_ts)
+    
+    return {"markdown": report}
+
+
+@functools.lru_cache(maxsize=256)
+def _render_report(incident_id: str, closed_ts: Optional[str]) -> str:
+    """
+    Render the postmortem markdown. Closed incidents are immutable, so the
+    (incident_id, closed_ts) key is safe to memoize.
+    """
+    inc = _lookup_incident(incident_id)
     
     report = f"""# Incident Postmortem: {inc['type']}
 
@@ -172,17 +181,12 @@ async def get_incident_report(incident_id: str):
 - [ ] Add regime-based gating
 """
     
-    return {"markdown": report}
+    return report
 
 
 @router.post("/create")
 async def create_incident(incident: Incident):
     """Create a new incident (internal use)."""
-    INCIDENTS_DIR.mkdir(parents=True, exist_ok=True)
-    
-    incident_file = INCIDENTS_DIR / f"{incident.run_id}.jsonl"
-    
-    with open(incident_file, "a") as f:
-        f.write(json.dumps(incident.dict()) + "\n")
+    incident_store.append(incident.model_dump())
     
     return {"status": "created", "id": incident.id}
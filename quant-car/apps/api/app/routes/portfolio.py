@@ -6,10 +6,15 @@ and getting AI-powered optimization recommendations.
 """
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Awaitable, Callable, Tuple
 from datetime import datetime
+import asyncio
 import os
 import sys
+import time
+import pandas as pd
+
+from app.settings import settings
 
 # Add riskfusion to path
 riskfusion_path = os.environ.get(
@@ -18,6 +23,14 @@ riskfusion_path = os.environ.get(
 )
 sys.path.insert(0, riskfusion_path)
 
+try:
+    from riskfusion.execution.alpaca_connector import AlpacaConnector
+    from riskfusion.execution.oms import OMS
+    _import_error: Optional[Exception] = None
+except Exception as e:  # RiskFusion not installed/reachable - endpoints report 500
+    AlpacaConnector = OMS = None
+    _import_error = e
+
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
 
@@ -75,24 +88,111 @@ class ClosePositionRequest(BaseModel):
     symbol: str
 
 
+# ============ Recommendation Thresholds ============
+
+CONCENTRATION_LIMIT_PCT = 15.0  # % of equity in a single name
+TAKE_PROFIT_PCT = 30.0  # Unrealized gain %
+STOP_LOSS_PCT = -20.0  # Unrealized loss %
+
+_RECOMMENDATION_NUMERIC = ['market_value', 'unrealized_pl', 'unrealized_plpc', 'cost_basis']
+_RECOMMENDATION_COLUMNS = ['symbol'] + _RECOMMENDATION_NUMERIC
+
+
+# ============ Snapshot Cache ============
+
+class AsyncTTLCache:
+    """
+    Tiny in-process TTL cache with single-flight refresh.
+    
+    Concurrent callers for an expired key await the same in-flight task
+    instead of each issuing their own upstream request. The check-and-spawn
+    section has no awaits, so it is atomic on the event loop without a lock.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+    
+    async def get_or_set(self, key: str, ttl: float, factory: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            generation = self._generation
+            task.add_done_callback(lambda t: self._store(key, ttl, generation, t))
+        
+        # Shield so one cancelled caller doesn't cancel the shared refresh
+        return await asyncio.shield(task)
+    
+    def _store(self, key: str, ttl: float, generation: int, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Drop results from refreshes that raced with an invalidation
+        if generation != self._generation or task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic() + ttl, task.result())
+    
+    def invalidate(self):
+        """Drop all cached snapshots (call after any state-changing order)."""
+        self._generation += 1
+        self._entries.clear()
+        self._inflight.clear()
+
+
+snapshot_cache = AsyncTTLCache()
+
+
 # ============ Helper Functions ============
 
+_alpaca = None
+_oms = None
+
+
 def get_alpaca_connector():
-    """Get AlpacaConnector instance with proper imports."""
-    try:
-        from riskfusion.execution.alpaca_connector import AlpacaConnector
-        return AlpacaConnector()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to initialize Alpaca: {e}")
+    """Get the shared AlpacaConnector instance (created on first use)."""
+    global _alpaca
+    if _alpaca is None:
+        try:
+            if _import_error is not None:
+                raise _import_error
+            _alpaca = AlpacaConnector()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to initialize Alpaca: {e}")
+    return _alpaca
 
 
 def get_oms():
-    """Get OMS instance."""
-    try:
-        from riskfusion.execution.oms import OMS
-        return OMS()
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to initialize OMS: {e}")
+    """Get the shared OMS instance (created on first use)."""
+    global _oms
+    if _oms is None:
+        try:
+            if _import_error is not None:
+                raise _import_error
+            _oms = OMS()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to initialize OMS: {e}")
+    return _oms
+
+
+async def fetch_account(alpaca) -> Dict:
+    """Account snapshot, shared across requests for ALPACA_SNAPSHOT_TTL_S."""
+    return await snapshot_cache.get_or_set(
+        "account", settings.ALPACA_SNAPSHOT_TTL_S,
+        lambda: asyncio.to_thread(alpaca.get_account)
+    )
+
+
+async def fetch_positions(alpaca) -> List[Dict]:
+    """Positions snapshot, shared across requests for ALPACA_SNAPSHOT_TTL_S."""
+    return await snapshot_cache.get_or_set(
+        "positions", settings.ALPACA_SNAPSHOT_TTL_S,
+        lambda: asyncio.to_thread(alpaca.get_positions)
+    )
 
 
 # ============ Endpoints ============
@@ -102,27 +202,33 @@ async def get_positions():
     """Get all current positions with P&L."""
     try:
         alpaca = get_alpaca_connector()
-        account = alpaca.get_account()
-        positions = alpaca.get_positions()
+        account, positions = await asyncio.gather(
+            fetch_account(alpaca),
+            fetch_positions(alpaca),
+        )
         
         equity = float(account.get('equity', 0))
         
         result = []
+        # Hoist loop invariants and bound lookups out of the per-position loop
+        _float = float
+        pct_scale = 100 / equity if equity > 0 else 0
+        append = result.append
         for pos in positions:
-            market_value = float(pos.get('market_value', 0))
-            pct_of_portfolio = (market_value / equity * 100) if equity > 0 else 0
+            get = pos.get
+            market_value = _float(get('market_value', 0))
             
-            result.append(Position(
-                symbol=pos.get('symbol'),
-                qty=float(pos.get('qty', 0)),
+            append(Position(
+                symbol=get('symbol'),
+                qty=_float(get('qty', 0)),
                 market_value=market_value,
-                cost_basis=float(pos.get('cost_basis', 0)),
-                unrealized_pl=float(pos.get('unrealized_pl', 0)),
-                unrealized_plpc=float(pos.get('unrealized_plpc', 0)) * 100,
-                current_price=float(pos.get('current_price', 0)),
-                avg_entry_price=float(pos.get('avg_entry_price', 0)),
-                side=pos.get('side', 'long'),
-                pct_of_portfolio=round(pct_of_portfolio, 2)
+                cost_basis=_float(get('cost_basis', 0)),
+                unrealized_pl=_float(get('unrealized_pl', 0)),
+                unrealized_plpc=_float(get('unrealized_plpc', 0)) * 100,
+                current_price=_float(get('current_price', 0)),
+                avg_entry_price=_float(get('avg_entry_price', 0)),
+                side=get('side', 'long'),
+                pct_of_portfolio=round(market_value * pct_scale, 2)
             ))
         
         # Sort by market value descending
@@ -140,7 +246,10 @@ async def get_portfolio_summary():
     """Get portfolio summary including equity, cash, P&L."""
     try:
         alpaca = get_alpaca_connector()
-        account = alpaca.get_account()
+        account, positions = await asyncio.gather(
+            fetch_account(alpaca),
+            fetch_positions(alpaca),
+        )
         
         equity = float(account.get('equity', 0))
         last_equity = float(account.get('last_equity', equity))
@@ -148,9 +257,12 @@ async def get_portfolio_summary():
         day_pl_pct = (day_pl / last_equity * 100) if last_equity > 0 else 0
         
         # Calculate total P&L from positions
-        positions = alpaca.get_positions()
-        total_pl = sum(float(p.get('unrealized_pl', 0)) for p in positions)
-        total_cost = sum(float(p.get('cost_basis', 0)) for p in positions)
+        total_pl = 0.0
+        total_cost = 0.0
+        for p in positions:
+            get = p.get
+            total_pl += float(get('unrealized_pl', 0))
+            total_cost += float(get('cost_basis', 0))
         total_pl_pct = (total_pl / total_cost * 100) if total_cost > 0 else 0
         
         return PortfolioSummary(
@@ -175,7 +287,8 @@ async def close_position(symbol: str):
     """Close a specific position."""
     try:
         alpaca = get_alpaca_connector()
-        result = alpaca.close_position(symbol)
+        result = await asyncio.to_thread(alpaca.close_position, symbol)
+        snapshot_cache.invalidate()
         return {
             "message": f"Position {symbol} closed",
             "order": result
@@ -191,7 +304,8 @@ async def close_all_positions():
     """Liquidate entire portfolio. USE WITH CAUTION."""
     try:
         alpaca = get_alpaca_connector()
-        result = alpaca.close_all_positions()
+        result = await asyncio.to_thread(alpaca.close_all_positions)
+        snapshot_cache.invalidate()
         return {
             "message": "All positions closed",
             "result": result
@@ -207,7 +321,7 @@ async def get_orders(status: str = "open"):
     """Get orders by status (open, closed, all)."""
     try:
         alpaca = get_alpaca_connector()
-        orders = alpaca.get_orders(status=status)
+        orders = await asyncio.to_thread(alpaca.get_orders, status=status)
         
         result = []
         for o in orders:
@@ -235,7 +349,8 @@ async def cancel_all_orders():
     """Cancel all pending orders."""
     try:
         alpaca = get_alpaca_connector()
-        result = alpaca.cancel_all_orders()
+        result = await asyncio.to_thread(alpaca.cancel_all_orders)
+        snapshot_cache.invalidate()
         return {
             "message": "All orders cancelled",
             "cancelled": result
@@ -250,8 +365,6 @@ async def cancel_all_orders():
 async def trigger_rebalance(request: RebalanceRequest):
     """Trigger manual rebalance with specified target weights."""
     try:
-        import pandas as pd
-        
         oms = get_oms()
         
         # Convert weights dict to DataFrame
@@ -260,7 +373,8 @@ async def trigger_rebalance(request: RebalanceRequest):
             for ticker, weight in request.weights.items()
         ]).set_index('ticker')
         
-        result = oms.execute_rebalance(weights_df)
+        result = await asyncio.to_thread(oms.execute_rebalance, weights_df)
+        snapshot_cache.invalidate()
         
         return {
             "message": "Rebalance executed",
@@ -280,49 +394,59 @@ async def get_recommendations():
     """Get AI-powered optimization recommendations based on current portfolio."""
     try:
         alpaca = get_alpaca_connector()
-        account = alpaca.get_account()
-        positions = alpaca.get_positions()
+        account, positions = await asyncio.gather(
+            fetch_account(alpaca),
+            fetch_positions(alpaca),
+        )
         
         equity = float(account.get('equity', 0))
         recommendations = []
         
-        # Analyze concentration risk
-        for pos in positions:
-            symbol = pos.get('symbol')
-            market_value = float(pos.get('market_value', 0))
-            pct = (market_value / equity * 100) if equity > 0 else 0
-            unrealized_pl = float(pos.get('unrealized_pl', 0))
-            unrealized_plpc = float(pos.get('unrealized_plpc', 0)) * 100
+        # Analyze concentration risk / P&L extremes in one columnar pass
+        if positions:
+            df = pd.DataFrame(positions).reindex(columns=_RECOMMENDATION_COLUMNS)
+            df[_RECOMMENDATION_NUMERIC] = df[_RECOMMENDATION_NUMERIC].fillna(0).astype(float)
+            df['pct'] = df['market_value'] / equity * 100 if equity > 0 else 0.0
+            df['plpc'] = df['unrealized_plpc'] * 100
             
             # Over-concentrated position (>15%)
-            if pct > 15:
-                recommendations.append(Recommendation(
+            over = df[df['pct'] > CONCENTRATION_LIMIT_PCT]
+            recommendations.extend(
+                Recommendation(
                     type="reduce",
                     symbol=symbol,
-                    reason=f"{symbol} is {pct:.1f}% of portfolio - exceeds 15% concentration limit",
+                    reason=f"{symbol} is {pct:.1f}% of portfolio - exceeds {CONCENTRATION_LIMIT_PCT:g}% concentration limit",
                     priority="high",
                     suggested_action=f"Reduce {symbol} to ~10% of portfolio"
-                ))
+                )
+                for symbol, pct in zip(over['symbol'], over['pct'])
+            )
             
             # Big winner - consider taking profits (>30% gain)
-            if unrealized_plpc > 30:
-                recommendations.append(Recommendation(
+            winners = df[df['plpc'] > TAKE_PROFIT_PCT]
+            recommendations.extend(
+                Recommendation(
                     type="reduce",
                     symbol=symbol,
-                    reason=f"{symbol} is up {unrealized_plpc:.1f}% - consider taking profits",
+                    reason=f"{symbol} is up {plpc:.1f}% - consider taking profits",
                     priority="medium",
                     suggested_action=f"Trim {symbol} position by 20-30%"
-                ))
+                )
+                for symbol, plpc in zip(winners['symbol'], winners['plpc'])
+            )
             
             # Big loser - consider cutting (>20% loss)
-            if unrealized_plpc < -20:
-                recommendations.append(Recommendation(
+            losers = df[df['plpc'] < STOP_LOSS_PCT]
+            recommendations.extend(
+                Recommendation(
                     type="close",
                     symbol=symbol,
-                    reason=f"{symbol} is down {unrealized_plpc:.1f}% - consider cutting losses",
+                    reason=f"{symbol} is down {plpc:.1f}% - consider cutting losses",
                     priority="high",
                     suggested_action=f"Close or reduce {symbol} position"
-                ))
+                )
+                for symbol, plpc in zip(losers['symbol'], losers['plpc'])
+            )
         
         # Check for too many positions
         if len(positions) > 20:
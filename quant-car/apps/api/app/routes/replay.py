@@ -3,6 +3,7 @@ Replay endpoints
 ================
 """
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from pathlib import Path
 import json
@@ -23,7 +24,7 @@ async def get_replay_index():
     return {"runs": runs}
 
 
-@router.get("/{run_id}")
+@router.get("/{run_id}", response_model=None)
 async def get_replay_frames(
     run_id: str,
     start_ts: Optional[str] = Query(default=None),
@@ -32,14 +33,15 @@ async def get_replay_frames(
 ):
     """
     Get frames for a specific replay run.
+    Frames are already plain dicts, so they go straight to orjson.
     """
     frames = replay_store.get_frames(run_id, start_ts, end_ts, limit)
     
     if not frames:
         raise HTTPException(status_code=404, detail=f"No frames for run {run_id}")
     
-    return {
+    return ORJSONResponse(content={
         "run_id": run_id,
         "frame_count": len(frames),
         "frames": frames
-    }
+    })
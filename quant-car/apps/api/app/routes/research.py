@@ -5,45 +5,45 @@ from fastapi import APIRouter
 from pathlib import Path
 from typing import Optional
 import json
-import pandas as pd
+import os
+import re
 
 from app.settings import settings
+from app.telemetry.builder import read_csv_via_parquet
 
 router = APIRouter(prefix="/research", tags=["research"])
 
+# PSI rows in monitoring reports: "| feature | ⚠️ 0.42 |"
+_PSI_RE = re.compile(r'\| (\w+) \| ⚠️ ([\d.]+) \|')
+
 
 @router.get("/index")
 async def list_research_artifacts():
     """List available research artifacts by run_id."""
-    artifacts = []
+    walkforward, ablation, drift = [], [], []
     
     if settings.DATA_OUTPUT_DIR.exists():
-        # Find walk-forward results
-        for f in settings.DATA_OUTPUT_DIR.glob("walkforward_*.json"):
-            run_id = f.stem.replace("walkforward_results_", "").replace("walkforward_", "")
-            artifacts.append({
-                "run_id": run_id,
-                "type": "walkforward",
-                "path": str(f),
-            })
-        
-        # Find ablation metrics
-        for f in settings.DATA_OUTPUT_DIR.glob("ablation_metrics_*.csv"):
-            run_id = f.stem.replace("ablation_metrics_", "")
-            artifacts.append({
-                "run_id": run_id,
-                "type": "ablation",
-                "path": str(f),
-            })
-        
-        # Find monitoring reports (contain drift)
-        for f in settings.DATA_OUTPUT_DIR.glob("monitoring_report_*.md"):
-            date = f.stem.replace("monitoring_report_", "")
-            artifacts.append({
-                "run_id": date.replace("-", ""),
-                "type": "drift",
-                "path": str(f),
-            })
+        # One directory pass, dispatching on the file name prefix
+        with os.scandir(settings.DATA_OUTPUT_DIR) as it:
+            for entry in it:
+                name = entry.name
+                
+                # Walk-forward results
+                if name.startswith("walkforward_") and name.endswith(".json"):
+                    run_id = name[:-len(".json")].replace("walkforward_results_", "").replace("walkforward_", "")
+                    walkforward.append({"run_id": run_id, "type": "walkforward", "path": entry.path})
+                
+                # Ablation metrics
+                elif name.startswith("ablation_metrics_") and name.endswith(".csv"):
+                    run_id = name[len("ablation_metrics_"):-len(".csv")]
+                    ablation.append({"run_id": run_id, "type": "ablation", "path": entry.path})
+                
+                # Monitoring reports (contain drift)
+                elif name.startswith("monitoring_report_") and name.endswith(".md"):
+                    date = name[len("monitoring_report_"):-len(".md")]
+                    drift.append({"run_id": date.replace("-", ""), "type": "drift", "path": entry.path})
+    
+    artifacts = walkforward + ablation + drift
     
     return {"artifacts": artifacts}
 
@@ -113,16 +113,23 @@ async def get_drift(run_id: str):
     }
     
     if path.exists():
-        import re
         content = path.read_text(encoding='utf-8')
-        psi_pattern = r'\| (\w+) \| ⚠️ ([\d.]+) \|'
-        for match in re.finditer(psi_pattern, content):
-            feature, psi = match.groups()
-            drift_data["features"].append({
-                "name": feature,
-                "psi": float(psi),
-                "breached": float(psi) > 0.2,
-            })
+        in_table = False
+        for line in content.split('\n'):
+            # PSI rows live in a single markdown table; skip prose, stop after it
+            if not line.startswith('|'):
+                if in_table:
+                    break
+                continue
+            for match in _PSI_RE.finditer(line):
+                in_table = True
+                feature, psi = match.groups()
+                psi = float(psi)
+                drift_data["features"].append({
+                    "name": feature,
+                    "psi": psi,
+                    "breached": psi > 0.2,
+                })
     else:
         # Mock data
         drift_data["features"] = [
@@ -142,7 +149,7 @@ async def get_diagnostics(run_id: str):
     path = settings.DATA_OUTPUT_DIR / f"residual_buckets_{run_id}.csv"
     
     if path.exists():
-        df = pd.read_csv(path)
+        df = read_csv_via_parquet(path)
         buckets = df.to_dict(orient='records')
     else:
         # Mock buckets
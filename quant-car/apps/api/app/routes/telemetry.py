@@ -2,7 +2,7 @@
 Telemetry REST endpoints
 ========================
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 import sys
 from pathlib import Path
@@ -21,8 +21,8 @@ async def get_latest_telemetry():
     Get the latest telemetry frame.
     """
     try:
-        frame = builder.build_frame()
-        return frame
+        # Cached serialization; skips response_model validation + dump per call
+        return Response(content=builder.build_payload(), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to build frame: {e}")
 
@@ -34,7 +34,6 @@ async def get_frame_by_date(trading_date: str):
     Date format: YYYYMMDD
     """
     try:
-        frame = builder.build_frame(trading_date)
-        return frame
+        return Response(content=builder.build_payload(trading_date), media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"No data for {trading_date}: {e}")
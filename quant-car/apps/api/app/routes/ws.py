@@ -3,8 +3,10 @@ WebSocket telemetry stream
 ==========================
 """
 import asyncio
+import time
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from typing import Literal
+from typing import Dict, List, Literal, Optional
+import orjson
 
 from app.telemetry.builder import TelemetryBuilder
 from app.settings import settings
@@ -12,27 +14,108 @@ from app.settings import settings
 router = APIRouter()
 builder = TelemetryBuilder()
 
+# Sends per batch before yielding back to the event loop
+BROADCAST_BATCH_SIZE = 50
+
+# Best-effort close of a dropped socket; a wedged peer can't hold the broadcast
+PRUNE_CLOSE_TIMEOUT_S = 1.0
+
 
 class ConnectionManager:
-    """Manages WebSocket connections."""
+    """
+    Manages WebSocket connections.
+    Follow-mode clients share one producer task that builds and serializes
+    each frame once, then fans it out to every client that is due.
+    """
     
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
+        self._followers: Dict[WebSocket, List[float]] = {}  # ws -> [interval_s, last_sent]
+        self._producer: Optional[asyncio.Task] = None
+        self._last_message: Optional[str] = None
     
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._followers.pop(websocket, None)
+    
+    async def follow(self, websocket: WebSocket, interval: float):
+        """Subscribe a connection to the shared frame stream."""
+        last_sent = float("-inf")
+        if self._last_message is not None:
+            await websocket.send_text(self._last_message)
+            last_sent = time.monotonic()
+        self._followers[websocket] = [interval, last_sent]
+        
+        if self._producer is None or self._producer.done():
+            self._producer = asyncio.create_task(self._produce())
     
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except:
-                pass
+    async def broadcast(self, message: str, connections: Optional[List[WebSocket]] = None):
+        """
+        Send a pre-serialized message to all targets concurrently.
+        Sends are started in batches, yielding between them; sockets that
+        fail or stay backpressured past the timeout are dropped and closed.
+        """
+        targets = list(self.active_connections if connections is None else connections)
+        sends = []
+        for i in range(0, len(targets), BROADCAST_BATCH_SIZE):
+            sends.extend(
+                asyncio.create_task(self._send(ws, message))
+                for ws in targets[i:i + BROADCAST_BATCH_SIZE]
+            )
+            await asyncio.sleep(0)
+        
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        failed = [ws for ws, result in zip(targets, results) if isinstance(result, Exception)]
+        for ws in failed:
+            self.disconnect(ws)
+        if failed:
+            await asyncio.gather(*(self._close(ws) for ws in failed))
+    
+    @staticmethod
+    async def _send(websocket: WebSocket, message: str):
+        await asyncio.wait_for(websocket.send_text(message), settings.TELEMETRY_SEND_TIMEOUT_S)
+    
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        """
+        Close a dropped socket (1011) so its handler leaves receive() and the
+        client sees a close frame and reconnects, rather than a frozen stream.
+        """
+        try:
+            await asyncio.wait_for(websocket.close(code=1011), PRUNE_CLOSE_TIMEOUT_S)
+        except Exception:
+            pass  # Already gone, or the send timeout left it unusable
+    
+    async def _produce(self):
+        """Build one frame per tick for all followers; exits when none remain."""
+        while self._followers:
+            tick = min(interval for interval, _ in self._followers.values())
+            now = time.monotonic()
+            # Small slack so clients on the tick interval are not skipped by jitter
+            due = [
+                ws for ws, (interval, last_sent) in self._followers.items()
+                if now - last_sent >= interval - 0.01
+            ]
+            
+            if due:
+                try:
+                    # Payloads go out as text frames so browsers can JSON.parse them
+                    message = await asyncio.to_thread(builder.build_payload)
+                    self._last_message = message
+                except Exception as e:
+                    # Send error but continue
+                    message = orjson.dumps({"error": str(e), "type": "frame_build_error"}).decode()
+                
+                for ws in due:
+                    if ws in self._followers:
+                        self._followers[ws][1] = now
+                await self.broadcast(message, due)
+            
+            await asyncio.sleep(tick)
 
 
 manager = ConnectionManager()
@@ -55,30 +138,22 @@ async def telemetry_stream(
     try:
         if mode == "latest":
             # Send single frame and close
-            frame = builder.build_frame()
-            await websocket.send_json(frame.model_dump(by_alias=True))
+            await websocket.send_text(builder.build_payload())
             return
         
-        # Follow mode: push frames continuously
+        # Follow mode: frames are pushed by the shared producer
         interval_sec = interval_ms / 1000.0
         max_rate = settings.TELEMETRY_MAX_RATE_HZ
         min_interval = 1.0 / max_rate
         actual_interval = max(interval_sec, min_interval)
         
+        await manager.follow(websocket, actual_interval)
+        
+        # Park here until the client goes away
         while True:
-            try:
-                frame = builder.build_frame()
-                await websocket.send_json(frame.model_dump(by_alias=True))
-                await asyncio.sleep(actual_interval)
-            except WebSocketDisconnect:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
                 break
-            except Exception as e:
-                # Send error but continue
-                await websocket.send_json({
-                    "error": str(e),
-                    "type": "frame_build_error"
-                })
-                await asyncio.sleep(actual_interval)
     
     except WebSocketDisconnect:
         pass
@@ -15,10 +15,13 @@ class Settings(BaseSettings):
         "~/OneDrive/Documents/finance ai/riskfusion_alpha/data/outputs"
     ))
     TELEMETRY_DIR: Path = Path("./data/telemetry_frames")
+    ARTIFACT_CACHE_DIR: Path = Path("./data/artifact_cache")  # Parquet copies of CSV outputs
     
     # Telemetry config
     TELEMETRY_PUSH_INTERVAL_MS: int = 500
     TELEMETRY_MAX_RATE_HZ: float = 2.0
+    TELEMETRY_SEND_TIMEOUT_S: float = 2.0  # Drop WebSocket clients that stall a broadcast
+    EXECUTION_MODE: str = "PAPER"  # Reported on frames; PAPER or LIVE
     
     # Normalization constants (match RiskFusion config)
     TURNOVER_CAP: float = 0.30
@@ -30,11 +33,19 @@ class Settings(BaseSettings):
     ALPACA_API_KEY: Optional[str] = None
     ALPACA_SECRET_KEY: Optional[str] = None
     ALPACA_BASE_URL: str = "https://paper-api.alpaca.markets"
+    ALPACA_SNAPSHOT_TTL_S: float = 1.5  # Account/positions cache for polling dashboards
     
     # Server
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True  # Enable for development
+    WORKERS: int = 1  # >1 disables /bot/* (bot state is per process); forced to 1 when DEBUG
+    LOOP: str = "auto"  # uvloop when installed (uvicorn[standard] on Linux)
+    HTTP: str = "auto"  # httptools when installed
+    LIMIT_CONCURRENCY: int = 1024
+    BACKLOG: int = 2048
+    ACCESS_LOG: bool = False
+    THREADPOOL_SIZE: int = 64  # Threads for blocking I/O (asyncio.to_thread and sync endpoints)
     
     class Config:
         env_file = ".env"
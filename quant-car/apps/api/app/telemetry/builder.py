@@ -4,11 +4,18 @@ Telemetry Builder - Builds TelemetryFrame from REAL RiskFusion artifacts
 """
 import json
 import hashlib
+import mmap
+from collections import OrderedDict
+from functools import lru_cache
+import os
 import re
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterator, Tuple
+import numpy as np
 import pandas as pd
+import orjson
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent.parent / "shared"))
@@ -22,6 +29,104 @@ from app.settings import settings
 from app.telemetry.normalization import clamp
 
 
+# Monitoring report patterns (bytes: the report is scanned without decoding)
+_PSI_RE = re.compile(rb'\| (\w+) \| WARN ([\d.]+) \|')
+_TOP_POS_RE = re.compile(rb'Top Position.*?\(([\d.]+)%\)')
+_TOTAL_RE = re.compile(rb'Total Positions.*?(\d+)')
+_CONC_RE = re.compile(rb'Concentration.*?([\d.]+)%')
+
+# Parsed artifacts keyed by path; reused until the file's mtime changes.
+# Paths are dated, so least recently used entries are evicted past the cap.
+# Builds run on the event loop and on worker threads, so the cache is locked
+# (the loader itself runs outside the lock).
+_ARTIFACT_CACHE: "OrderedDict[Path, Tuple[int, Any]]" = OrderedDict()
+_ARTIFACT_CACHE_SIZE = 16
+_ARTIFACT_CACHE_LOCK = threading.Lock()
+
+
+def _load_cached(path: Path, loader: Callable[[Path], Any]) -> Any:
+    """Return loader(path), re-running it only when the file's mtime_ns changes."""
+    mtime_ns = path.stat().st_mtime_ns
+    with _ARTIFACT_CACHE_LOCK:
+        hit = _ARTIFACT_CACHE.get(path)
+        if hit is not None and hit[0] == mtime_ns:
+            _ARTIFACT_CACHE.move_to_end(path)
+            return hit[1]
+    
+    value = loader(path)
+    with _ARTIFACT_CACHE_LOCK:
+        _ARTIFACT_CACHE[path] = (mtime_ns, value)
+        _ARTIFACT_CACHE.move_to_end(path)
+        while len(_ARTIFACT_CACHE) > _ARTIFACT_CACHE_SIZE:
+            _ARTIFACT_CACHE.popitem(last=False)
+    return value
+
+
+def _artifact_copy(path: Path) -> Path:
+    """
+    Parquet copy of a CSV artifact in the API's own cache directory (never
+    next to the CSV: RiskFusion owns that directory and its <stem>.parquet).
+    """
+    folder = hashlib.blake2b(str(path.parent.resolve()).encode(), digest_size=4).hexdigest()
+    return settings.ARTIFACT_CACHE_DIR / f"{path.stem}-{folder}.parquet"
+
+
+def _selected(columns, usecols) -> List[str]:
+    if usecols is None:
+        return list(columns)
+    return [c for c in columns if (usecols(c) if callable(usecols) else c in usecols)]
+
+
+def read_csv_via_parquet(path: Path, usecols=None, dtype=None, **read_csv_kwargs) -> pd.DataFrame:
+    """
+    Read a CSV artifact through a parquet copy of the whole file.
+    The copy is written on first read and used while it is newer than the
+    CSV. `usecols` (list or callable) and `dtype` are applied on the way
+    out, so the copy stays lossless and every caller sees the same data.
+    """
+    cached = _artifact_copy(path)
+    df = None
+    try:
+        if cached.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            import pyarrow.parquet as pq
+            columns = _selected(pq.read_schema(cached).names, usecols)
+            df = pd.read_parquet(cached, columns=columns)
+    except FileNotFoundError:
+        pass
+    except (ImportError, OSError, ValueError) as e:
+        print(f"  [WARN] Ignoring unreadable cache {cached.name}: {e}")
+    
+    if df is None:
+        df = pd.read_csv(path, **read_csv_kwargs)
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cached, compression="zstd", index=False)
+        except (ImportError, OSError, ValueError):
+            pass  # pyarrow missing or read-only volume - stay on CSV
+        df = df[_selected(df.columns, usecols)]
+    
+    if dtype:
+        df = df.astype({c: t for c, t in dtype.items() if c in df.columns})
+    return df
+
+
+@lru_cache(maxsize=64)
+def _run_id(trading_date: str) -> str:
+    """
+    Stable run id for a trading date, hashed once per date.
+    Kept on md5 so ids match replay runs and incidents already on disk.
+    """
+    return f"{trading_date}_{hashlib.md5(trading_date.encode()).hexdigest()[:8]}"
+
+
+# Only these columns are consumed downstream; the rest are never parsed
+_WEIGHT_COLUMNS = {"ticker": "category", "weight": "float64"}
+_ABLATION_COLUMNS = {"ic_mean": "float64", "turnover": "float64"}
+
+# Stands in for ts_utc when a frame is serialized once and re-stamped per send
+_TS_PLACEHOLDER = "\x01ts_utc\x01"
+
+
 class TelemetryBuilder:
     """
     Builds TelemetryFrame from REAL RiskFusion artifacts.
@@ -30,6 +135,10 @@ class TelemetryBuilder:
     def __init__(self, data_dir: Optional[Path] = None):
         self.data_dir = data_dir or settings.DATA_OUTPUT_DIR
         self._latest_frame: Optional[TelemetryFrame] = None
+        # [fingerprint, frame, serialized halves around ts_utc] of the last full
+        # build; a build's own entry is passed along so that concurrent builds
+        # (producer thread vs. request handlers) never read each other's
+        self._frame_cache: Optional[list] = None
         print(f"[INFO] TelemetryBuilder initialized with data_dir: {self.data_dir}")
     
     def build_frame(self, trading_date: Optional[str] = None) -> TelemetryFrame:
@@ -37,6 +146,10 @@ class TelemetryBuilder:
         Build a TelemetryFrame for the given trading date.
         If not specified, uses the latest available date.
         """
+        return self._build(trading_date)[0]
+    
+    def _build(self, trading_date: Optional[str]) -> Tuple[TelemetryFrame, list]:
+        """Build a frame; returns it with the cache entry it was made from."""
         if trading_date is None:
             trading_date = self._get_latest_trading_date()
         
@@ -47,9 +160,18 @@ class TelemetryBuilder:
         monitoring = self._load_monitoring_report(trading_date)
         ablation = self._load_ablation_metrics(trading_date)
         
-        # Determine execution mode from environment
-        import os
-        execution_mode = os.environ.get("EXECUTION_MODE", "PAPER")
+        # Execution mode is resolved from the environment once, at settings load
+        execution_mode = settings.EXECUTION_MODE
+        
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        # Inputs unchanged since the last build: only the timestamp moves
+        fingerprint = self._input_fingerprint(trading_date, execution_mode, weights, monitoring, ablation)
+        cached = self._frame_cache
+        if cached is not None and self._same_fingerprint(cached[0], fingerprint):
+            frame = cached[1].model_copy(update={"ts_utc": now_iso})
+            self._latest_frame = frame
+            return frame, cached
         
         # Build gauges from real data
         speed_alpha = self._build_speed_alpha(weights, ablation)
@@ -61,9 +183,10 @@ class TelemetryBuilder:
         warnings = self._build_warnings_from_monitoring(monitoring)
         hazards = []  # Will be populated from event data when available
         
-        # Build portfolio flow from real weights
-        portfolio_flow = self._build_portfolio_flow(weights)
-        weight_changes = self._build_weight_changes(weights)
+        # Build portfolio flow from real weights (aggregated once for both)
+        weight_agg = self._aggregate_weights(weights)
+        portfolio_flow = self._build_portfolio_flow(weight_agg)
+        weight_changes = self._build_weight_changes(weight_agg)
         
         # Build health from real status
         models = self._build_model_health(monitoring)
@@ -72,7 +195,7 @@ class TelemetryBuilder:
         # Execution/PnL - would come from Alpaca in production
         execution = ExecutionSnapshot(
             alpaca_account_equity=100000,
-            positions_count=weights['ticker'].nunique() if weights is not None else 0,
+            positions_count=len(weight_agg[0]) if weight_agg is not None else 0,
             orders_open=0,
             fills_1d=0
         )
@@ -101,12 +224,12 @@ class TelemetryBuilder:
         
         frame = TelemetryFrame(
             schema_version="1.0",
-            ts_utc=datetime.now(timezone.utc).isoformat(),
+            ts_utc=now_iso,
             trading_date=trading_date,
             execution_mode=execution_mode,
             
             pipeline_status=pipeline_status,
-            pipeline_last_run_ts=datetime.now(timezone.utc).isoformat(),
+            pipeline_last_run_ts=now_iso,
             pipeline_stage_status=pipeline_stage_status,
             
             speed_alpha=speed_alpha,
@@ -129,48 +252,89 @@ class TelemetryBuilder:
             execution=execution,
             pnl=pnl,
             
-            run_id=f"{trading_date}_{hashlib.md5(trading_date.encode()).hexdigest()[:8]}"
+            run_id=_run_id(trading_date)
         )
         
+        entry = [fingerprint, frame, None]
         self._latest_frame = frame
-        return frame
+        self._frame_cache = entry
+        return frame, entry
+    
+    def build_payload(self, trading_date: Optional[str] = None) -> str:
+        """
+        Build a frame and return it as JSON text.
+        The frame is serialized once per input change; later calls only
+        splice in the fresh ts_utc.
+        """
+        frame, entry = self._build(trading_date)
+        
+        parts = entry[2]
+        if parts is None:
+            template = entry[1].model_copy(update={"ts_utc": _TS_PLACEHOLDER})
+            text = orjson.dumps(template.model_dump(mode="json", by_alias=True)).decode()
+            parts = tuple(text.split(orjson.dumps(_TS_PLACEHOLDER).decode(), 1))
+            entry[2] = parts  # Benign race: concurrent fills store equal halves
+        
+        return f'{parts[0]}"{frame.ts_utc}"{parts[1]}'
     
     def get_latest_frame(self) -> Optional[TelemetryFrame]:
         return self._latest_frame
     
+    @staticmethod
+    def _input_fingerprint(trading_date, execution_mode, weights, monitoring, ablation) -> tuple:
+        # Artifacts come from the mtime-keyed cache, so an unchanged file
+        # yields the very same object - identity stands in for mtimes here
+        return (trading_date, execution_mode, weights, monitoring, ablation)
+    
+    @staticmethod
+    def _same_fingerprint(a: tuple, b: tuple) -> bool:
+        return a[:2] == b[:2] and all(x is y for x, y in zip(a[2:], b[2:]))
+    
     # --- Real Artifact Loaders ---
     
+    def _scan_outputs(self, prefix: str, suffix: str) -> Iterator[os.DirEntry]:
+        """Yield data_dir entries named prefix*suffix (single scandir pass, no per-entry stat)."""
+        with os.scandir(self.data_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith(suffix):
+                    yield entry
+    
+    def _latest_output(self, prefix: str, suffix: str) -> Optional[Path]:
+        """Newest prefix*suffix file by name, tracked as a running max (no list, no max())."""
+        best_name = ""
+        best_path = None
+        try:
+            for entry in self._scan_outputs(prefix, suffix):
+                if entry.name > best_name:
+                    best_name = entry.name
+                    best_path = entry.path
+        except FileNotFoundError:
+            return None
+        return Path(best_path) if best_path is not None else None
+    
     def _get_latest_trading_date(self) -> str:
         """Find the most recent trading date with artifacts."""
         if not self.data_dir.exists():
             return datetime.now().strftime("%Y%m%d")
         
         # Look for daily_weights files
-        weight_files = list(self.data_dir.glob("daily_weights_*.csv"))
-        if weight_files:
-            dates = []
-            for f in weight_files:
-                try:
-                    date_str = f.stem.replace("daily_weights_", "")
-                    dates.append(date_str)
-                except:
-                    pass
-            if dates:
-                return max(dates)
+        max_date = None
+        for entry in self._scan_outputs("daily_weights_", ".csv"):
+            date_str = entry.name[len("daily_weights_"):-len(".csv")]
+            if max_date is None or date_str > max_date:
+                max_date = date_str
+        if max_date is not None:
+            return max_date
         
         # Fallback to monitoring reports
-        report_files = list(self.data_dir.glob("monitoring_report_*.md"))
-        if report_files:
-            dates = []
-            for f in report_files:
-                try:
-                    # Format: monitoring_report_2026-01-09.md
-                    date_str = f.stem.replace("monitoring_report_", "").replace("-", "")
-                    dates.append(date_str)
-                except:
-                    pass
-            if dates:
-                return max(dates)
+        # Format: monitoring_report_2026-01-09.md
+        for entry in self._scan_outputs("monitoring_report_", ".md"):
+            date_str = entry.name[len("monitoring_report_"):-len(".md")].replace("-", "")
+            if max_date is None or date_str > max_date:
+                max_date = date_str
+        if max_date is not None:
+            return max_date
         
         return datetime.now().strftime("%Y%m%d")
     
@@ -178,21 +342,29 @@ class TelemetryBuilder:
         """Load daily weights CSV."""
         path = self.data_dir / f"daily_weights_{date}.csv"
         if path.exists():
-            df = pd.read_csv(path)
-            print(f"  [OK] Loaded weights: {len(df)} rows, {df['ticker'].nunique()} unique tickers")
-            return df
+            return _load_cached(path, self._read_weights)
         
         # Try finding any weights file
-        files = list(self.data_dir.glob("daily_weights_*.csv"))
-        if files:
-            latest = max(files, key=lambda f: f.stem)
-            df = pd.read_csv(latest)
+        latest = self._latest_output("daily_weights_", ".csv")
+        if latest is not None:
             print(f"  [WARN] Using weights from {latest.stem}")
-            return df
+            return _load_cached(latest, self._read_weights)
         
         print(f"  [ERROR] No weights file found")
         return None
     
+    def _read_weights(self, path: Path) -> pd.DataFrame:
+        df = read_csv_via_parquet(
+            path,
+            usecols=lambda c: c in _WEIGHT_COLUMNS,
+            dtype=_WEIGHT_COLUMNS,
+            engine="c",
+        )
+        # Categorical tickers let aggregation run as a bincount over codes
+        df['ticker'] = df['ticker'].astype('category')
+        print(f"  [OK] Loaded weights: {len(df)} rows, {df['ticker'].nunique()} unique tickers")
+        return df
+    
     def _load_monitoring_report(self, date: str) -> Optional[Dict]:
         """Parse monitoring report markdown."""
         # Try formatted date first
@@ -201,22 +373,28 @@ class TelemetryBuilder:
         
         if not path.exists():
             # Find latest
-            files = list(self.data_dir.glob("monitoring_report_*.md"))
-            if files:
-                path = max(files, key=lambda f: f.stem)
-            else:
+            path = self._latest_output("monitoring_report_", ".md")
+            if path is None:
                 return None
         
         if path.exists():
-            content = path.read_text(encoding='utf-8')
-            return self._parse_monitoring_report(content)
+            return _load_cached(path, self._read_monitoring_report)
         
         return None
     
-    def _parse_monitoring_report(self, content: str) -> Dict:
+    def _read_monitoring_report(self, path: Path) -> Dict:
+        with open(path, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._parse_monitoring_report(mm)
+            except ValueError:
+                # Empty files cannot be mapped
+                return self._parse_monitoring_report(f.read())
+    
+    def _parse_monitoring_report(self, content: bytes) -> Dict:
         """Parse monitoring report markdown into structured data."""
         data = {
-            'status': 'SUCCESS' if 'SUCCESS' in content else 'UNKNOWN',
+            'status': 'SUCCESS' if content.find(b'SUCCESS') != -1 else 'UNKNOWN',
             'drift_psi': {},
             'top_position': None,
             'total_positions': 0,
@@ -224,21 +402,20 @@ class TelemetryBuilder:
         }
         
         # Extract PSI values
-        psi_pattern = r'\| (\w+) \| WARN ([\d.]+) \|'
-        for match in re.finditer(psi_pattern, content):
+        for match in _PSI_RE.finditer(content):
             feature, psi = match.groups()
-            data['drift_psi'][feature] = float(psi)
+            data['drift_psi'][feature.decode()] = float(psi)
         
         # Extract portfolio summary
-        pos_match = re.search(r'Top Position.*?\(([\d.]+)%\)', content)
+        pos_match = _TOP_POS_RE.search(content)
         if pos_match:
             data['top_position_weight'] = float(pos_match.group(1))
         
-        total_match = re.search(r'Total Positions.*?(\d+)', content)
+        total_match = _TOTAL_RE.search(content)
         if total_match:
             data['total_positions'] = int(total_match.group(1))
         
-        conc_match = re.search(r'Concentration.*?([\d.]+)%', content)
+        conc_match = _CONC_RE.search(content)
         if conc_match:
             data['concentration_top5'] = float(conc_match.group(1))
         
@@ -247,12 +424,19 @@ class TelemetryBuilder:
     
     def _load_ablation_metrics(self, date: str) -> Optional[pd.DataFrame]:
         """Load ablation metrics."""
-        files = list(self.data_dir.glob("ablation_metrics_*.csv"))
-        if files:
-            latest = max(files, key=lambda f: f.stem)
-            return pd.read_csv(latest)
+        latest = self._latest_output("ablation_metrics_", ".csv")
+        if latest is not None:
+            return _load_cached(latest, self._read_ablation)
         return None
     
+    def _read_ablation(self, path: Path) -> pd.DataFrame:
+        return read_csv_via_parquet(
+            path,
+            usecols=lambda c: c in _ABLATION_COLUMNS,
+            dtype=_ABLATION_COLUMNS,
+            engine="c",
+        )
+    
     # --- Gauge Builders Using Real Data ---
     
     def _build_speed_alpha(self, weights: Optional[pd.DataFrame], ablation: Optional[pd.DataFrame]) -> Gauge:
@@ -319,56 +503,92 @@ class TelemetryBuilder:
     
     # --- Portfolio Flow from Real Weights ---
     
-    def _build_portfolio_flow(self, weights: Optional[pd.DataFrame]) -> PortfolioFlow:
+    def _aggregate_weights(
+        self, weights: Optional[pd.DataFrame]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Sum weights per ticker (handles duplicates) and rank the top 10.
+        Returns (tickers, totals, top) where `top` indexes the 10 largest
+        totals, descending; shared by the flow and weight-change builders.
+        """
+        if weights is None or weights.empty:
+            return None
+        
+        tickers = weights['ticker'].astype('category').cat
+        codes = tickers.codes.to_numpy()
+        w = weights['weight'].to_numpy(dtype=np.float64, na_value=0.0)
+        
+        # Missing tickers have code -1 and are dropped, like groupby
+        valid = codes >= 0
+        counts = np.bincount(codes[valid], minlength=len(tickers.categories))
+        totals = np.bincount(codes[valid], weights=w[valid], minlength=len(tickers.categories))
+        
+        present = np.flatnonzero(counts)
+        totals = totals[present]
+        return tickers.categories.to_numpy()[present], totals, self._top_k(totals, 10)
+    
+    @staticmethod
+    def _top_k(totals: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest totals, descending (partial selection, no full sort)."""
+        if len(totals) > k:
+            idx = np.argpartition(-totals, k)[:k]
+        else:
+            idx = np.arange(len(totals))
+        return idx[np.argsort(-totals[idx], kind="stable")]
+    
+    def _build_portfolio_flow(
+        self, weight_agg: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+    ) -> PortfolioFlow:
         """Build portfolio flow from real weights."""
         nodes = []
         edges = []
         
-        if weights is None or weights.empty:
+        if weight_agg is None:
             return PortfolioFlow(nodes=nodes, edges=edges)
         
-        # Aggregate by ticker (handle duplicates)
-        ticker_weights = weights.groupby('ticker')['weight'].sum().reset_index()
-        ticker_weights = ticker_weights.sort_values('weight', ascending=False)
+        tickers, totals, top = weight_agg
         
         # Top 10 holdings
-        for _, row in ticker_weights.head(10).iterrows():
+        for ticker, weight in zip(tickers[top], totals[top]):
             nodes.append(PortfolioFlowNode(
-                id=f"ticker:{row['ticker']}",
-                label=row['ticker'],
-                weight=min(float(row['weight']), 1.0)
+                id=f"ticker:{ticker}",
+                label=ticker,
+                weight=min(float(weight), 1.0)
             ))
         
         # Add "Other" bucket
-        other_weight = ticker_weights.iloc[10:]['weight'].sum() if len(ticker_weights) > 10 else 0
+        other_weight = totals.sum() - totals[top].sum() if len(totals) > 10 else 0
         if other_weight > 0:
             nodes.append(PortfolioFlowNode(
                 id="other",
-                label=f"Other ({len(ticker_weights) - 10} stocks)",
+                label=f"Other ({len(totals) - 10} stocks)",
                 weight=min(other_weight, 1.0)
             ))
         
         # HHI concentration
-        total = ticker_weights['weight'].sum()
+        total = totals.sum()
         if total > 0:
-            shares = ticker_weights['weight'] / total
+            shares = totals / total
             hhi = (shares ** 2).sum()
         else:
             hhi = 0
         
         return PortfolioFlow(nodes=nodes, edges=edges, concentration_hhi=hhi)
     
-    def _build_weight_changes(self, weights: Optional[pd.DataFrame]) -> List[WeightChange]:
+    def _build_weight_changes(
+        self, weight_agg: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+    ) -> List[WeightChange]:
         """Build weight changes - would compare to previous day in production."""
         changes = []
         
-        if weights is None:
+        if weight_agg is None:
             return changes
         
         # For now, show top weights as "changes"
-        ticker_weights = weights.groupby('ticker')['weight'].sum().sort_values(ascending=False)
+        tickers, totals, top = weight_agg
+        top = top[:5]
         
-        for ticker, weight in ticker_weights.head(5).items():
+        for ticker, weight in zip(tickers[top], totals[top]):
             changes.append(WeightChange(
                 ticker=ticker,
                 weight_prev=weight * 0.95,  # Simulated previous
@@ -0,0 +1,149 @@
+"""
+Incident Store - Indexed JSONL persistence for incidents
+=========================================================
+"""
+import bisect
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
+
+import orjson
+
+
+def _opened_ts(incident: Dict[str, Any]) -> str:
+    return incident.get("opened_ts", "")
+
+
+class IncidentStore:
+    """
+    Stores incidents in append-only per-run JSONL files.
+    The directory is indexed in memory. Every read re-stats the files and
+    parses only the bytes appended since the last sync, so incidents written
+    by other workers or processes show up without rescanning everything.
+    """
+    
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.by_run: Dict[str, List[Dict[str, Any]]] = {}
+        self._all: List[Dict[str, Any]] = []  # Ascending by opened_ts
+        # File name -> (mtime_ns, size, offset) as of the last sync; offset is
+        # the end of the last complete line parsed
+        self._files: Dict[str, Tuple[int, int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Scan the incidents directory and rebuild the index."""
+        with self._lock:
+            self._reset()
+            self._sync()
+    
+    def _reset(self):
+        """Forget everything indexed so far. Caller holds _lock."""
+        self.by_id = {}
+        self.by_run = {}
+        self._all = []
+        self._files = {}
+    
+    def _sync(self):
+        """
+        Bring the index up to date with the directory. Caller holds _lock.
+        Files that grew are read from their last offset; a file that shrank,
+        was rewritten in place or was removed triggers a full rebuild.
+        """
+        if not self.base_dir.exists():
+            if self._files:
+                self._reset()
+            return
+        
+        added: List[Dict[str, Any]] = []
+        seen = set()
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".jsonl") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                st = entry.stat()
+                state = self._files.get(entry.name)
+                if state is not None and (st.st_mtime_ns, st.st_size) == state[:2]:
+                    continue
+                if state is not None and (st.st_size < state[2] or st.st_size == state[1]):
+                    return self._rebuild()
+                
+                offset = 0 if state is None else state[2]
+                try:
+                    self._files[entry.name] = self._read_appended(entry.path, offset, added)
+                except FileNotFoundError:
+                    seen.discard(entry.name)  # Removed mid-scan
+        
+        if seen != self._files.keys():
+            return self._rebuild()
+        self._insert(added)
+    
+    def _rebuild(self):
+        self._reset()
+        self._sync()
+    
+    @staticmethod
+    def _read_appended(path: str, offset: int, out: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+        """
+        Parse the complete lines after `offset` into `out` (binary reads,
+        orjson parses bytes directly) and return the file's new sync state.
+        """
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+            st = os.fstat(f.fileno())
+        
+        # A trailing partial line is a write in progress - picked up next sync
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            if line.strip():
+                out.append(orjson.loads(line))
+        return st.st_mtime_ns, offset + len(data), offset + complete
+    
+    def _insert(self, incidents: List[Dict[str, Any]]):
+        """Add parsed incidents to the indexes. Caller holds _lock."""
+        if not incidents:
+            return
+        
+        for inc in incidents:
+            self.by_id[inc.get("id")] = inc
+        
+        if not self._all:
+            # Initial load: bulk append and sort once
+            for inc in incidents:
+                self.by_run.setdefault(inc.get("run_id"), []).append(inc)
+                self._all.append(inc)
+            for run_incidents in self.by_run.values():
+                run_incidents.sort(key=_opened_ts)
+            self._all.sort(key=_opened_ts)
+            return
+        
+        for inc in incidents:
+            bisect.insort(self.by_run.setdefault(inc.get("run_id"), []), inc, key=_opened_ts)
+            bisect.insort(self._all, inc, key=_opened_ts)
+    
+    def list(self, run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Incidents newest first, optionally filtered by run_id."""
+        with self._lock:
+            self._sync()
+            incidents = self._all if run_id is None else self.by_run.get(run_id, [])
+            return incidents[::-1]
+    
+    def get(self, incident_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            return self.by_id.get(incident_id)
+    
+    def append(self, incident: Dict[str, Any]):
+        """Persist an incident; the next sync (run here) indexes it."""
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        
+        incident_file = self.base_dir / f"{incident['run_id']}.jsonl"
+        
+        with self._lock:
+            with open(incident_file, "ab") as f:
+                f.write(orjson.dumps(incident) + b"\n")
+            self._sync()
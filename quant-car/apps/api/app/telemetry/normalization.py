@@ -2,13 +2,17 @@
 Normalization utilities for telemetry gauges
 =============================================
 """
+import math
 import numpy as np
 from typing import List, Optional
 
 
 def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     """Clamp value to range."""
-    return max(min_val, min(max_val, value))
+    # Same result as max(min_val, min(max_val, value)) (NaN -> max_val)
+    # without two builtin calls
+    value = value if value < max_val else max_val
+    return value if value > min_val else min_val
 
 
 def robust_normalize(
@@ -27,9 +31,8 @@ def robust_normalize(
         # Fallback to simple normalization
         return clamp((value - default_min) / (default_max - default_min + 1e-8))
     
-    arr = np.array(history)
-    low = np.percentile(arr, p_low)
-    high = np.percentile(arr, p_high)
+    # One call partitions once for both percentiles; ndarray history is used as-is
+    low, high = np.percentile(np.asarray(history, dtype=float), [p_low, p_high])
     
     if high - low < 1e-8:
         return 0.5
@@ -49,4 +52,9 @@ def linear_scale(value: float, in_min: float, in_max: float,
 
 def sigmoid_normalize(value: float, center: float = 0.0, scale: float = 1.0) -> float:
     """Sigmoid normalization centered at 'center'."""
-    return 1 / (1 + np.exp(-(value - center) / scale))
+    # math.exp on a scalar avoids numpy ufunc dispatch; branch keeps exp() from overflowing
+    z = (value - center) / scale
+    if z >= 0:
+        return 1 / (1 + math.exp(-z))
+    e = math.exp(z)
+    return e / (1 + e)
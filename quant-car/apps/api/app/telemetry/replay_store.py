@@ -2,33 +2,192 @@
 Replay Store - JSONL persistence for telemetry frames
 ======================================================
 """
-import json
+import atexit
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import BinaryIO, Callable, List, Optional, Dict, Any
 from datetime import datetime
 
+import numpy as np
+import orjson
+
+try:
+    import simdjson  # Optional: validates + reads ts_utc without building the dict
+except ImportError:
+    simdjson = None
+
 from app.settings import settings
 
 
+def _ts_reader() -> Callable[[bytes], bytes]:
+    """
+    Return a function mapping one JSON-object line to its ts_utc bytes.
+    Raises ValueError on invalid JSON either way; simdjson just skips
+    materializing the rest of the frame. Parsers are not thread-safe,
+    so one per call.
+    """
+    if simdjson is None:
+        return lambda line: str(orjson.loads(line).get("ts_utc", "")).encode()
+    
+    parser = simdjson.Parser()
+    
+    def read_ts(line: bytes) -> bytes:
+        doc = parser.parse(line)
+        try:
+            return str(doc.get("ts_utc", "")).encode()
+        finally:
+            del doc  # The parser can't be reused while a document is alive
+    
+    return read_ts
+
+
+def _line_ts(line: Optional[bytes]) -> Optional[str]:
+    """ts_utc of one JSONL line, or None if missing/unparseable."""
+    if not line:
+        return None
+    try:
+        frame = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    return frame.get("ts_utc") if isinstance(frame, dict) else None
+
+
+# Bytes hashed at each end of the indexed region to recognise the file
+PROBE_BYTES = 4096
+
+
+def _prefix_digest(f: BinaryIO, size: int) -> bytes:
+    """Digest of the first and last PROBE_BYTES of f's first `size` bytes."""
+    h = hashlib.blake2b(digest_size=16)
+    f.seek(0)
+    h.update(f.read(min(size, PROBE_BYTES)))
+    tail = max(0, size - PROBE_BYTES)
+    f.seek(tail)
+    h.update(f.read(size - tail))
+    return h.digest()
+
+
+class FrameIndex:
+    """
+    Line offsets and timestamps for one run's frames.jsonl.
+    `ts` holds the raw ts_utc bytes, so ordering matches string comparison.
+    `inode` and `digest` identify the file the offsets were taken from, so
+    an index over a rewritten file is rebuilt rather than extended.
+    """
+    
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, ts: np.ndarray, size: int,
+                 inode: int = 0, digest: bytes = b""):
+        self.starts = starts
+        self.ends = ends
+        self.ts = ts
+        self.size = size  # Bytes of frames.jsonl covered by the index
+        self.inode = inode
+        self.digest = digest  # _prefix_digest of those bytes
+        self.is_sorted = bool(np.all(ts[1:] >= ts[:-1])) if len(ts) > 1 else True
+    
+    @classmethod
+    def empty(cls) -> "FrameIndex":
+        return cls(np.empty(0, np.int64), np.empty(0, np.int64), np.empty(0, "S1"), 0)
+    
+    def matches(self, frames_file: Path, st: os.stat_result) -> bool:
+        """True while frames.jsonl still starts with the bytes this index covers."""
+        if self.size == 0:
+            return True
+        if self.size > st.st_size or self.inode != st.st_ino:
+            return False
+        with open(frames_file, "rb") as f:
+            return _prefix_digest(f, self.size) == self.digest
+    
+    def __len__(self) -> int:
+        return len(self.starts)
+
+
+# Offset indexes kept in memory; older runs are reloaded from frames.idx on demand
+INDEX_CACHE_RUNS = 32
+
+# Runs with an open buffered writer; the least recently written is closed first
+OPEN_WRITERS = 16
+
+
 class ReplayStore:
     """
     Stores and retrieves telemetry frames for replay.
-    Uses append-only JSONL files.
+    Uses append-only JSONL files with a per-run offset index
+    (persisted next to the frames as frames.idx).
     """
     
     def __init__(self):
         self.base_dir = settings.TELEMETRY_DIR
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self._index: "OrderedDict[str, FrameIndex]" = OrderedDict()  # LRU by run_id
+        self._writers: "OrderedDict[str, BinaryIO]" = OrderedDict()
+        self._write_lock = threading.Lock()
+        # Per-run frame_count/first_ts/last_ts/size, mirrored to meta.json
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._dirty_meta: set = set()
+        atexit.register(self.close)
     
     def append_frame(self, run_id: str, frame: Dict[str, Any]):
-        """Append a frame to the run's JSONL file."""
+        """Append a frame to the run's JSONL file (buffered; see flush)."""
+        self.batch_append(run_id, [frame])
+    
+    def batch_append(self, run_id: str, frames: List[Dict[str, Any]]):
+        """Append several frames with a single buffered write."""
+        if not frames:
+            return
+        payload = b"\n".join(orjson.dumps(frame) for frame in frames) + b"\n"
+        with self._write_lock:
+            self._writer(run_id).write(payload)
+            
+            # Keep a known run's counters current instead of recounting later
+            meta = self._meta.get(run_id)
+            if meta is not None:
+                if meta["frame_count"] == 0:
+                    meta["first_ts"] = frames[0].get("ts_utc")
+                meta["frame_count"] += len(frames)
+                meta["last_ts"] = frames[-1].get("ts_utc")
+                meta["size"] += len(payload)
+                meta["mtime_ns"] = None  # Restamped once the write is flushed
+                self._dirty_meta.add(run_id)
+    
+    def flush(self, run_id: Optional[str] = None):
+        """Push buffered frames to disk for one run, or all runs."""
+        with self._write_lock:
+            if run_id is None:
+                for f in self._writers.values():
+                    f.flush()
+            elif run_id in self._writers:
+                self._writers[run_id].flush()
+    
+    def close(self, run_id: Optional[str] = None):
+        """Flush and close writers for one run, or all runs."""
+        with self._write_lock:
+            run_ids = list(self._writers) if run_id is None else [run_id]
+            for rid in run_ids:
+                f = self._writers.pop(rid, None)
+                if f is not None:
+                    f.close()
+            self._save_dirty_meta()
+    
+    def _writer(self, run_id: str) -> BinaryIO:
+        """Open (or reuse) the run's append handle. Caller holds _write_lock."""
+        f = self._writers.get(run_id)
+        if f is not None:
+            self._writers.move_to_end(run_id)
+            return f
+        
         run_dir = self.base_dir / run_id
         run_dir.mkdir(parents=True, exist_ok=True)
         
-        frames_file = run_dir / "frames.jsonl"
-        
-        with open(frames_file, "a") as f:
-            f.write(json.dumps(frame) + "\n")
+        f = open(run_dir / "frames.jsonl", "ab", buffering=65536)
+        self._writers[run_id] = f
+        while len(self._writers) > OPEN_WRITERS:
+            self._writers.popitem(last=False)[1].close()
+        return f
     
     def list_runs(self) -> List[Dict[str, Any]]:
         """List all available replay runs."""
@@ -37,27 +196,95 @@ class ReplayStore:
         if not self.base_dir.exists():
             return runs
         
-        for run_dir in self.base_dir.iterdir():
-            if run_dir.is_dir():
-                frames_file = run_dir / "frames.jsonl"
-                if frames_file.exists():
-                    # Count frames
-                    with open(frames_file) as f:
-                        frame_count = sum(1 for _ in f)
-                    
-                    # Get first/last timestamps
-                    first_ts = None
-                    last_ts = None
-                    trading_date = run_dir.name[:8] if len(run_dir.name) >= 8 else None
-                    
-                    runs.append({
-                        "run_id": run_dir.name,
-                        "trading_date": trading_date,
-                        "frame_count": frame_count
-                    })
+        self.flush()
+        
+        with self._write_lock:
+            # scandir entries carry their file type, so only frames.jsonl is stat'ed
+            with os.scandir(self.base_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    meta = self._run_meta(entry)
+                    if meta is not None:
+                        trading_date = entry.name[:8] if len(entry.name) >= 8 else None
+                        
+                        runs.append({
+                            "run_id": entry.name,
+                            "trading_date": trading_date,
+                            "frame_count": meta["frame_count"],
+                            "first_ts": meta["first_ts"],
+                            "last_ts": meta["last_ts"],
+                        })
+            self._save_dirty_meta()
         
         return sorted(runs, key=lambda x: x.get("trading_date", ""), reverse=True)
     
+    # --- Run metadata (meta.json) ---
+    
+    def _run_meta(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """
+        Counters for a run, trusted while the (size, mtime_ns) they were
+        taken at matches frames.jsonl. Otherwise (no meta.json yet, or
+        written elsewhere) count once. Caller holds _write_lock.
+        """
+        try:
+            st = os.stat(os.path.join(entry.path, "frames.jsonl"))
+        except FileNotFoundError:
+            return None
+        
+        run_id = entry.name
+        meta = self._meta.get(run_id)
+        if meta is not None and meta["mtime_ns"] is None and meta["size"] == st.st_size:
+            # Our own appends, now flushed: adopt the file's new mtime
+            meta["mtime_ns"] = st.st_mtime_ns
+            self._dirty_meta.add(run_id)
+        if meta is None:
+            meta = self._load_meta(Path(entry.path))
+        if meta is None or (meta.get("size"), meta.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+            meta = self._count_frames(Path(entry.path) / "frames.jsonl")
+            meta["mtime_ns"] = st.st_mtime_ns
+            self._dirty_meta.add(run_id)
+        
+        self._meta[run_id] = meta
+        return meta
+    
+    @staticmethod
+    def _count_frames(frames_file: Path) -> Dict[str, Any]:
+        frame_count = 0
+        first = last = None
+        with open(frames_file, "rb") as f:
+            for line in f:
+                if first is None:
+                    first = line
+                last = line
+                frame_count += 1
+            size = f.tell()
+        return {
+            "frame_count": frame_count,
+            "first_ts": _line_ts(first),
+            "last_ts": _line_ts(last),
+            "size": size,
+        }
+    
+    @staticmethod
+    def _load_meta(run_dir: Path) -> Optional[Dict[str, Any]]:
+        try:
+            return orjson.loads((run_dir / "meta.json").read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+    
+    def _save_dirty_meta(self):
+        """Persist changed run metadata. Caller holds _write_lock."""
+        for run_id in self._dirty_meta:
+            meta = self._meta.get(run_id)
+            if meta is None:
+                continue
+            try:
+                (self.base_dir / run_id / "meta.json").write_bytes(orjson.dumps(meta))
+            except OSError:
+                pass  # Read-only volume - counters stay in memory
+        self._dirty_meta.clear()
+    
     def get_frames(
         self,
         run_id: str,
@@ -71,25 +298,105 @@ class ReplayStore:
         if not frames_file.exists():
             return []
         
-        frames = []
+        self.flush(run_id)
+        index = self._get_index(run_id, frames_file)
+        if len(index) == 0:
+            return []
+        
+        # Resolve [start_ts, end_ts] to row numbers
+        if index.is_sorted:
+            lo = int(np.searchsorted(index.ts, start_ts.encode(), "left")) if start_ts else 0
+            hi = int(np.searchsorted(index.ts, end_ts.encode(), "right")) if end_ts else len(index)
+            rows = range(lo, max(lo, min(hi, lo + limit)))
+        else:
+            mask = np.ones(len(index), dtype=bool)
+            if start_ts:
+                mask &= index.ts >= start_ts.encode()
+            if end_ts:
+                mask &= index.ts <= end_ts.encode()
+            rows = np.flatnonzero(mask)[:limit]
+        
+        if len(rows) == 0:
+            return []
+        
+        starts, ends = index.starts, index.ends
+        with open(frames_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                # orjson decodes straight from memoryview slices of the mapping, so
+                # no per-line bytes copy is made (the trailing newline is whitespace)
+                return [orjson.loads(view[starts[i]:ends[i]]) for i in rows]
+    
+    # --- Offset index ---
+    
+    def _get_index(self, run_id: str, frames_file: Path) -> FrameIndex:
+        """Return an index covering the whole file, extending it if the file grew."""
+        st = frames_file.stat()
         
-        with open(frames_file) as f:
+        index = self._index.get(run_id)
+        if index is None:
+            index = self._load_index(frames_file)
+        if index is None or not index.matches(frames_file, st):
+            # Missing, corrupt, or the file was rewritten
+            index = FrameIndex.empty()
+        if index.size < st.st_size:
+            index = self._extend_index(frames_file, index, st.st_ino)
+            self._save_index(frames_file, index)
+        
+        self._index[run_id] = index
+        self._index.move_to_end(run_id)
+        while len(self._index) > INDEX_CACHE_RUNS:
+            self._index.popitem(last=False)  # Evicted runs reload from frames.idx
+        return index
+    
+    def _extend_index(self, frames_file: Path, index: FrameIndex, inode: int) -> FrameIndex:
+        """Index complete lines appended after index.size."""
+        starts, ends, ts = [], [], []
+        pos = index.size
+        read_ts = _ts_reader()
+        
+        with open(frames_file, "rb") as f:
+            f.seek(pos)
             for line in f:
-                if len(frames) >= limit:
-                    break
-                
-                try:
-                    frame = json.loads(line.strip())
-                    
-                    # Filter by timestamp if specified
-                    ts = frame.get("ts_utc", "")
-                    if start_ts and ts < start_ts:
-                        continue
-                    if end_ts and ts > end_ts:
-                        continue
-                    
-                    frames.append(frame)
-                except:
-                    pass
+                if not line.endswith(b"\n"):
+                    break  # Partial write in progress - pick it up next time
+                end = pos + len(line)
+                # Frames are always written as one JSON object per line, so
+                # blank lines and other debris are rejected without raising
+                if line.startswith(b"{"):
+                    try:
+                        ts.append(read_ts(line))
+                        starts.append(pos)
+                        ends.append(end)
+                    except ValueError as e:
+                        if settings.DEBUG:
+                            print(f"[DEBUG] Skipping corrupt frame in {frames_file} at byte {pos}: {e}")
+                pos = end
+            digest = _prefix_digest(f, pos)
         
-        return frames
+        return FrameIndex(
+            np.concatenate([index.starts, np.asarray(starts, dtype=np.int64)]),
+            np.concatenate([index.ends, np.asarray(ends, dtype=np.int64)]),
+            np.concatenate([index.ts, np.asarray(ts, dtype=bytes) if ts else index.ts[:0]]),
+            pos,
+            inode,
+            digest,
+        )
+    
+    def _load_index(self, frames_file: Path) -> Optional[FrameIndex]:
+        idx_file = frames_file.with_suffix(".idx")
+        if not idx_file.exists():
+            return None
+        try:
+            with np.load(idx_file) as data:
+                return FrameIndex(data["starts"], data["ends"], data["ts"], int(data["size"]),
+                                  int(data["inode"]), data["digest"].tobytes())
+        except Exception:
+            return None
+    
+    def _save_index(self, frames_file: Path, index: FrameIndex):
+        try:
+            with open(frames_file.with_suffix(".idx"), "wb") as f:
+                np.savez(f, starts=index.starts, ends=index.ends, ts=index.ts, size=np.int64(index.size),
+                         inode=np.uint64(index.inode), digest=np.frombuffer(index.digest, np.uint8))
+        except OSError:
+            pass  # Read-only volume - keep the in-memory index only
@@ -0,0 +1,29 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import bot
+from app.settings import settings
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(bot.router)
+    return TestClient(app)
+
+
+def test_bot_routes_refused_with_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "WORKERS", 2)
+    monkeypatch.setattr(settings, "DEBUG", False)
+    
+    response = _client().get("/bot/status")
+    assert response.status_code == 503
+    assert "WORKERS=1" in response.json()["detail"]
+
+
+def test_bot_status_served_by_single_worker(monkeypatch):
+    monkeypatch.setattr(settings, "WORKERS", 1)
+    monkeypatch.setattr(settings, "DEBUG", False)
+    
+    response = _client().get("/bot/status")
+    assert response.status_code == 200
+    assert response.json()["status"] == "stopped"
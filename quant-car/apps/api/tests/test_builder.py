@@ -0,0 +1,65 @@
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import orjson
+import pandas as pd
+import pytest
+
+from app.settings import settings
+from app.telemetry import builder
+from app.telemetry.builder import read_csv_via_parquet
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ARTIFACT_CACHE_DIR", tmp_path / "cache")
+    out = tmp_path / "outputs"
+    out.mkdir()
+    return out
+
+
+def test_parquet_copy_is_lossless_and_kept_out_of_outputs(outputs):
+    csv = outputs / "daily_weights_20240102.csv"
+    pd.DataFrame({"ticker": ["AAA", "BBB"], "weight": [0.6, 0.4], "score": [1.5, -0.2]}).to_csv(csv, index=False)
+    
+    cols = {"ticker": "category", "weight": "float64"}
+    first = read_csv_via_parquet(csv, usecols=lambda c: c in cols, dtype=cols)
+    again = read_csv_via_parquet(csv, usecols=lambda c: c in cols, dtype=cols)
+    full = read_csv_via_parquet(csv)
+    
+    assert os.listdir(outputs) == [csv.name]
+    assert len(os.listdir(settings.ARTIFACT_CACHE_DIR)) == 1
+    pd.testing.assert_frame_equal(first, again)
+    assert list(first.columns) == ["ticker", "weight"]
+    assert first["ticker"].dtype == "category"
+    assert list(full.columns) == ["ticker", "weight", "score"]
+
+
+def test_artifact_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, "_ARTIFACT_CACHE", OrderedDict())
+    paths = []
+    for day in range(builder._ARTIFACT_CACHE_SIZE + 5):
+        path = tmp_path / f"monitoring_report_{day:02d}.md"
+        path.write_text("report")
+        paths.append(path)
+        builder._load_cached(path, Path.read_text)
+    
+    assert len(builder._ARTIFACT_CACHE) == builder._ARTIFACT_CACHE_SIZE
+    assert paths[0] not in builder._ARTIFACT_CACHE
+    assert paths[-1] in builder._ARTIFACT_CACHE
+
+
+def test_payload_comes_from_its_own_build(tmp_path):
+    b = builder.TelemetryBuilder(tmp_path)
+    build = b._build
+    
+    def racing_build(trading_date):
+        # Another thread's build lands between this build and its serialization
+        result = build(trading_date)
+        build("20240103")
+        return result
+    
+    b._build = racing_build
+    payload = orjson.loads(b.build_payload("20240102"))
+    assert payload["trading_date"] == "20240102"
@@ -0,0 +1,44 @@
+import orjson
+
+from app.telemetry.incident_store import IncidentStore
+
+
+def _incident(i, run_id="20240102"):
+    return {"id": f"inc_{i}", "run_id": run_id, "opened_ts": f"2024-01-02T10:00:{i:02d}Z"}
+
+
+def test_other_workers_appends_are_visible(tmp_path):
+    # Two stores over one directory stand in for two API workers
+    a, b = IncidentStore(tmp_path), IncidentStore(tmp_path)
+    a.load()
+    b.load()
+    
+    a.append(_incident(1))
+    b.append(_incident(2, run_id="20240103"))
+    
+    for store in (a, b):
+        assert [inc["id"] for inc in store.list()] == ["inc_2", "inc_1"]
+        assert store.get("inc_1")["run_id"] == "20240102"
+        assert [inc["id"] for inc in store.list("20240103")] == ["inc_2"]
+
+
+def test_partial_lines_and_rewrites(tmp_path):
+    store = IncidentStore(tmp_path)
+    run_file = tmp_path / "20240102.jsonl"
+    
+    # A line still being written is skipped until its newline lands
+    line = orjson.dumps(_incident(1)) + b"\n"
+    run_file.write_bytes(line[:10])
+    assert store.list() == []
+    with open(run_file, "ab") as f:
+        f.write(line[10:])
+    assert [inc["id"] for inc in store.list()] == ["inc_1"]
+    
+    # Shrinking rewrite drops what the old contents held
+    run_file.write_bytes(b"")
+    assert store.list() == []
+    assert store.get("inc_1") is None
+    
+    store.append(_incident(3))
+    run_file.unlink()
+    assert store.list() == []
@@ -0,0 +1,81 @@
+import os
+
+import orjson
+import pytest
+
+from app.settings import settings
+from app.telemetry.replay_store import ReplayStore
+
+
+def _frames(n, pad=""):
+    return [{"ts_utc": f"2024-01-01T00:00:{i:02d}Z", "seq": i, "note": pad} for i in range(n)]
+
+
+def _write(path, frames):
+    path.write_bytes(b"".join(orjson.dumps(f) + b"\n" for f in frames))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TELEMETRY_DIR", tmp_path)
+    s = ReplayStore()
+    yield s
+    s.close()
+
+
+def test_append_and_read_back(store):
+    store.batch_append("run1", _frames(5))
+    store.append_frame("run1", _frames(6)[5])
+    
+    frames = store.get_frames("run1")
+    assert [f["seq"] for f in frames] == list(range(6))
+    
+    window = store.get_frames("run1", start_ts="2024-01-01T00:00:02Z", end_ts="2024-01-01T00:00:04Z")
+    assert [f["seq"] for f in window] == [2, 3, 4]
+    
+    # Appends after the index was built extend it
+    store.batch_append("run1", _frames(8)[6:])
+    assert [f["seq"] for f in store.get_frames("run1")] == list(range(8))
+
+
+def test_rewritten_file_rebuilds_index(store, tmp_path):
+    frames_file = tmp_path / "run1" / "frames.jsonl"
+    frames_file.parent.mkdir()
+    _write(frames_file, _frames(10))
+    assert len(store.get_frames("run1")) == 10
+    
+    # Larger rewrite: the saved offsets no longer line up with the file
+    _write(frames_file, _frames(20, pad="x" * 40))
+    for s in (ReplayStore(), store):
+        frames = s.get_frames("run1")
+        assert [f["seq"] for f in frames] == list(range(20))
+        assert frames[0]["note"] == "x" * 40
+
+
+def test_corrupt_index_file_is_ignored(store, tmp_path):
+    frames_file = tmp_path / "run1" / "frames.jsonl"
+    frames_file.parent.mkdir()
+    _write(frames_file, _frames(3))
+    (tmp_path / "run1" / "frames.idx").write_bytes(b"not an npz")
+    
+    assert [f["seq"] for f in store.get_frames("run1")] == [0, 1, 2]
+
+
+def test_run_meta_tracks_same_size_rewrite(store, tmp_path):
+    store.batch_append("run1", _frames(3))
+    [run] = store.list_runs()
+    assert (run["frame_count"], run["last_ts"]) == (3, "2024-01-01T00:00:02Z")
+    
+    # Same byte size, different content and mtime: counters are recounted
+    frames_file = tmp_path / "run1" / "frames.jsonl"
+    size = frames_file.stat().st_size
+    rewritten = [dict(f, ts_utc=f["ts_utc"].replace("2024", "2025")) for f in _frames(3)]
+    _write(frames_file, rewritten)
+    assert frames_file.stat().st_size == size
+    st = frames_file.stat()
+    os.utime(frames_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    
+    [run] = ReplayStore().list_runs()
+    assert run["last_ts"] == "2025-01-01T00:00:02Z"
+    [run] = store.list_runs()
+    assert run["last_ts"] == "2025-01-01T00:00:02Z"
@@ -0,0 +1,30 @@
+import asyncio
+
+from app.routes.ws import ConnectionManager
+
+
+class FakeSocket:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+        self.closed_with = None
+    
+    async def send_text(self, message):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        self.sent.append(message)
+    
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def test_broadcast_drops_and_closes_failed_sockets():
+    manager = ConnectionManager()
+    ok, broken = FakeSocket(), FakeSocket(fail=True)
+    manager.active_connections.update([ok, broken])
+    
+    asyncio.run(manager.broadcast("frame"))
+    
+    assert ok.sent == ["frame"] and ok.closed_with is None
+    assert broken.closed_with == 1011
+    assert manager.active_connections == {ok}
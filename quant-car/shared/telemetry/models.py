@@ -24,7 +24,7 @@ Direction = Literal["up", "down", "unknown"]
 
 
 class Gauge(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     value: float = Field(ge=0.0, le=1.0)
     raw: Optional[float] = None
     unit: Optional[str] = None
@@ -34,14 +34,14 @@ class Gauge(BaseModel):
 
 
 class WarningItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     code: WarningCode
     severity: Literal[1, 2, 3]
     message: Optional[str] = None
 
 
 class ProviderHealth(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     name: str
     status: Literal["up", "degraded", "down"]
     latency_ms: Optional[float] = Field(default=None, ge=0.0)
@@ -52,7 +52,7 @@ class ProviderHealth(BaseModel):
 
 
 class HazardEvent(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     id: str
     ts_utc: str
     ticker: str
@@ -68,7 +68,7 @@ class HazardEvent(BaseModel):
 
 
 class WeightChange(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     ticker: str
     weight_prev: float
     weight_new: float
@@ -77,7 +77,7 @@ class WeightChange(BaseModel):
 
 
 class PortfolioFlowNode(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     id: str
     label: str
     weight: float = Field(ge=0.0, le=1.0)
@@ -85,14 +85,14 @@ class PortfolioFlowNode(BaseModel):
 
 
 class PortfolioFlowEdge(BaseModel):
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
     from_node: str = Field(alias="from")
     to: str
     value: float = Field(ge=0.0, le=1.0)
 
 
 class PortfolioFlow(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     nodes: List[PortfolioFlowNode]
     edges: List[PortfolioFlowEdge]
     concentration_hhi: Optional[float] = Field(default=None, ge=0.0, le=1.0)
@@ -100,7 +100,7 @@ class PortfolioFlow(BaseModel):
 
 
 class ModelHealth(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     name: str
     stage: Literal["prod", "staging", "candidate", "none"]
     status: Literal["ok", "degraded", "failed"]
@@ -113,7 +113,7 @@ class ModelHealth(BaseModel):
 
 
 class ExecutionSnapshot(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     alpaca_account_equity: Optional[float] = None
     positions_count: Optional[int] = Field(default=None, ge=0)
     orders_open: Optional[int] = Field(default=None, ge=0)
@@ -124,7 +124,7 @@ class ExecutionSnapshot(BaseModel):
 
 
 class PnLStrip(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
     equity: float
     drawdown: float
     return_1d: Optional[float] = None
@@ -134,7 +134,7 @@ class PnLStrip(BaseModel):
 
 
 class TelemetryFrame(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     schema_version: Literal["1.0"]
     ts_utc: str
@@ -7,11 +7,14 @@ load_dotenv()
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def check_env_vars():
-    print("=" * 50)
-    print("1. ENVIRONMENT VARIABLES")
-    print("=" * 50)
+    lines = []
+    out = lines.append
+    out("=" * 50)
+    out("1. ENVIRONMENT VARIABLES")
+    out("=" * 50)
     vars_to_check = [
         "POLYGON_API_KEY",
         "ALPACA_API_KEY",
@@ -25,54 +28,63 @@ def check_env_vars():
         if val:
             # Mask sensitive parts
             masked = val[:8] + "..." if len(val) > 8 else val
-            print(f"  ✅ {v}: {masked}")
+            out(f"  ✅ {v}: {masked}")
         else:
-            print(f"  ❌ {v}: NOT SET")
+            out(f"  ❌ {v}: NOT SET")
+    return lines
 
 def check_alpaca():
-    print("\n" + "=" * 50)
-    print("2. ALPACA CONNECTIVITY")
-    print("=" * 50)
+    lines = []
+    out = lines.append
+    out("\n" + "=" * 50)
+    out("2. ALPACA CONNECTIVITY")
+    out("=" * 50)
     try:
         from riskfusion.execution.alpaca_connector import AlpacaConnector
-        ac = AlpacaConnector()
-        account = ac.get_account()
-        print(f"  ✅ Account Status: {account.get('status')}")
-        print(f"  ✅ Equity: ${float(account.get('equity', 0)):,.2f}")
-        print(f"  ✅ Buying Power: ${float(account.get('buying_power', 0)):,.2f}")
+        with AlpacaConnector() as ac:
+            account = ac.get_account()
+            positions = ac.get_positions()
+        out(f"  ✅ Account Status: {account.get('status')}")
+        out(f"  ✅ Equity: ${float(account.get('equity', 0)):,.2f}")
+        out(f"  ✅ Buying Power: ${float(account.get('buying_power', 0)):,.2f}")
         
         # Check positions
-        positions = ac.get_positions()
-        print(f"  ✅ Open Positions: {len(positions)}")
+        out(f"  ✅ Open Positions: {len(positions)}")
         if positions:
             for p in positions[:5]:
-                print(f"      - {p['symbol']}: {p['qty']} shares @ ${float(p['avg_entry_price']):.2f}")
+                out(f"      - {p['symbol']}: {p['qty']} shares @ ${float(p['avg_entry_price']):.2f}")
     except Exception as e:
-        print(f"  ❌ Alpaca Error: {e}")
+        out(f"  ❌ Alpaca Error: {e}")
+    return lines
 
 def check_data():
-    print("\n" + "=" * 50)
-    print("3. DATA LAYER")
-    print("=" * 50)
+    lines = []
+    out = lines.append
+    out("\n" + "=" * 50)
+    out("3. DATA LAYER")
+    out("=" * 50)
     try:
         from riskfusion.features.store import FeatureStore
         store = FeatureStore()
         
         prices = store.load_raw_prices()
-        print(f"  ✅ Prices: {len(prices)} rows, {prices['ticker'].nunique()} tickers")
+        out(f"  ✅ Prices: {len(prices)} rows, {prices['ticker'].nunique()} tickers")
         
         features = store.load_features()
-        print(f"  ✅ Features: {len(features)} rows, {len(features.columns)} columns")
+        out(f"  ✅ Features: {len(features)} rows, {len(features.columns)} columns")
         
         news = store.load_raw_news()
-        print(f"  {'✅' if len(news) > 0 else '⚠️'} News: {len(news)} events")
+        out(f"  {'✅' if len(news) > 0 else '⚠️'} News: {len(news)} events")
     except Exception as e:
-        print(f"  ❌ Data Error: {e}")
+        out(f"  ❌ Data Error: {e}")
+    return lines
 
 def check_models():
-    print("\n" + "=" * 50)
-    print("4. MODELS")
-    print("=" * 50)
+    lines = []
+    out = lines.append
+    out("\n" + "=" * 50)
+    out("4. MODELS")
+    out("=" * 50)
     try:
         from riskfusion.models.alpha_model import AlphaModel
         from riskfusion.models.vol_model import VolModel
@@ -80,20 +92,23 @@ def check_models():
         from pathlib import Path
         
         model_path = Path("models/alpha_lgbm.pkl")
-        print(f"  {'✅' if model_path.exists() else '⚠️'} Alpha Model: {'Trained' if model_path.exists() else 'Not Trained'}")
+        out(f"  {'✅' if model_path.exists() else '⚠️'} Alpha Model: {'Trained' if model_path.exists() else 'Not Trained'}")
         
         vol_path = Path("models/vol_model.pkl")
-        print(f"  {'✅' if vol_path.exists() else '⚠️'} Vol Model: {'Trained' if vol_path.exists() else 'Not Trained'}")
+        out(f"  {'✅' if vol_path.exists() else '⚠️'} Vol Model: {'Trained' if vol_path.exists() else 'Not Trained'}")
         
         event_path = Path("models/event_risk_model.pkl")
-        print(f"  {'✅' if event_path.exists() else '⚠️'} Event Risk Model: {'Trained' if event_path.exists() else 'Not Trained'}")
+        out(f"  {'✅' if event_path.exists() else '⚠️'} Event Risk Model: {'Trained' if event_path.exists() else 'Not Trained'}")
     except Exception as e:
-        print(f"  ❌ Model Error: {e}")
+        out(f"  ❌ Model Error: {e}")
+    return lines
 
 def check_outputs():
-    print("\n" + "=" * 50)
-    print("5. OUTPUTS")
-    print("=" * 50)
+    lines = []
+    out = lines.append
+    out("\n" + "=" * 50)
+    out("5. OUTPUTS")
+    out("=" * 50)
     from pathlib import Path
     import glob
     
@@ -101,19 +116,23 @@ def check_outputs():
     weights_files = list(output_dir.glob("daily_weights_*.csv"))
     reports = list(output_dir.glob("monitoring_report_*.md"))
     
-    print(f"  ✅ Weight Files: {len(weights_files)}")
+    out(f"  ✅ Weight Files: {len(weights_files)}")
     for f in weights_files[-3:]:
-        print(f"      - {f.name}")
+        out(f"      - {f.name}")
     
-    print(f"  ✅ Reports: {len(reports)}")
+    out(f"  ✅ Reports: {len(reports)}")
+    return lines
 
 def main():
     print("\n🔬 RISKFUSION ALPHA - FULL SYSTEM DIAGNOSTIC\n")
-    check_env_vars()
-    check_alpaca()
-    check_data()
-    check_models()
-    check_outputs()
+    checks = [check_env_vars, check_alpaca, check_data, check_models, check_outputs]
+    # The checks are independent network/disk waits: run them together and
+    # print each section's buffered lines in the usual order
+    with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+        futures = [pool.submit(check) for check in checks]
+        for future in futures:
+            for line in future.result():
+                print(line)
     print("\n" + "=" * 50)
     print("DIAGNOSTIC COMPLETE")
     print("=" * 50)
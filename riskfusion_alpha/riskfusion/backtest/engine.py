@@ -18,21 +18,17 @@ class Backtester:
     def run(self):
         logger.info(f"Running backtest from {self.start} to {self.end}")
         
-        # Load Features
-        features = self.store.load_features()
+        # Load Features - only the backtest window is read from the parquet
+        features = self.store.load_features(start=self.start, end=self.end)
         if features.empty:
             logger.error("No features.")
             return
 
-        # Load Prices (for returns calculation)
-        prices = self.store.load_raw_prices()
-        prices = prices.pivot(index='date', columns='ticker', values='close')
-        
         # Filter Dates
         features = features[(features['date'] >= self.start) & (features['date'] <= self.end)]
         
-        # Loop by Date
-        dates = sorted(features['date'].unique())
+        # Loop by Date - row positions per day from one groupby pass
+        day_rows = sorted(features.groupby('date', sort=False).indices.items())
         
         portfolio_history = []
         equity = 1.0
@@ -48,12 +44,26 @@ class Backtester:
         
         prev_weights = pd.Series()
         
-        for d in dates:
-            day_feats = features[features['date'] == d].set_index('ticker')
+        # Predict Alpha for every day in one model call - the GBM scores rows
+        # independently, so this matches per-day calls without D round-trips
+        try:
+            all_scores = np.asarray(self.alpha_model.predict(features))
+        except Exception as e:
+            logger.warning(f"Batch prediction failed ({e}); predicting day by day")
+            all_scores = None
+        
+        # Risk data stub: Simple Vol Forecast = Last Vol
+        vol_all = features['realized_vol_20d'].to_numpy() if 'realized_vol_20d' in features.columns else None
+        
+        for d, rows in day_rows:
+            day_feats = features.iloc[rows].set_index('ticker')
             
             # Predict Alpha
             try:
-                scores = self.alpha_model.predict(day_feats)
+                if all_scores is not None:
+                    scores = all_scores[rows]
+                else:
+                    scores = self.alpha_model.predict(day_feats)
                 # predict returns array, map to index
                 score_series = pd.Series(scores, index=day_feats.index)
             except Exception as e:
@@ -61,10 +71,9 @@ class Backtester:
                 continue
                 
             # Construct Weights
-            # Risk data stub
             risk_data = pd.DataFrame(index=day_feats.index)
-            if 'realized_vol_20d' in day_feats.columns:
-                risk_data['vol_hat'] = day_feats['realized_vol_20d'] # Simple Vol Forecast = Last Vol
+            if vol_all is not None:
+                risk_data['vol_hat'] = vol_all[rows]
             
             weights_df = self.optimizer.construct_weights(score_series, risk_data)
             
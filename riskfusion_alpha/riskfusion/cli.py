@@ -1,7 +1,6 @@
 import argparse
 import sys
 from riskfusion.utils.logging import setup_logging
-from riskfusion.config import get_config
 
 def main():
     parser = argparse.ArgumentParser(description="RiskFusion Alpha CLI")
@@ -83,188 +82,225 @@ def main():
     
     setup_logging()
     
-    if args.command == "ingest":
-        from riskfusion.ingest.ingest_prices import ingest_prices
-        from riskfusion.ingest.ingest_events import ingest_all_events
-        print("Running Ingestion...")
-        ingest_prices(args.start, args.end)
-        ingest_all_events(args.start, args.end)
-        print("Ingestion Complete.")
-        
-    elif args.command == "features":
-        from riskfusion.features.build_features import build_features
-        print("Building Features...")
-        build_features()
-        
-    elif args.command == "train":
-        from riskfusion.models.train import train_models
-        print("Training Models...")
-        train_models()
-
-    elif args.command == "backtest":
-        from riskfusion.backtest.engine import Backtester
-        print("Running Backtest...")
-        bt = Backtester(args.start, args.end)
-        res = bt.run()
-        print("Backtest Complete.")
-        if res is not None:
-             print(res.tail())
-             res.to_csv("data/outputs/backtest_results.csv")
-        
-    elif args.command == "run_daily":
-        from riskfusion.daily_runner import run_daily_pipeline
-        print("Daily runner starting...")
-        run_daily_pipeline(args.date if hasattr(args, 'date') else None)
-
-    elif args.command == "audit_status":
-        import pandas as pd
-        from pathlib import Path
-        config = get_config()
-        out_path = Path(config.params['paths']['outputs'])
-        
-        date_str = args.date
-        if not date_str:
-            print("Please provide --date")
-            return
-            
-        report = out_path / f"monitoring_report_{date_str}.md"
-        if report.exists():
-            print(f"--- Status for {date_str} ---")
-            print(report.read_text(encoding='utf-8'))
-        else:
-            print(f"No report found for {date_str}")
-
-    elif args.command == "snapshot":
-        from riskfusion.research.snapshot import SnapshotManager
-        from riskfusion.features.store import FeatureStore
-        
-        mgr = SnapshotManager()
-        
-        if args.snap_cmd == "create":
-            store = FeatureStore()
-            df = store.load_features()
-            if df.empty:
-                print("No features found to snapshot.")
-                return
-            sid = mgr.create_snapshot(df, args.desc)
-            print(f"Snapshot created: {sid}")
-            
-        elif args.snap_cmd == "list":
-            snaps = mgr.list_snapshots()
-            for s in snaps:
-                print(f"{s['id']} | {s['created_at']} | {s['description']}")
-                
-        elif args.snap_cmd == "show":
-            meta = mgr.get_metadata(args.id)
-            import json
-            print(json.dumps(meta, indent=2))
-
-    elif args.command == "walkforward":
-        from riskfusion.research.walkforward import WalkForwardRunner
-        from riskfusion.features.store import FeatureStore
+    handler = COMMANDS.get(args.command)
+    if handler is not None:
+        handler(args)
+
+
+# --- Command handlers ---
+# Each handler imports its own dependencies, so one invocation only pays
+# for the modules its command needs.
+
+def _cmd_ingest(args):
+    from riskfusion.ingest.ingest_prices import ingest_prices
+    from riskfusion.ingest.ingest_events import ingest_all_events
+    print("Running Ingestion...")
+    ingest_prices(args.start, args.end)
+    ingest_all_events(args.start, args.end)
+    print("Ingestion Complete.")
+
+
+def _cmd_features(args):
+    from riskfusion.features.build_features import build_features
+    print("Building Features...")
+    build_features()
+
+
+def _cmd_train(args):
+    from riskfusion.models.train import train_models
+    print("Training Models...")
+    train_models()
+
+
+def _cmd_backtest(args):
+    from riskfusion.backtest.engine import Backtester
+    print("Running Backtest...")
+    bt = Backtester(args.start, args.end)
+    res = bt.run()
+    print("Backtest Complete.")
+    if res is not None:
+         print(res.tail())
+         res.to_csv("data/outputs/backtest_results.csv")
+
+
+def _cmd_run_daily(args):
+    from riskfusion.daily_runner import run_daily_pipeline
+    print("Daily runner starting...")
+    run_daily_pipeline(args.date if hasattr(args, 'date') else None)
+
+
+def _cmd_audit_status(args):
+    from pathlib import Path
+    from riskfusion.config import get_config
+    config = get_config()
+    out_path = Path(config.params['paths']['outputs'])
+    
+    date_str = args.date
+    if not date_str:
+        print("Please provide --date")
+        return
         
+    report = out_path / f"monitoring_report_{date_str}.md"
+    if report.exists():
+        print(f"--- Status for {date_str} ---")
+        print(report.read_text(encoding='utf-8'))
+    else:
+        print(f"No report found for {date_str}")
+
+
+def _cmd_snapshot(args):
+    from riskfusion.research.snapshot import SnapshotManager
+    from riskfusion.features.store import FeatureStore
+    
+    mgr = SnapshotManager()
+    
+    if args.snap_cmd == "create":
         store = FeatureStore()
         df = store.load_features()
         if df.empty:
-            print("No features.")
+            print("No features found to snapshot.")
             return
+        sid = mgr.create_snapshot(df, args.desc)
+        print(f"Snapshot created: {sid}")
+        
+    elif args.snap_cmd == "list":
+        snaps = mgr.list_snapshots()
+        for s in snaps:
+            print(f"{s['id']} | {s['created_at']} | {s['description']}")
             
-        runner = WalkForwardRunner(df, initial_train_days=args.start_days, test_size_days=args.test_days)
-        print("Starting Walk-Forward...")
-        res = runner.run()
-        print(res)
+    elif args.snap_cmd == "show":
+        meta = mgr.get_metadata(args.id)
+        import json
+        print(json.dumps(meta, indent=2))
 
 
-    elif args.command == "registry":
-        from riskfusion.registry.registry import ModelRegistry
-        from riskfusion.research.gates import QualityGates
-        
-        reg = ModelRegistry()
+def _cmd_walkforward(args):
+    from riskfusion.research.walkforward import WalkForwardRunner
+    from riskfusion.features.store import FeatureStore
+    
+    store = FeatureStore()
+    df = store.load_features()
+    if df.empty:
+        print("No features.")
+        return
         
-        if args.reg_cmd == "list":
-            models = reg.list_models(args.stage)
-            print(f"Models in {args.stage}:")
-            for m in models:
-                print(f" - {m}")
-                
-        elif args.reg_cmd == "promote":
-            # Identify current stage? Simplified: promote works from candidates->staging or staging->prod
-            # But here we just say from everything to Target.
-            # Let's search where it is
-            src_stage = None
+    runner = WalkForwardRunner(df, initial_train_days=args.start_days, test_size_days=args.test_days)
+    print("Starting Walk-Forward...")
+    res = runner.run()
+    print(res)
+
+
+def _cmd_registry(args):
+    from riskfusion.registry.registry import ModelRegistry
+    from riskfusion.research.gates import QualityGates
+    
+    reg = ModelRegistry()
+    
+    if args.reg_cmd == "list":
+        models = reg.list_models(args.stage)
+        print(f"Models in {args.stage}:")
+        for m in models:
+            print(f" - {m}")
+            
+    elif args.reg_cmd == "promote":
+        # Identify current stage? Simplified: promote works from candidates->staging or staging->prod
+        # But here we just say from everything to Target.
+        # Let's search where it is
+        src_stage = None
+        if args.to == "staging":
+            src_stage = "candidates"
+        elif args.to == "prod":
+            src_stage = "staging"
+            
+        # Load Metrics
+        import json
+        # We need to know where the model is. reg.root / src_stage / args.id
+        model_dir = reg.root / src_stage / args.id / "metrics.json"
+        if not model_dir.exists():
+            print("Error: No metrics.json found for model. Cannot verify gates.")
+            return
+            
+        with open(model_dir, "r") as f:
+            metrics = json.load(f)
+            
+        try:
             if args.to == "staging":
-                src_stage = "candidates"
+                QualityGates.check_candidate_gates(metrics)
+                print("Candidate Gates Passed.")
             elif args.to == "prod":
-                src_stage = "staging"
-                
-            # Load Metrics
-            import json
-            from pathlib import Path
-            # We need to know where the model is. reg.root / src_stage / args.id
-            model_dir = reg.root / src_stage / args.id / "metrics.json"
-            if not model_dir.exists():
-                print("Error: No metrics.json found for model. Cannot verify gates.")
-                return
-                
-            with open(model_dir, "r") as f:
-                metrics = json.load(f)
-                
-            try:
-                if args.to == "staging":
-                    QualityGates.check_candidate_gates(metrics)
-                    print("Candidate Gates Passed.")
-                elif args.to == "prod":
-                    QualityGates.check_production_gates(metrics)
-                    print("Production Gates Passed.")
-            except Exception as e:
-                print(f"GATE MISTAKE: Promotion blocked. {e}")
-                return
-
-            print(f"Promoting {args.id} from {src_stage} to {args.to}...")
-            reg.promote(args.id, src_stage, args.to)
-
-    elif args.command == "validate_research":
-        from riskfusion.research.validation_suite import ValidationSuite
-        from riskfusion.features.store import FeatureStore
-        
-        store = FeatureStore()
-        df = store.load_features()
-        if df.empty:
-            print("No features.")
+                QualityGates.check_production_gates(metrics)
+                print("Production Gates Passed.")
+        except Exception as e:
+            print(f"GATE MISTAKE: Promotion blocked. {e}")
             return
-            
-        print("Running Validation Suite...")
-        res = ValidationSuite.permutation_test(df, n_permutes=args.n_permutes)
-        print(res)
 
-    elif args.command == "report_paper":
-        from riskfusion.reporting.paper import PaperReportGenerator
-        
-        # Mock results loading (integration would load real backtest csv)
-        import pandas as pd
-        import numpy as np
-        dates = pd.date_range("2020-01-01", periods=252)
-        df_res = pd.DataFrame({
-            'returns': np.random.normal(0, 0.01, 252)
-        }, index=dates)
+        print(f"Promoting {args.id} from {src_stage} to {args.to}...")
+        reg.promote(args.id, src_stage, args.to)
+
+
+def _cmd_validate_research(args):
+    from riskfusion.research.validation_suite import ValidationSuite
+    from riskfusion.features.store import FeatureStore
+    
+    store = FeatureStore()
+    df = store.load_features()
+    if df.empty:
+        print("No features.")
+        return
         
-        gen = PaperReportGenerator(args.run_id, args.snapshot_id)
-        path = gen.generate(df_res)
-        print(f"Report saved to: {path}")
-
-    elif args.command == "hpo":
-        from riskfusion.research.hpo import run_hpo
-        best_params = run_hpo(n_trials=args.n_trials)
-        print("Best Hyperparameters found:")
-        print(best_params)
-
-    elif args.command == "ablation":
-        from riskfusion.research.ablation import run_ablation
-        print(f"Running Ablation Study: steps={args.steps}, {args.start} to {args.end}")
-        result = run_ablation(args.start, args.end, args.steps)
-        print("\nAblation Results:")
-        print(result.to_string(index=False))
-        print("\nReport saved to data/outputs/")
+    print("Running Validation Suite...")
+    res = ValidationSuite.permutation_test(df, n_permutes=args.n_permutes)
+    print(res)
+
+
+def _cmd_report_paper(args):
+    from riskfusion.reporting.paper import PaperReportGenerator
+    
+    # Mock results loading (integration would load real backtest csv)
+    import pandas as pd
+    import numpy as np
+    dates = pd.date_range("2020-01-01", periods=252)
+    df_res = pd.DataFrame({
+        'returns': np.random.normal(0, 0.01, 252)
+    }, index=dates)
+    
+    gen = PaperReportGenerator(args.run_id, args.snapshot_id)
+    path = gen.generate(df_res)
+    print(f"Report saved to: {path}")
+
+
+def _cmd_hpo(args):
+    from riskfusion.research.hpo import run_hpo
+    best_params = run_hpo(n_trials=args.n_trials)
+    print("Best Hyperparameters found:")
+    print(best_params)
+
+
+def _cmd_ablation(args):
+    from riskfusion.research.ablation import run_ablation
+    print(f"Running Ablation Study: steps={args.steps}, {args.start} to {args.end}")
+    result = run_ablation(args.start, args.end, args.steps)
+    print("\nAblation Results:")
+    print(result.to_string(index=False))
+    print("\nReport saved to data/outputs/")
+
+
+COMMANDS = {
+    "ingest": _cmd_ingest,
+    "features": _cmd_features,
+    "train": _cmd_train,
+    "backtest": _cmd_backtest,
+    "run_daily": _cmd_run_daily,
+    "audit_status": _cmd_audit_status,
+    "snapshot": _cmd_snapshot,
+    "walkforward": _cmd_walkforward,
+    "registry": _cmd_registry,
+    "validate_research": _cmd_validate_research,
+    "report_paper": _cmd_report_paper,
+    "hpo": _cmd_hpo,
+    "ablation": _cmd_ablation,
+}
+
 
 if __name__ == "__main__":
     main()
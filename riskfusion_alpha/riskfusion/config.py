@@ -1,7 +1,24 @@
+import copy
 import os
+import threading
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; keyed on mtime so edits are picked up. Callers must copy."""
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
 
 class Config:
     def __init__(self, config_path: str = None):
@@ -13,13 +30,15 @@ class Config:
         self.config_path = Path(config_path)
         self.params = self._load_config()
         self._setup_paths()
+        self._flat = self._flatten(self.params)
 
     def _load_config(self) -> Dict[str, Any]:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found at {self.config_path}")
         
-        with open(self.config_path, "r") as f:
-            config = yaml.safe_load(f)
+        # Deep copy: the cached parse is shared and Config edits its params
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        config = copy.deepcopy(_parse_yaml(str(self.config_path), mtime_ns))
         
         # Override with env vars if needed
         config["price_provider"] = os.environ.get("PRICE_PROVIDER", "yfinance")
@@ -35,25 +54,41 @@ class Config:
             self.params["paths"][key] = str(abs_path)
             os.makedirs(abs_path, exist_ok=True)
 
+    @staticmethod
+    def _flatten(params: Dict[str, Any]) -> Mapping[str, Any]:
+        """Index every dotted key path ("paths.outputs", "alpha", ...) once."""
+        flat: Dict[str, Any] = {}
+        stack = [("", params)]
+        while stack:
+            prefix, node = stack.pop()
+            for k, val in node.items():
+                key = f"{prefix}{k}"
+                if val is None:
+                    continue
+                flat[key] = val
+                if isinstance(val, dict):
+                    stack.append((f"{key}.", val))
+        return MappingProxyType(flat)
+
     def get(self, key: str, default: Any = None) -> Any:
-        keys = key.split(".")
-        val = self.params
-        for k in keys:
-            if isinstance(val, dict):
-                val = val.get(k)
-            else:
-                return default
-        return val if val is not None else default
+        # Snapshot of the loaded config; edits to self.params after load
+        # are not reflected here
+        return self._flat.get(key, default)
 
     @property
     def universe(self):
         return self.params.get("universe", {}).get("tickers", [])
 
-# Global instance
-_config_instance = None
+# One instance per config path, built at most once even under
+# concurrent first use
+_config_instances: Dict[Any, Config] = {}
+_config_lock = threading.Lock()
 
 def get_config(path=None):
-    global _config_instance
-    if _config_instance is None:
-        _config_instance = Config(path)
-    return _config_instance
+    config = _config_instances.get(path)
+    if config is None:
+        with _config_lock:
+            config = _config_instances.get(path)
+            if config is None:
+                config = _config_instances[path] = Config(path)
+    return config
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import uuid
 import os
@@ -12,6 +13,7 @@ from riskfusion.features.build_features import build_features
 from riskfusion.features.store import FeatureStore
 from riskfusion.models.alpha_model import AlphaModel
 from riskfusion.models.vol_model import VolModel
+from riskfusion.models.event_risk import EventRiskModel
 from riskfusion.portfolio.construction import PortfolioOptimizer
 from riskfusion.utils.logging import get_logger, setup_logging
 from riskfusion.utils.hashing import save_parquet
@@ -42,9 +44,12 @@ def run_daily_pipeline(date_str: str = None):
     db = RiskFusionDB()
     db.log_run(run_id, date_str, "STARTED", os.environ.get("EXECUTION_MODE", "SIMULATION"), {})
     
+    # Parsed once; also bound for the fallback path if an early step fails
+    target_date = pd.Timestamp(date_str)
+    
     try:
         # 1. Ingest
-        start_fetch = (pd.to_datetime(date_str) - timedelta(days=5)).strftime("%Y-%m-%d")
+        start_fetch = (target_date - timedelta(days=5)).strftime("%Y-%m-%d")
         logger.info("Step 1: Ingesting...")
         ingest_prices(start_fetch, date_str)
         ingest_all_events(start_fetch, date_str)
@@ -57,12 +62,9 @@ def run_daily_pipeline(date_str: str = None):
         latest_features = store.load_features()
         
         # VALIDATE FEATURES
-        # Identify model features from AlphaModel (instantiate to get list)
-        am_temp = AlphaModel()
-        DataValidator.validate_features(latest_features, am_temp.features)
+        DataValidator.validate_features(latest_features, AlphaModel.features)
         
         # 3. Model & Drift
-        target_date = pd.to_datetime(date_str)
         day_feats = latest_features[latest_features['date'] == target_date]
         
         if day_feats.empty:
@@ -72,10 +74,17 @@ def run_daily_pipeline(date_str: str = None):
 
         day_feats = day_feats.set_index('ticker')
 
-        # DRIFT CHECK (Compare to random sample of past)
-        # Simple sample: last 30 days excluding today
-        past_df = latest_features[latest_features['date'] < target_date].sample(frac=0.1)
-        drift_metrics = check_feature_drift(past_df, day_feats.reset_index(), am_temp.features)
+        # DRIFT CHECK (Compare to recent past)
+        # Baseline: last 30 days excluding today, only the checked columns
+        cutoff = target_date - pd.Timedelta(days=30)
+        in_window = (latest_features['date'] >= cutoff) & (latest_features['date'] < target_date)
+        drift_cols = [f for f in AlphaModel.features if f in latest_features.columns]
+        past_df = latest_features.loc[in_window, drift_cols]
+        if past_df.empty:
+            logger.warning("No drift baseline in the last 30 days; skipping drift check.")
+            drift_metrics = {}
+        else:
+            drift_metrics = check_feature_drift(past_df, day_feats.reset_index(), AlphaModel.features)
         
         # 4. Predict
         alpha_model = AlphaModel()
@@ -97,11 +106,9 @@ def run_daily_pipeline(date_str: str = None):
         
         # --- EVENT RISK UPDATE (Impact ML) ---
         # Predict High Impact Prob using EventRiskModel
-        from riskfusion.models.event_risk import EventRiskModel
-        
         # Reuse existing 'store' from line 49
         # Get LAST available news (today's)
-        news_df = store.load_raw_news()
+        news_df = store.load_raw_news(since=target_date, until=target_date + pd.Timedelta(days=1))
         if not news_df.empty:
             # Filter for recent news (today/yesterday) that impacts tomorrow's trade
             # In live, we run at night for tomorrow open.
@@ -109,10 +116,14 @@ def run_daily_pipeline(date_str: str = None):
             if not today_news.empty:
                 logger.info(f"Predicting Event Risk for {len(today_news)} headlines...")
                 ev_model = EventRiskModel()
-                # If model not trained, this returns zeros.
+                # If model not trained, use zeros without touching the pipeline.
                 # In Grand Run, maybe we should train on historical data first? 
                 # For now, we assume pre-trained or it will return safe 0s.
-                probs = ev_model.predict(today_news)
+                if ev_model.model_path.exists():
+                    probs = ev_model.predict(today_news)
+                else:
+                    logger.warning("EventRiskModel not trained; using zero event risk.")
+                    probs = np.zeros(len(today_news))
                 today_news['event_risk'] = probs
                 
                 # Aggregate max risk per ticker
@@ -140,14 +151,14 @@ def run_daily_pipeline(date_str: str = None):
         if mode in ("LIVE", "PAPER"):
             logger.warning(f">>> {mode} EXECUTION ENABLED <<<")
             from riskfusion.execution.oms import OMS
-            oms = OMS()
             # DEBUG: Print weights stats
             logger.info(f"DEBUG: weights shape = {weights.shape}")
             logger.info(f"DEBUG: weights dtypes = {weights.dtypes.to_dict()}")
             logger.info(f"DEBUG: weights NaNs = {weights['weight'].isna().sum()}")
             logger.info(f"DEBUG: weights sample:\\n{weights.head(10)}")
-            # Execute
-            result = oms.execute_rebalance(weights)
+            # Execute (the OMS session is closed once the orders are out)
+            with OMS() as oms:
+                result = oms.execute_rebalance(weights)
             logger.info(f"Execution Result: {result}")
             
             # Log Trades to DB
@@ -180,7 +191,7 @@ def run_daily_pipeline(date_str: str = None):
         if os.getenv("ALLOW_FALLBACK_WEIGHTS") == "1":
             logger.warning("Attempting fallback to yesterday's weights...")
             # Look for yesterday's file
-            yest = (pd.to_datetime(target_date) - timedelta(days=1)).strftime('%Y%m%d')
+            yest = (target_date - timedelta(days=1)).strftime('%Y%m%d')
             yest_file = Path(config.params['paths']['outputs']) / f"daily_weights_{yest}.csv"
             if yest_file.exists():
                 fallback_file = Path(config.params['paths']['outputs']) / f"daily_weights_{target_date.strftime('%Y%m%d')}_FALLBACK.csv"
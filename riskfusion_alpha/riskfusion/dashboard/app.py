@@ -12,6 +12,27 @@ from riskfusion.config import get_config
 
 st.set_page_config(page_title="RiskFusion Alpha", layout="wide")
 
+@st.cache_data(show_spinner=False)
+def load_sheet(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Parse an output sheet once per file version (mtime is the cache key)."""
+    return pd.read_parquet(path) if path.endswith(".parquet") else pd.read_csv(path)
+
+def find_sheet(stem: str):
+    """
+    The newer of an output sheet's parquet and CSV copies (parquet on a tie),
+    so a stale parquet never shadows a regenerated CSV.
+    """
+    newest = None
+    for suffix in (".parquet", ".csv"):
+        path = output_path / f"{stem}{suffix}"
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        if newest is None or mtime_ns > newest[0]:
+            newest = (mtime_ns, path)
+    return None if newest is None else newest[1]
+
 st.title("⚡ RiskFusion Alpha Dashboard")
 
 config = get_config()
@@ -23,11 +44,10 @@ selected_date = st.sidebar.date_input("Select Date")
 
 # Convert to YYYYMMDD
 date_str = selected_date.strftime("%Y%m%d")
-risk_file = output_path / f"daily_risk_sheet_{date_str}.csv"
-weights_file = output_path / f"daily_weights_{date_str}.csv"
+risk_file = find_sheet(f"daily_risk_sheet_{date_str}")
 
-if risk_file.exists():
-    df = pd.read_csv(risk_file)
+if risk_file is not None:
+    df = load_sheet(str(risk_file), risk_file.stat().st_mtime_ns)
     st.success(f"Data found for {selected_date}")
     
     # Top Stats
@@ -64,10 +84,10 @@ else:
     st.warning(f"No data found for {selected_date}. Please run the daily pipeline first.")
     
     # Show available dates
-    files = sorted(list(output_path.glob("daily_risk_sheet_*.csv")))
+    files = list(output_path.glob("daily_risk_sheet_*.csv")) + list(output_path.glob("daily_risk_sheet_*.parquet"))
     if files:
         st.info("Available dates:")
-        dates = [f.name.split('_')[-1].replace('.csv','') for f in files]
+        dates = sorted({f.stem.split('_')[-1] for f in files})
         st.write(dates)
 
 # Backtest Section
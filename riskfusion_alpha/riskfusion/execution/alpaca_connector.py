@@ -1,11 +1,15 @@
 import os
 import requests
 import json
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Optional
 from riskfusion.utils.logging import get_logger
 
 logger = get_logger("alpaca_connector")
 
+# Keep-alive connections held per host; sized for the OMS order fan-out
+HTTP_POOL_SIZE = 32
+
 class AlpacaConnector:
     def __init__(self):
         self.api_key = os.environ.get("ALPACA_API_KEY")
@@ -19,16 +23,33 @@ class AlpacaConnector:
             "APCA-API-KEY-ID": self.api_key,
             "APCA-API-SECRET-KEY": self.secret_key
         }
+        
+        # One session for all calls: TCP/TLS connections are reused, and the
+        # pool is safe to share between the OMS submission threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        """Release the pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def get_account(self) -> Dict:
         """Get account details."""
-        resp = requests.get(f"{self.base_url}/v2/account", headers=self.headers)
+        resp = self.session.get(f"{self.base_url}/v2/account", headers=self.headers)
         resp.raise_for_status()
         return resp.json()
 
     def get_positions(self) -> List[Dict]:
         """Get open positions."""
-        resp = requests.get(f"{self.base_url}/v2/positions", headers=self.headers)
+        resp = self.session.get(f"{self.base_url}/v2/positions", headers=self.headers)
         resp.raise_for_status()
         return resp.json()
 
@@ -54,7 +75,7 @@ class AlpacaConnector:
             raise ValueError("Must specify either qty or notional")
         
         logger.info(f"Submitting Order: {side} {notional or qty} {symbol}")
-        resp = requests.post(f"{self.base_url}/v2/orders", headers=self.headers, json=payload)
+        resp = self.session.post(f"{self.base_url}/v2/orders", headers=self.headers, json=payload)
         
         if resp.status_code != 200:
             logger.error(f"Order failed: {resp.text}")
@@ -65,14 +86,14 @@ class AlpacaConnector:
     def close_all_positions(self):
         """Liquidate all positions."""
         logger.warning("Closing ALL positions.")
-        resp = requests.delete(f"{self.base_url}/v2/positions", headers=self.headers)
+        resp = self.session.delete(f"{self.base_url}/v2/positions", headers=self.headers)
         resp.raise_for_status()
         return resp.json()
 
     def close_position(self, symbol: str) -> Dict:
         """Close a single position completely."""
         logger.info(f"Closing position: {symbol}")
-        resp = requests.delete(f"{self.base_url}/v2/positions/{symbol}", headers=self.headers)
+        resp = self.session.delete(f"{self.base_url}/v2/positions/{symbol}", headers=self.headers)
         if resp.status_code != 200:
             logger.error(f"Close position failed: {resp.text}")
             resp.raise_for_status()
@@ -81,12 +102,12 @@ class AlpacaConnector:
     def cancel_all_orders(self) -> List[Dict]:
         """Cancel all open orders."""
         logger.warning("Cancelling ALL open orders.")
-        resp = requests.delete(f"{self.base_url}/v2/orders", headers=self.headers)
+        resp = self.session.delete(f"{self.base_url}/v2/orders", headers=self.headers)
         resp.raise_for_status()
         return resp.json()
 
     def get_orders(self, status: str = "open") -> List[Dict]:
         """Get orders by status (open, closed, all)."""
-        resp = requests.get(f"{self.base_url}/v2/orders?status={status}", headers=self.headers)
+        resp = self.session.get(f"{self.base_url}/v2/orders?status={status}", headers=self.headers)
         resp.raise_for_status()
         return resp.json()
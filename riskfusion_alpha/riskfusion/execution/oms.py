@@ -1,4 +1,7 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
+import numpy as np
 import pandas as pd
 from riskfusion.utils.logging import get_logger
 from riskfusion.execution.alpaca_connector import AlpacaConnector
@@ -16,52 +19,75 @@ class OMS:
     MIN_ORDER_NOTIONAL = 1.0
     # Delta threshold (%) - skip rebalancing if change is less than this
     REBALANCE_THRESHOLD = 0.005  # 0.5%
+    # Cancellations are asynchronous (pending_cancel orders can still fill):
+    # poll open orders this often, for at most this long, before planning
+    CANCEL_POLL_SECONDS = 0.2
+    CANCEL_TIMEOUT_SECONDS = 5.0
+    # Concurrent order submissions (bounded by the connector's HTTP pool)
+    MAX_ORDER_WORKERS = 16
     
     def __init__(self):
         self.alpaca = AlpacaConnector()
     
-    def _get_current_positions_map(self) -> Dict[str, float]:
+    def close(self):
+        self.alpaca.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _get_current_positions_map(self) -> pd.Series:
         """
-        Fetch current positions and return as {ticker: market_value} dict.
+        Fetch current positions and return market_value indexed by ticker.
         """
-        positions = self.alpaca.get_positions()
-        position_map = {}
-        for pos in positions:
-            ticker = pos.get('symbol')
-            market_value = float(pos.get('market_value', 0))
-            position_map[ticker] = market_value
-        return position_map
+        positions = pd.DataFrame(self.alpaca.get_positions(), columns=['symbol', 'market_value'])
+        market_value = positions['market_value'].fillna(0).astype(float)
+        return pd.Series(market_value.to_numpy(), index=positions['symbol'].to_numpy(), dtype=float)
+    
+    def _cancel_open_orders(self):
+        """
+        Cancel pending orders to free up shares, then wait until none are
+        left open so the positions fetched afterwards are final.
+        """
+        try:
+            pending = self.alpaca.get_orders(status="open")
+            if not pending:
+                return
+            logger.info(f"Cancelling {len(pending)} pending orders...")
+            self.alpaca.cancel_all_orders()
+            
+            deadline = time.monotonic() + self.CANCEL_TIMEOUT_SECONDS
+            while self.alpaca.get_orders(status="open"):
+                if time.monotonic() >= deadline:
+                    logger.warning("Orders still open after cancelling; positions may change")
+                    return
+                time.sleep(self.CANCEL_POLL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Could not cancel pending orders: {e}")
         
     def execute_rebalance(self, target_weights: pd.DataFrame, capital: float = None):
         """
         Execute rebalance based on target weights.
         Compares current positions vs target and submits BUY/SELL orders.
         """
-        import numpy as np
-        
         logger.info("Starting Execution Cycle...")
         
-        # 0. Cancel any pending orders to free up shares
-        try:
-            pending = self.alpaca.get_orders(status="open")
-            if pending:
-                logger.info(f"Cancelling {len(pending)} pending orders...")
-                self.alpaca.cancel_all_orders()
-                # Brief pause to let cancellations process
-                import time
-                time.sleep(1)
-        except Exception as e:
-            logger.warning(f"Could not cancel pending orders: {e}")
+        # 0. Cancel any pending orders and wait for the cancels to land
+        self._cancel_open_orders()
+        
+        # 1-2. Account and positions are independent GETs; overlap them
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            account_future = pool.submit(self.alpaca.get_account)
+            positions_future = pool.submit(self._get_current_positions_map)
+            account = account_future.result()
+            current_positions = positions_future.result()
         
-        # 1. Get Capital
-        account = self.alpaca.get_account()
         if capital is None:
             capital = float(account['equity'])
             
         logger.info(f"Account Equity: ${capital:.2f}")
-        
-        # 2. Fetch current positions
-        current_positions = self._get_current_positions_map()
         logger.info(f"Current positions: {len(current_positions)} tickers")
         
         # 3. Aggregate weights by ticker (in case of duplicates)
@@ -71,68 +97,79 @@ class OMS:
             weights_series = target_weights.groupby(level=0).first()
         
         # 4. Calculate target notional values
-        target_positions = {}
-        for ticker, weight in weights_series.items():
-            if np.isfinite(weight) and weight >= 0:
-                target_positions[ticker] = capital * weight
-            else:
-                logger.warning(f"Skipping {ticker}: invalid weight {weight}")
+        valid = np.isfinite(weights_series) & (weights_series >= 0)
+        for ticker, weight in weights_series[~valid].items():
+            logger.warning(f"Skipping {ticker}: invalid weight {weight}")
+        target_positions = capital * weights_series[valid].astype(float)
+        
+        # 5. Align current + target on the union of tickers (missing side = 0)
+        book = pd.DataFrame({
+            'current': current_positions,
+            'target': target_positions,
+        }).fillna(0.0)
+        current, target = book['current'], book['target']
+        delta = target - current
+        
+        # 6. Decide every trade with masks, then build the order plan:
+        # (ticker, action, notional)
+        # Skip if delta is too small (absolute or within threshold of the holding)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            within_threshold = (current > 0) & ((delta / current).abs() < self.REBALANCE_THRESHOLD)
+        trade = (delta.abs() >= self.MIN_ORDER_NOTIONAL) & ~within_threshold
+        
+        # BUY: Increase position
+        buy = trade & (delta > 0)
+        # SELL: use close_position API for full closures (more reliable)
+        close = trade & (delta < 0) & (target < self.MIN_ORDER_NOTIONAL)
+        # Partial sell - cap to 99% of current to avoid precision issues
+        sell = trade & (delta < 0) & ~close
+        sell_amount = np.minimum(delta.abs(), current * 0.99)[sell]
+        sell_amount = sell_amount[sell_amount >= self.MIN_ORDER_NOTIONAL]
         
-        # 5. Determine all tickers (union of current + target)
-        all_tickers = set(current_positions.keys()) | set(target_positions.keys())
+        plan = [(t, "close", None) for t in book.index[close]]
+        plan += [(t, "sell", n) for t, n in sell_amount.round(2).items()]
+        plan += [(t, "buy", n) for t, n in delta[buy].round(2).items()]
         
-        # 6. Calculate deltas and submit orders
+        # 7. Submit concurrently - each order is one network round-trip.
+        # Sells go first so the buys see the freed buying power.
         orders_submitted = []
         sells_submitted = []
         buys_submitted = []
         
-        for ticker in all_tickers:
-            current_value = current_positions.get(ticker, 0.0)
-            target_value = target_positions.get(ticker, 0.0)
-            delta = target_value - current_value
-            
-            # Skip if delta is too small (within threshold)
-            if abs(delta) < self.MIN_ORDER_NOTIONAL:
-                continue
-            if current_value > 0 and abs(delta / current_value) < self.REBALANCE_THRESHOLD:
-                continue
-            
+        sells = [p for p in plan if p[1] != "buy"]
+        buys = [p for p in plan if p[1] == "buy"]
+        
+        # Full exit: every held position is being closed, so one
+        # close_all_positions call replaces a DELETE per ticker.
+        closes = [p for p in sells if p[1] == "close"]
+        if not current_positions.empty and len(closes) == len(current_positions) == len(sells):
             try:
-                if delta > 0:
-                    # BUY: Increase position
-                    logger.info(f"Submitting: BUY ${delta:.2f} of {ticker}")
-                    order = self.alpaca.submit_order(
-                        symbol=ticker,
-                        notional=round(delta, 2),
-                        side="buy"
-                    )
-                    buys_submitted.append(order)
-                    orders_submitted.append(order)
-                elif delta < 0:
-                    # SELL: Reduce or close position
-                    sell_amount = abs(delta)
-                    
-                    # Use close_position API for full closures (more reliable)
-                    if target_value < self.MIN_ORDER_NOTIONAL:
-                        logger.info(f"Closing entire position: {ticker}")
-                        order = self.alpaca.close_position(ticker)
-                        sells_submitted.append(order)
-                        orders_submitted.append(order)
-                    else:
-                        # Partial sell - cap to 99% of current to avoid precision issues
-                        sell_amount = min(sell_amount, current_value * 0.99)
-                        if sell_amount < self.MIN_ORDER_NOTIONAL:
-                            continue
-                        logger.info(f"Submitting: SELL ${sell_amount:.2f} of {ticker}")
-                        order = self.alpaca.submit_order(
-                            symbol=ticker,
-                            notional=round(sell_amount, 2),
-                            side="sell"
-                        )
-                        sells_submitted.append(order)
-                        orders_submitted.append(order)
+                logger.info(f"Closing all {len(closes)} positions in one request")
+                closed = self.alpaca.close_all_positions()
+                results = closed if isinstance(closed, list) else [closed]
+                # Multi-status reply: each symbol carries its own status
+                ok = [r for r in results if isinstance(r, dict) and r.get('status') == 200]
+                sells_submitted.extend(ok)
+                orders_submitted.extend(ok)
+                done = {r.get('symbol') for r in ok}
+                sells = [p for p in sells if p[0] not in done]
+                if sells:
+                    logger.warning(f"{len(sells)} positions not closed in bulk; closing one by one")
             except Exception as e:
-                logger.error(f"Failed to submit order for {ticker}: {e}")
+                logger.error(f"close_all_positions failed ({e}); closing one by one")
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_ORDER_WORKERS) as pool:
+            for wave in (sells, buys):
+                futures = {pool.submit(self._submit, *p): p for p in wave}
+                # Collect in plan order so `details` is deterministic
+                for future, (ticker, action, _) in futures.items():
+                    try:
+                        order = future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to submit order for {ticker}: {e}")
+                        continue
+                    (buys_submitted if action == "buy" else sells_submitted).append(order)
+                    orders_submitted.append(order)
                 
         logger.info(f"Submitted {len(orders_submitted)} orders ({len(buys_submitted)} buys, {len(sells_submitted)} sells).")
         return {
@@ -142,5 +179,13 @@ class OMS:
             "details": orders_submitted
         }
 
+    def _submit(self, ticker: str, action: str, notional: float = None) -> Dict:
+        """Send one planned order (runs on a submission thread)."""
+        if action == "close":
+            logger.info(f"Closing entire position: {ticker}")
+            return self.alpaca.close_position(ticker)
+        logger.info(f"Submitting: {action.upper()} ${notional:.2f} of {ticker}")
+        return self.alpaca.submit_order(symbol=ticker, notional=notional, side=action)
+
     def submit_test_order(self, symbol="SPY", qty=1, side="buy"):
         return self.alpaca.submit_order(symbol=symbol, qty=qty, side=side)
@@ -0,0 +1,86 @@
+"""
+Group-aware array kernels for the technical indicators.
+
+The panel is sorted so each ticker's rows are contiguous; every kernel here
+works on the whole column at once and uses the per-row group start to stop
+shifts, fills and rolling windows from crossing into the previous ticker.
+"""
+import numpy as np
+import pandas as pd
+from pandas.api.indexers import BaseIndexer
+from scipy.signal import lfilter
+
+
+class GroupLayout:
+    """Per-row group offsets for a column of contiguous group keys."""
+    
+    def __init__(self, keys):
+        codes, uniques = pd.factorize(np.asarray(keys))
+        n = len(codes)
+        head = np.empty(n, dtype=bool)
+        head[:1] = True
+        head[1:] = codes[1:] != codes[:-1]
+        starts = np.flatnonzero(head)
+        
+        # Usable only when every group is a single run with a real key
+        self.contiguous = len(starts) == len(uniques) and not (codes < 0).any()
+        self.start = np.repeat(starts, np.diff(np.append(starts, n))).astype(np.int64)
+        self.pos = np.arange(n, dtype=np.int64) - self.start
+
+
+def shift(values: np.ndarray, layout: GroupLayout, periods: int) -> np.ndarray:
+    """values lagged by `periods` rows; NaN where the lag leaves the group."""
+    out = np.full(len(values), np.nan)
+    if periods < len(values):
+        out[periods:] = values[:len(values) - periods]
+    out[layout.pos < periods] = np.nan
+    return out
+
+
+def ffill(values: np.ndarray, layout: GroupLayout) -> np.ndarray:
+    """Forward-fill NaNs with the last valid value of the same group."""
+    idx = np.arange(len(values))
+    last = np.maximum.accumulate(np.where(np.isnan(values), -1, idx))
+    out = values[np.maximum(last, 0)]
+    out[last < layout.start] = np.nan
+    return out
+
+
+def lag_ratios(values: np.ndarray, layout: GroupLayout, periods) -> np.ndarray:
+    """values / (values lagged by each period) - 1, one column per period."""
+    n = len(values)
+    # Fortran order: each period's column is contiguous, and the 2-D array
+    # becomes a single DataFrame block without a copy
+    out = np.empty((n, len(periods)), order='F')
+    for j, h in enumerate(periods):
+        col = out[:, j]
+        col[:h] = np.nan
+        col[h:] = values[h:] / values[:max(n - h, 0)] - 1
+        col[layout.pos < h] = np.nan
+    return out
+
+
+def ewm_mean(values: np.ndarray, layout: GroupLayout, span: int) -> np.ndarray:
+    """
+    adjust=False EWMA restarted at each group start (values must be NaN-free).
+    
+    y[i] = a*x[i] + (1-a)*y[i-1] is a first-order IIR filter, so each group
+    is one lfilter call seeded with y[start] = x[start].
+    """
+    alpha = 2.0 / (span + 1)
+    b, a = [alpha], [1.0, alpha - 1.0]
+    out = np.empty(len(values))
+    starts = np.flatnonzero(layout.pos == 0)
+    for lo, hi in zip(starts, np.append(starts[1:], len(values)), strict=True):
+        seg = values[lo:hi]
+        out[lo:hi] = lfilter(b, a, seg, zi=[(1.0 - alpha) * seg[0]])[0]
+    return out
+
+
+class GroupWindow(BaseIndexer):
+    """Trailing fixed-size windows clipped at each row's group start."""
+    
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None, closed=None, step=None):
+        end = np.arange(1, num_values + 1, dtype=np.int64)
+        start = np.maximum(end - self.window_size, self.group_start)
+        return start, end
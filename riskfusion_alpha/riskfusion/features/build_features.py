@@ -19,51 +19,47 @@ def build_features(start_date=None):
     # Process per ticker
     logger.info("Computing technical features...")
     
-    # We group by ticker and apply transformations
-    # For efficiency with pandas, we can use group apply or pre-sort and use rolling
-    # prices is already sorted by date,ticker. Let's sort by ticker,date for rolling ops.
-    prices = prices.sort_values(['ticker', 'date'])
+    # Sort by ticker,date so each ticker's rows are contiguous; the technical
+    # kernels then run grouped by ticker over the whole frame in one pass.
+    # ignore_index gives the fresh RangeIndex the saved frame keeps throughout.
+    prices = prices.sort_values(['ticker', 'date'], ignore_index=True)
     
-    processed_dfs = []
+    # 1. Technicals
+    rets = compute_returns(prices, by='ticker')
+    vols = compute_volatility(prices, by='ticker')
+    rsi = compute_rsi(prices, by='ticker')
+    macd = compute_macd(prices, by='ticker')
+    zscore = compute_zscores(prices, window=20, by='ticker')
     
-    for ticker, group in prices.groupby('ticker'):
-        group = group.copy()
-        
-        # 1. Technicals
-        rets = compute_returns(group)
-        vols = compute_volatility(group)
-        rsi = compute_rsi(group)
-        macd = compute_macd(group)
-        zscore = compute_zscores(group, window=20)
-        
-        # Concat features
-        feats = pd.concat([group, rets, vols, macd, zscore], axis=1)
-        feats['rsi'] = rsi
-        
-        # 2. Targets (Shifted Returns)
-        # Target: Forward 5D return
-        feats['target_fwd_5d'] = feats['close'].pct_change(5).shift(-5)
-        # Target: Forward 1D return (for Tail/Risk)
-        feats['target_fwd_1d'] = feats['close'].pct_change(1).shift(-1)
-        
-        processed_dfs.append(feats)
-
-    full_df = pd.concat(processed_dfs)
+    # Assemble the panel from the computed column arrays by reference; every
+    # block shares prices' index, so a concat would only copy them again.
+    columns = dict(prices.items())
+    for block in (rets, vols, macd, zscore):
+        columns.update(block.items())
+    columns['rsi'] = rsi
+    full_df = pd.DataFrame(columns, index=prices.index, copy=False)
+    
+    # 2. Targets (Shifted Returns)
+    close = full_df.groupby('ticker', sort=False)['close']
+    # Target: Forward 5D return
+    full_df['target_fwd_5d'] = close.pct_change(5).groupby(full_df['ticker'], sort=False).shift(-5)
+    # Target: Forward 1D return (for Tail/Risk)
+    full_df['target_fwd_1d'] = close.pct_change(1).groupby(full_df['ticker'], sort=False).shift(-1)
     
     # 3. Cross-sectional Features (Requires full universe per date)
     # e.g. Rank of Momentum
     logger.info("Computing cross-sectional features...")
     
-    # Reset index to operate on columns
-    full_df = full_df.reset_index(drop=True)
-    
     # Example: Z-Score of 20D Return across universe per day
-    # Group by date
-    def xs_zscore(x):
-        return (x - x.mean()) / x.std()
-        
-    full_df['xs_mom_20d'] = full_df.groupby('date')['ret_20d'].transform(xs_zscore)
-    full_df['xs_vol_20d'] = full_df.groupby('date')['realized_vol_20d'].transform(xs_zscore)
+    # Group by date; built-in mean/std transforms stay in cython
+    by_date = full_df.groupby('date', sort=False)
+    
+    def xs_zscore(col):
+        g = by_date[col]
+        return (full_df[col] - g.transform('mean')) / g.transform('std')
+    
+    full_df['xs_mom_20d'] = xs_zscore('ret_20d')
+    full_df['xs_vol_20d'] = xs_zscore('realized_vol_20d')
     
     # 4. Merge Event Features
     from riskfusion.features.event_features import aggregate_events
@@ -74,8 +70,12 @@ def build_features(start_date=None):
     # A. Counts
     event_df = aggregate_events(prices)
     if not event_df.empty:
-        # full_df has 'date' and 'ticker' columns. event_df has index (date, ticker)
-        full_df = full_df.set_index(['date', 'ticker']).join(event_df, how='left').fillna(0).reset_index()
+        # full_df has 'date' and 'ticker' columns. event_df has index (date, ticker);
+        # merge on the columns instead of re-indexing the whole panel, and only
+        # zero-fill the event counts (feature warm-up/target NaNs stay NaN).
+        event_cols = list(event_df.columns)
+        full_df = full_df.merge(event_df.reset_index(), on=['date', 'ticker'], how='left')
+        full_df[event_cols] = full_df[event_cols].fillna(0).astype('int64')
     else:
         full_df['news_count'] = 0
         full_df['filings_count'] = 0
@@ -88,6 +88,15 @@ def build_features(start_date=None):
     # But be careful not to drop everything if data is short.
     # We usually drop the first N rows per ticker (warmup)
     
+    # Store derived columns compactly: float32 features/targets and int32
+    # counts halve the frame and the parquet. Raw price columns keep their
+    # ingested dtypes and tickers stay strings (parquet dictionary-encodes them).
+    derived = full_df.columns.difference(prices.columns)
+    floats = [c for c in derived if full_df[c].dtype == np.float64]
+    ints = [c for c in derived if full_df[c].dtype == np.int64]
+    full_df[floats] = full_df[floats].astype(np.float32)
+    full_df[ints] = full_df[ints].astype(np.int32)
+    
     # Save
     store.save_features(full_df)
     logger.info(f"Built features for {len(full_df)} rows.")
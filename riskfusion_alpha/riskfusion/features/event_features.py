@@ -1,35 +1,46 @@
 import pandas as pd
-from riskfusion.config import get_config
-from riskfusion.utils.hashing import load_parquet
-from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+from riskfusion.features.store import FeatureStore
+
+def _daily_counts(date: pa.Array, ticker: pa.Array, name: str) -> pa.Table:
+    """Rows per (date, ticker) via Arrow's hash aggregate; null keys are dropped."""
+    keys = pa.table({'date': date, 'ticker': ticker})
+    keys = keys.filter(pc.and_(pc.is_valid(keys['date']), pc.is_valid(keys['ticker'])))
+    counts = keys.group_by(['date', 'ticker']).aggregate([([], 'count_all')])
+    return counts.rename_columns(['date', 'ticker', name])
+
+def _event_dates(timestamps: pd.Series) -> pd.Series:
+    """Calendar day of each event; parquet timestamps skip the re-parse."""
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    return timestamps.dt.normalize()
 
 def aggregate_events(prices_df: pd.DataFrame) -> pd.DataFrame:
     """
     Load raw news/filings and aggregate to (ticker, date).
     """
-    config = get_config()
-    raw_path = Path(config.params['paths']['raw'])
+    store = FeatureStore()
+    # Read only the columns aggregated below, and skip events before the
+    # first price date (they can't join to any row) at the parquet reader
+    since = prices_df['date'].min() if not prices_df.empty else None
     
     # Load News
-    news_df = pd.DataFrame()
-    if (raw_path / "news.parquet").exists():
-        news_df = load_parquet(raw_path / "news.parquet")
+    news_df = store.load_raw_news(since=since, columns=['event_id', 'timestamp', 'tickers'])
     
     # Load Filings
-    filings_df = pd.DataFrame()
-    if (raw_path / "filings.parquet").exists():
-        filings_df = load_parquet(raw_path / "filings.parquet")
-        
+    filings_df = store.load_raw_filings(since=since, columns=['event_id', 'timestamp', 'ticker'])
+    
     # If no events, return empty features
     if news_df.empty and filings_df.empty:
         return pd.DataFrame()
-
+    
     # Normalize dates
     if not news_df.empty:
-        news_df['date'] = pd.to_datetime(news_df['timestamp']).dt.normalize()
+        news_df['date'] = _event_dates(news_df['timestamp'])
     if not filings_df.empty:
-        filings_df['date'] = pd.to_datetime(filings_df['timestamp']).dt.normalize()
-
+        filings_df['date'] = _event_dates(filings_df['timestamp'])
+    
     # Aggregate by Ticker/Date
     # We need to map news tickers (comma sep) to rows.
     # Note: MarketAux returns "AAPL,MSFT". We need to explode.
@@ -38,26 +49,33 @@ def aggregate_events(prices_df: pd.DataFrame) -> pd.DataFrame:
     
     # Process News
     if not news_df.empty:
-        # Explode tickers
-        news_exploded = news_df.assign(ticker=news_df['tickers'].str.split(',')).explode('ticker')
-        # Group
-        news_daily = news_exploded.groupby(['date', 'ticker']).agg({
-            'event_id': 'count',
-            # 'sentiment': 'mean' # if we had sentiment
-        }).rename(columns={'event_id': 'news_count'})
-        event_feats.append(news_daily)
-
+        # Explode tickers in Arrow: split each article's list, then pair every
+        # flattened ticker with its article's date through the parent index
+        news_df = news_df[news_df['event_id'].notna()]
+        ticker_lists = pc.split_pattern(pa.array(news_df['tickers'], type=pa.string()), ',')
+        dates = pa.Array.from_pandas(news_df['date'])
+        event_feats.append(_daily_counts(
+            pc.take(dates, pc.list_parent_indices(ticker_lists)),
+            pc.list_flatten(ticker_lists),
+            'news_count',
+        ))
+    
     # Process Filings
     if not filings_df.empty:
-        filings_daily = filings_df.groupby(['date', 'ticker']).agg({
-            'event_id': 'count'
-        }).rename(columns={'event_id': 'filings_count'})
-        event_feats.append(filings_daily)
-
+        filings_df = filings_df[filings_df['event_id'].notna()]
+        event_feats.append(_daily_counts(
+            pa.Array.from_pandas(filings_df['date']),
+            pa.array(filings_df['ticker'], type=pa.string()),
+            'filings_count',
+        ))
+    
     if not event_feats:
         return pd.DataFrame()
-
-    # Merge all event features
-    full_events = pd.concat(event_feats, axis=1).fillna(0)
+    
+    # Merge all event features (full outer join; a missing count is 0)
+    full_events = event_feats[0]
+    for counts in event_feats[1:]:
+        full_events = full_events.join(counts, keys=['date', 'ticker'], join_type='full outer')
+    full_events = full_events.to_pandas().set_index(['date', 'ticker']).sort_index().fillna(0)
     
     return full_events
@@ -3,6 +3,7 @@ Graph Features - Step 4 of Crazy Quant Ladder
 ==============================================
 Clustering and correlation network features for risk control.
 """
+import hashlib
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
@@ -12,6 +13,28 @@ from riskfusion.utils.logging import get_logger
 logger = get_logger("graph_features")
 
 
+def _correlation(returns: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlation of the columns. Complete windows go through one
+    GEMM on standardized returns; gaps need pandas' pairwise-complete corr.
+    """
+    X = returns.to_numpy(dtype=np.float64)
+    if len(X) < 2 or np.isnan(X).any():
+        return returns.corr()
+    
+    # Constant columns have no correlation (NaN, as in DataFrame.corr)
+    flat = (X == X[0]).all(axis=0)
+    X = X - X.mean(axis=0)
+    std = np.sqrt((X * X).mean(axis=0))
+    X = X / np.where(flat, 1.0, std)
+    corr = (X.T @ X) / len(X)
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, 1.0)
+    corr[flat, :] = np.nan
+    corr[:, flat] = np.nan
+    return pd.DataFrame(corr, index=returns.columns, columns=returns.columns)
+
+
 class GraphFeatureBuilder:
     """
     Builds graph/cluster features from correlation structure.
@@ -29,6 +52,13 @@ class GraphFeatureBuilder:
         self.correlation_window = graph_config.get('correlation_window', 60)
         self.clustering_method = graph_config.get('clustering_method', 'hierarchical')
         self.n_clusters = graph_config.get('n_clusters', 10)
+        # (key, labels) of the last hierarchical clustering
+        self._ward_cache = None
+        # clustering_method -> clusterer; unknown methods use ticker order
+        self._clusterers = {
+            'hierarchical': self._hierarchical_clustering,
+            'spectral': self._spectral_clustering,
+        }
     
     def compute_features(self, returns: pd.DataFrame) -> pd.DataFrame:
         """
@@ -44,7 +74,7 @@ class GraphFeatureBuilder:
         
         # Compute correlation matrix
         recent = returns.tail(self.correlation_window)
-        corr_matrix = recent.corr()
+        corr_matrix = _correlation(recent)
         
         # Handle NaN (tickers with insufficient data)
         corr_matrix = corr_matrix.fillna(0)
@@ -54,15 +84,15 @@ class GraphFeatureBuilder:
         # Cluster assignment
         cluster_labels = self._cluster_tickers(corr_matrix)
         
-        # Centrality measures
-        centrality = self._compute_centrality(corr_matrix)
+        # Centrality and correlation summaries, from one scratch copy
+        avg_correlation, max_correlation, centrality = self._correlation_stats(corr_matrix)
         
         # Build feature DataFrame
         features = pd.DataFrame({
             'cluster_id': cluster_labels,
             'centrality': centrality,
-            'avg_correlation': corr_matrix.mean(axis=1).values,
-            'max_correlation': (corr_matrix - np.eye(len(tickers))).max(axis=1).values,
+            'avg_correlation': avg_correlation,
+            'max_correlation': max_correlation,
         }, index=tickers)
         
         logger.info(f"Graph features computed for {len(tickers)} tickers, "
@@ -74,14 +104,13 @@ class GraphFeatureBuilder:
         """
         Cluster tickers based on correlation structure.
         """
-        if self.clustering_method == 'hierarchical':
-            return self._hierarchical_clustering(corr_matrix)
-        elif self.clustering_method == 'spectral':
-            return self._spectral_clustering(corr_matrix)
-        else:
-            # Default: equal-size clusters by ticker order
-            n = len(corr_matrix)
-            return np.repeat(np.arange(self.n_clusters), n // self.n_clusters + 1)[:n]
+        cluster = self._clusterers.get(self.clustering_method, self._ordered_clustering)
+        return cluster(corr_matrix)
+    
+    def _ordered_clustering(self, corr_matrix: pd.DataFrame) -> np.ndarray:
+        """Default: equal-size clusters by ticker order."""
+        n = len(corr_matrix)
+        return np.repeat(np.arange(self.n_clusters), n // self.n_clusters + 1)[:n]
     
     def _hierarchical_clustering(self, corr_matrix: pd.DataFrame) -> np.ndarray:
         """Hierarchical clustering using correlation distance."""
@@ -89,20 +118,27 @@ class GraphFeatureBuilder:
             from scipy.cluster.hierarchy import linkage, fcluster
             from scipy.spatial.distance import squareform
             
-            # Convert correlation to distance
-            dist_matrix = 1 - corr_matrix.values
-            np.fill_diagonal(dist_matrix, 0)
+            # Convert correlation to distance (one fresh C-contiguous float64
+            # buffer, updated in place; squareform ignores the diagonal)
+            dist_matrix = 1 - corr_matrix.to_numpy(dtype=np.float64)
             
             # Ensure symmetry and valid range
-            dist_matrix = np.clip(dist_matrix, 0, 2)
-            dist_matrix = (dist_matrix + dist_matrix.T) / 2
+            np.clip(dist_matrix, 0, 2, out=dist_matrix)
+            dist_matrix = dist_matrix + dist_matrix.T
+            dist_matrix *= 0.5
             
-            # Hierarchical clustering
+            # Hierarchical clustering (SciPy runs Ward as an O(N^2) NN-chain);
+            # an identical matrix reuses the previous labels
             condensed = squareform(dist_matrix, checks=False)
+            key = (self.n_clusters, hashlib.blake2b(condensed.tobytes(), digest_size=16).digest())
+            if self._ward_cache is not None and self._ward_cache[0] == key:
+                return self._ward_cache[1].copy()
+            
             Z = linkage(condensed, method='ward')
-            labels = fcluster(Z, t=self.n_clusters, criterion='maxclust')
+            labels = fcluster(Z, t=self.n_clusters, criterion='maxclust') - 1  # 0-indexed
+            self._ward_cache = (key, labels)
             
-            return labels - 1  # 0-indexed
+            return labels.copy()
             
         except Exception as e:
             logger.warning(f"Hierarchical clustering failed: {e}")
@@ -113,8 +149,9 @@ class GraphFeatureBuilder:
         try:
             from sklearn.cluster import SpectralClustering
             
-            # Use absolute correlation as affinity
-            affinity = np.abs(corr_matrix.values)
+            # Use absolute correlation as affinity (one fresh array, so the
+            # diagonal fill never writes into corr_matrix)
+            affinity = np.abs(corr_matrix.to_numpy(dtype=np.float64))
             np.fill_diagonal(affinity, 1)
             
             clustering = SpectralClustering(
@@ -130,17 +167,25 @@ class GraphFeatureBuilder:
             logger.warning(f"Spectral clustering failed: {e}")
             return np.zeros(len(corr_matrix), dtype=int)
     
-    def _compute_centrality(self, corr_matrix: pd.DataFrame) -> np.ndarray:
+    def _correlation_stats(self, corr_matrix: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Compute degree centrality (sum of absolute correlations).
-        High centrality = ticker is correlated with many others.
+        Per-ticker average correlation (self included), max correlation
+        (diagonal shifted by -1, as corr - I) and degree centrality
+        (mean |correlation| with others: high = correlated with many).
         """
-        # Degree centrality = sum of |correlation| with others
-        abs_corr = np.abs(corr_matrix.values)
-        np.fill_diagonal(abs_corr, 0)
-        centrality = abs_corr.sum(axis=1) / (len(corr_matrix) - 1)
+        A = corr_matrix.to_numpy(dtype=np.float64, copy=True)
+        avg_correlation = A.mean(axis=1)
+        
+        # Reductions run on the one buffer, edited in place between them
+        diag = A.diagonal().copy()
+        np.fill_diagonal(A, diag - 1)
+        max_correlation = A.max(axis=1)
+        
+        np.fill_diagonal(A, 0)
+        np.abs(A, out=A)
+        centrality = A.sum(axis=1) / (len(corr_matrix) - 1)
         
-        return centrality
+        return avg_correlation, max_correlation, centrality
 
 
 def is_graph_enabled() -> bool:
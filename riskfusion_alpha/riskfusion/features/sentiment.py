@@ -1,3 +1,6 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 from textblob import TextBlob
 from riskfusion.utils.logging import get_logger
@@ -10,6 +13,17 @@ def calculate_sentiment(text: str) -> float:
         return 0.0
     return TextBlob(text).sentiment.polarity
 
+# Unique texts above which scoring is spread over worker processes
+POOL_MIN_TEXTS = 10_000
+
+def score_texts(texts) -> np.ndarray:
+    """Polarity for each text; large batches run across CPU cores."""
+    if len(texts) >= POOL_MIN_TEXTS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as pool:
+            scores = pool.map(calculate_sentiment, texts, chunksize=512)
+            return np.fromiter(scores, dtype=np.float64, count=len(texts))
+    return np.fromiter(map(calculate_sentiment, texts), dtype=np.float64, count=len(texts))
+
 def build_sentiment_features(events_df: pd.DataFrame) -> pd.DataFrame:
     """
     Augment events DataFrame with sentiment scores.
@@ -25,35 +39,31 @@ def build_sentiment_features(events_df: pd.DataFrame) -> pd.DataFrame:
     # Combine title and description
     events_df['full_text'] = events_df['title'].fillna('') + " " + events_df['description'].fillna('')
     
-    # Apply TextBlob (Slow for millions of rows, okay for MVP)
-    events_df['sentiment_score'] = events_df['full_text'].apply(calculate_sentiment)
+    # Apply TextBlob once per distinct text (headlines repeat across tickers)
+    codes, unique_texts = pd.factorize(events_df['full_text'])
+    events_df['sentiment_score'] = score_texts(unique_texts)[codes]
     
     # Aggregate by Ticker + Date
     # We want daily sentiment per ticker
     daily_sent = events_df.groupby(['date', 'ticker'])['sentiment_score'].mean().reset_index()
     
-    # Calculate rolling averages
-    # Need to re-index to ensure continuous days or use rolling on time index
-    daily_sent = daily_sent.set_index('date').sort_index()
-    
-    # Group by ticker again to roll
-    result_frames = []
-    for ticker, group in daily_sent.groupby('ticker'):
-        group = group.sort_index()
-        # 7-day moving average of sentiment
-        group['sentiment_7d_avg'] = group['sentiment_score'].rolling('7D').mean()
-        
-        # Sentiment Shock: Today vs 30D Avg
-        group['sentiment_30d_avg'] = group['sentiment_score'].rolling('30D').mean()
-        group['sentiment_shock'] = group['sentiment_score'] - group['sentiment_30d_avg']
-        
-        result_frames.append(group)
-        
-    if not result_frames:
+    if daily_sent.empty:
         return pd.DataFrame()
-        
-    final_df = pd.concat(result_frames).reset_index()
-    final_df = final_df[['date', 'ticker', 'sentiment_score', 'sentiment_7d_avg', 'sentiment_shock']]
+    
+    # Calculate rolling averages
+    # Time-based windows per ticker in one grouped pass: rows sorted by
+    # ticker then date, so the grouped results line up with the rows
+    daily_sent = daily_sent.sort_values(['ticker', 'date'], ignore_index=True)
+    by_ticker = daily_sent.set_index('date').groupby('ticker', sort=False)['sentiment_score']
+    
+    # 7-day moving average of sentiment
+    daily_sent['sentiment_7d_avg'] = by_ticker.rolling('7D').mean().to_numpy()
+    
+    # Sentiment Shock: Today vs 30D Avg
+    sentiment_30d_avg = by_ticker.rolling('30D').mean().to_numpy()
+    daily_sent['sentiment_shock'] = daily_sent['sentiment_score'] - sentiment_30d_avg
+    
+    final_df = daily_sent[['date', 'ticker', 'sentiment_score', 'sentiment_7d_avg', 'sentiment_shock']]
     
     logger.info(f"Generated sentiment features for {len(final_df)} ticker-days.")
     return final_df
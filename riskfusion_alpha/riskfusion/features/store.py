@@ -1,11 +1,71 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from collections import OrderedDict
 from pathlib import Path
+from typing import List, Optional, Tuple
 from riskfusion.config import get_config
 from riskfusion.utils.hashing import save_parquet, load_parquet
 from riskfusion.utils.logging import get_logger
 
 logger = get_logger("feature_store")
 
+# Decoded parquet frames shared by every FeatureStore in the process,
+# keyed by path and invalidated when the file's (mtime, size) changes
+_FRAME_CACHE: "OrderedDict[Path, Tuple[Tuple[int, int], pd.DataFrame]]" = OrderedDict()
+_FRAME_CACHE_SIZE = 4
+
+
+def _load_parquet_cached(path: Path) -> pd.DataFrame:
+    """Load a parquet file once per version; callers get a private copy."""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    
+    hit = _FRAME_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        _FRAME_CACHE.move_to_end(path)
+        return hit[1].copy()
+    
+    df = load_parquet(path)
+    _FRAME_CACHE[path] = (key, df)
+    _FRAME_CACHE.move_to_end(path)
+    while len(_FRAME_CACHE) > _FRAME_CACHE_SIZE:
+        _FRAME_CACHE.popitem(last=False)
+    return df.copy()
+
+def _time_filters(path: Path, column: str, since=None, until=None,
+                  until_op: str = '<') -> Optional[List[tuple]]:
+    """
+    Parquet filters for since <= column < until (or <= with until_op='<='),
+    pushed down to the reader so row groups outside the window are skipped.
+    None when there is nothing to push (no bounds, or the column isn't a
+    stored timestamp).
+    """
+    if since is None and until is None:
+        return None
+    schema = pq.read_schema(path)
+    if column not in schema.names:
+        return None
+    col_type = schema.field(column).type
+    if not pa.types.is_timestamp(col_type):
+        return None
+    
+    def bound(value):
+        # Compare like with like: match the column's timezone awareness
+        ts = pd.Timestamp(value)
+        if col_type.tz and ts.tz is None:
+            return ts.tz_localize(col_type.tz)
+        if not col_type.tz and ts.tz is not None:
+            return ts.tz_convert(None)
+        return ts
+    
+    filters = []
+    if since is not None:
+        filters.append((column, '>=', bound(since)))
+    if until is not None:
+        filters.append((column, until_op, bound(until)))
+    return filters
+
 class FeatureStore:
     def __init__(self):
         self.config = get_config()
@@ -15,13 +75,23 @@ class FeatureStore:
         path = Path(self.config.params['paths']['raw']) / "prices.parquet"
         if not path.exists():
             raise FileNotFoundError(f"Prices not found at {path}")
-        return load_parquet(path)
+        return _load_parquet_cached(path)
 
-    def load_features(self, name: str = "features_latest") -> pd.DataFrame:
+    def load_features(self, name: str = "features_latest", start=None, end=None,
+                      columns: List[str] = None) -> pd.DataFrame:
+        """
+        Feature panel, optionally only start <= date <= end and `columns`.
+        A window or projection is applied inside the parquet reader, so rows
+        and columns outside it are never converted to pandas.
+        """
         path = self.processed_path / f"{name}.parquet"
         if not path.exists():
             return pd.DataFrame()
-        return load_parquet(path)
+        if start is None and end is None and columns is None:
+            return _load_parquet_cached(path)
+        
+        filters = _time_filters(path, 'date', since=start, until=end, until_op='<=')
+        return load_parquet(path, columns=columns, filters=filters)
     
     def save_features(self, df: pd.DataFrame, name: str = "features_latest"):
         path = self.processed_path / f"{name}.parquet"
@@ -29,14 +99,19 @@ class FeatureStore:
         save_parquet(df, path)
         logger.info(f"Saved features to {path}")
 
-    def load_raw_news(self) -> pd.DataFrame:
-        path = Path(self.config.params['paths']['raw']) / "news.parquet"
-        if not path.exists():
-            return pd.DataFrame()
-        return load_parquet(path)
+    def load_raw_news(self, since=None, until=None, columns: List[str] = None) -> pd.DataFrame:
+        """
+        News events, optionally only `columns`. since/until bound 'timestamp'
+        where the file allows pushdown; callers still apply exact date filters.
+        """
+        return self._load_raw_events("news.parquet", since, until, columns)
+
+    def load_raw_filings(self, since=None, until=None, columns: List[str] = None) -> pd.DataFrame:
+        """SEC filings; same arguments as load_raw_news."""
+        return self._load_raw_events("filings.parquet", since, until, columns)
 
-    def load_raw_filings(self) -> pd.DataFrame:
-        path = Path(self.config.params['paths']['raw']) / "filings.parquet"
+    def _load_raw_events(self, filename: str, since, until, columns) -> pd.DataFrame:
+        path = Path(self.config.params['paths']['raw']) / filename
         if not path.exists():
             return pd.DataFrame()
-        return load_parquet(path)
+        return load_parquet(path, columns=columns, filters=_time_filters(path, 'timestamp', since, until))
@@ -1,51 +1,135 @@
 import pandas as pd
 import numpy as np
 
-def compute_returns(df: pd.DataFrame, horizons=[1, 5, 20, 60, 252]) -> pd.DataFrame:
+from riskfusion.features._kernels import GroupLayout, GroupWindow, ewm_mean, ffill, lag_ratios, shift
+
+# Every function takes an optional `by` column (e.g. 'ticker'). With `by`,
+# the frame holds many series stacked (sorted by by/date) and each op runs
+# per group in one vectorized pass instead of a Python loop over groups.
+# Contiguous groups go through the array kernels in _kernels; anything else
+# falls back to a pandas groupby.
+
+def _grouping(df: pd.DataFrame, by):
+    """None (single series), a GroupLayout, or the raw keys for a groupby."""
+    if by is None:
+        return None
+    layout = GroupLayout(df[by])
+    return layout if layout.contiguous else df[by]
+
+def _pct_change(s: pd.Series, g, periods: int) -> pd.Series:
+    if isinstance(g, GroupLayout):
+        # Same as pandas: forward-fill within the group, then ratio to the lag
+        filled = ffill(s.to_numpy(dtype=np.float64), g)
+        return pd.Series(filled / shift(filled, g, periods) - 1, index=s.index, name=s.name)
+    return (s if g is None else s.groupby(g, sort=False)).pct_change(periods)
+
+def _diff(s: pd.Series, g) -> pd.Series:
+    if isinstance(g, GroupLayout):
+        values = s.to_numpy(dtype=np.float64)
+        return pd.Series(values - shift(values, g, 1), index=s.index, name=s.name)
+    return (s if g is None else s.groupby(g, sort=False)).diff()
+
+def _rolling(s: pd.Series, g, window: int, stat: str) -> pd.Series:
+    if g is None:
+        return getattr(s.rolling(window=window), stat)()
+    if isinstance(g, GroupLayout):
+        indexer = GroupWindow(window_size=window, group_start=g.start)
+        return getattr(s.rolling(indexer, min_periods=window), stat)()
+    res = getattr(s.groupby(g, sort=False).rolling(window=window), stat)()
+    return res.reset_index(level=0, drop=True)
+
+def _ewm_mean(s: pd.Series, g, span: int) -> pd.Series:
+    if g is None or isinstance(g, GroupLayout):
+        # Gap-free series take the lfilter recurrence; NaNs need pandas'
+        # decayed-weight handling
+        values = s.to_numpy(dtype=np.float64)
+        if not np.isnan(values).any():
+            layout = g if g is not None else GroupLayout(np.zeros(len(s), dtype=np.int8))
+            return pd.Series(ewm_mean(values, layout, span), index=s.index, name=s.name)
+    if g is None:
+        return s.ewm(span=span, adjust=False).mean()
+    keys = g.start if isinstance(g, GroupLayout) else g
+    res = s.groupby(keys, sort=False).ewm(span=span, adjust=False).mean()
+    return res.reset_index(level=0, drop=True)
+
+def compute_returns(df: pd.DataFrame, horizons=[1, 5, 20, 60, 252], by=None) -> pd.DataFrame:
     """
     Compute percentage returns for various horizons.
     Input df must have 'close' and be indexed by date (or grouped by ticker).
     """
+    g = _grouping(df, by)
+    columns = [f'ret_{h}d' for h in horizons]
+    if g is None:
+        g = GroupLayout(np.zeros(len(df), dtype=np.int8))
+    if isinstance(g, GroupLayout):
+        # Forward-fill once (pandas pct_change semantics), then every horizon
+        # is a ratio against the same filled array, written into one block
+        filled = ffill(df['close'].to_numpy(dtype=np.float64), g)
+        return pd.DataFrame(lag_ratios(filled, g, horizons), index=df.index, columns=columns)
+    
     out = pd.DataFrame(index=df.index)
-    for h in horizons:
-        out[f'ret_{h}d'] = df['close'].pct_change(h)
+    for col, h in zip(columns, horizons, strict=True):
+        out[col] = _pct_change(df['close'], g, h)
     return out
 
-def compute_volatility(df: pd.DataFrame, windows=[5, 20, 60]) -> pd.DataFrame:
+def compute_volatility(df: pd.DataFrame, windows=[5, 20, 60], by=None) -> pd.DataFrame:
     """
     Compute rolling realized volatility (annualized).
     """
+    g = _grouping(df, by)
+    columns = [f'realized_vol_{w}d' for w in windows]
+    if g is None:
+        g = GroupLayout(np.zeros(len(df), dtype=np.int8))
+    if isinstance(g, GroupLayout):
+        # One 1d-return array feeds every window; each window's std is a
+        # single cython pass written straight into a shared column block
+        filled = ffill(df['close'].to_numpy(dtype=np.float64), g)
+        ret_1d = pd.Series(lag_ratios(filled, g, [1])[:, 0])
+        vols = np.empty((len(df), len(windows)), order='F')
+        for j, w in enumerate(windows):
+            vols[:, j] = _rolling(ret_1d, g, w, 'std').to_numpy()
+        vols *= np.sqrt(252)
+        return pd.DataFrame(vols, index=df.index, columns=columns)
+    
     out = pd.DataFrame(index=df.index)
-    ret_1d = df['close'].pct_change(1)
+    ret_1d = _pct_change(df['close'], g, 1)
     
     for w in windows:
         # Vol = std dev of returns * sqrt(252)
-        out[f'realized_vol_{w}d'] = ret_1d.rolling(window=w).std() * np.sqrt(252)
+        out[f'realized_vol_{w}d'] = _rolling(ret_1d, g, w, 'std') * np.sqrt(252)
     
     return out
 
-def compute_rsi(df: pd.DataFrame, window=14) -> pd.Series:
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+def compute_rsi(df: pd.DataFrame, window=14, by=None) -> pd.Series:
+    g = _grouping(df, by)
+    delta = _diff(df['close'], g)
+    # Split into gains/losses with array masks (a NaN delta counts as 0)
+    d = delta.to_numpy()
+    ups = pd.Series(np.where(d > 0, d, 0), index=delta.index, name=delta.name)
+    downs = pd.Series(-np.where(d < 0, d, 0), index=delta.index, name=delta.name)
+    gain = _rolling(ups, g, window, 'mean')
+    loss = _rolling(downs, g, window, 'mean')
     
+    # SMA-smoothed RSI; loss == 0 gives rs = inf and so RSI = 100
     rs = gain / loss
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
-def compute_macd(df: pd.DataFrame, fast=12, slow=26, signal=9) -> pd.DataFrame:
-    ema_fast = df['close'].ewm(span=fast, adjust=False).mean()
-    ema_slow = df['close'].ewm(span=slow, adjust=False).mean()
+def compute_macd(df: pd.DataFrame, fast=12, slow=26, signal=9, by=None) -> pd.DataFrame:
+    g = _grouping(df, by)
+    ema_fast = _ewm_mean(df['close'], g, fast)
+    ema_slow = _ewm_mean(df['close'], g, slow)
     macd = ema_fast - ema_slow
-    sig = macd.ewm(span=signal, adjust=False).mean()
+    sig = _ewm_mean(macd, g, signal)
     return pd.DataFrame({'macd': macd, 'macd_signal': sig, 'macd_hist': macd - sig}, index=df.index)
 
-def compute_zscores(df: pd.DataFrame, window=60) -> pd.DataFrame:
+def compute_zscores(df: pd.DataFrame, window=60, by=None) -> pd.DataFrame:
     """
     Z-Score of price deviation from moving average? Or z-score of returns?
     Let's do Z-Score of price vs 20D MA (Mean Reversion signal)
     """
-    ma = df['close'].rolling(window=window).mean()
-    std = df['close'].rolling(window=window).std()
+    g = _grouping(df, by)
+    ma = _rolling(df['close'], g, window, 'mean')
+    std = _rolling(df['close'], g, window, 'std')
     z = (df['close'] - ma) / std
     return pd.DataFrame({f'zscore_{window}d': z}, index=df.index)
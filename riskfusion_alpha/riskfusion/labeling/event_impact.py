@@ -5,6 +5,13 @@ from riskfusion.utils.logging import get_logger
 
 logger = get_logger("event_labeling")
 
+def _forward_returns(close: np.ndarray, h: int) -> np.ndarray:
+    """close(t+h)/close(t) - 1 down each column; NaN for the last h rows."""
+    out = np.full(close.shape, np.nan)
+    if h < len(close):
+        out[:-h] = close[h:] / close[:-h] - 1
+    return out
+
 class EventLabeler:
     """
     Labels events based on Real Market Impact.
@@ -43,11 +50,12 @@ class EventLabeler:
             
         logger.info(f"Labeling {len(events)} labels...")
         
-        # 1. Prepare Market Data (SPY)
-        market = prices[prices['ticker'] == 'SPY'].copy()
-        market = market.set_index('date').sort_index()
-        market['ret_1d'] = market['close'].pct_change(1).shift(-1) # Forward 1D
-        market['ret_5d'] = market['close'].pct_change(5).shift(-5) # Forward 5D
+        # 1. Prepare Market Data: one date x ticker close matrix (SPY included)
+        wide = prices.pivot(index='date', columns='ticker', values='close').sort_index()
+        if 'SPY' not in wide.columns:
+            logger.warning("No SPY prices for labeling.")
+            return pd.DataFrame()
+        close = wide.to_numpy(dtype=np.float64)
         
         # 2. Prepare Ticker Data
         # LEAKAGE RULE: Events after market close (16:00 ET) are assigned to next trading day.
@@ -72,23 +80,25 @@ class EventLabeler:
         
         # We merge on 'effective_date' which aligns with Price Date
         
-        # Merge prices to get Ticker Returns
-        # prices needs fwd returns first
+        # Forward returns for every ticker in two 2-D passes
         # FORMULA: r_asset = close(t+1)/close(t) - 1
-        # This is exactly pct_change(1).shift(-1)
-        prices['ret_1d'] = prices.groupby('ticker')['close'].pct_change(1).shift(-1)
-        prices['ret_5d'] = prices.groupby('ticker')['close'].pct_change(5).shift(-5)
-        
-        merged = events.merge(prices[['date', 'ticker', 'ret_1d', 'ret_5d']], 
-                              left_on=['effective_date', 'ticker'], 
-                              right_on=['date', 'ticker'], 
-                              how='inner')
-        
-        # Join SPY Returns on effective_date
-        merged = merged.merge(market[['ret_1d', 'ret_5d']], 
-                              left_on='effective_date', 
-                              right_index=True, 
-                              suffixes=('', '_mkt'))
+        ret_1d = _forward_returns(close, 1)
+        ret_5d = _forward_returns(close, 5)
+        
+        # Look up each event's (effective_date, ticker) cell and SPY's row;
+        # events without a price that day drop out, as with an inner join
+        rows = wide.index.get_indexer(events['effective_date'])
+        cols = wide.columns.get_indexer(events['ticker'])
+        spy = wide.columns.get_loc('SPY')
+        keep = (rows >= 0) & (cols >= 0)
+        keep[keep] = ~np.isnan(close[rows[keep], cols[keep]]) & ~np.isnan(close[rows[keep], spy])
+        rows, cols = rows[keep], cols[keep]
+        
+        merged = events[keep].reset_index(drop=True)
+        merged['ret_1d'] = ret_1d[rows, cols]
+        merged['ret_5d'] = ret_5d[rows, cols]
+        merged['ret_1d_mkt'] = ret_1d[rows, spy]
+        merged['ret_5d_mkt'] = ret_5d[rows, spy]
         
         # 3. Calculate Abnormal Returns
         # Impact = |r_asset - r_spy|
@@ -9,17 +9,19 @@ from riskfusion.utils.logging import get_logger
 logger = get_logger("alpha_model")
 
 class AlphaModel:
+    # Class-level so AlphaModel.features can be read without building a model
+    features = [
+        'ret_1d', 'ret_5d', 'ret_20d', 
+        'realized_vol_20d', 'rsi', 
+        'xs_mom_20d', 'xs_vol_20d'
+        # 'news_count' removed - optional feature, API may fail
+    ]
+    target = 'target_fwd_5d'
+    
     def __init__(self, **kwargs):
         self.config = get_config()
         self.model = None
         self.params = kwargs # Store hyperparameters
-        self.features = [
-            'ret_1d', 'ret_5d', 'ret_20d', 
-            'realized_vol_20d', 'rsi', 
-            'xs_mom_20d', 'xs_vol_20d'
-            # 'news_count' removed - optional feature, API may fail
-        ]
-        self.target = 'target_fwd_5d'
 
     def train(self, df: pd.DataFrame):
         """
@@ -47,7 +47,13 @@ def check_feature_drift(train_df: pd.DataFrame, current_df: pd.DataFrame, featur
         if not pd.api.types.is_numeric_dtype(train_df[f]):
             continue
             
-        psi = calculate_psi(train_df[f].dropna().values, current_df[f].dropna().values, buckets=10)
+        expected = train_df[f].dropna().values
+        actual = current_df[f].dropna().values
+        # PSI is undefined without values on both sides (e.g. no baseline yet)
+        if len(expected) == 0 or len(actual) == 0:
+            continue
+        
+        psi = calculate_psi(expected, actual, buckets=10)
         drift_report[f] = psi
         
         if psi > 0.2:
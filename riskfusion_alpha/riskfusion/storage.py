@@ -12,13 +12,18 @@ from riskfusion.utils.logging import get_logger
 
 logger = get_logger("storage")
 
+# Databases whose tables were already created by this process
+_initialized_dbs = set()
+
 class RiskFusionDB:
     def __init__(self):
         config = get_config()
         # Ensure data dir exists
         db_path = Path(config.params.get('paths', {}).get('data', 'data')) / "riskfusion.db"
         self.db_path = str(db_path)
-        self._init_db()
+        if self.db_path not in _initialized_dbs:
+            self._init_db()
+            _initialized_dbs.add(self.db_path)
         
     def _init_db(self):
         """Initialize tables if they don't exist."""
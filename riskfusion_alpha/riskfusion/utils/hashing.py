@@ -15,9 +15,9 @@ def save_parquet(df: pd.DataFrame, path: Union[str, Path], partition_cols: List[
     else:
         df.to_parquet(path, engine='pyarrow', compression='snappy')
 
-def load_parquet(path: Union[str, Path]) -> pd.DataFrame:
-    """Load parquet file."""
-    return pd.read_parquet(path, engine='pyarrow')
+def load_parquet(path: Union[str, Path], columns: List[str] = None, filters: List[tuple] = None) -> pd.DataFrame:
+    """Load parquet file, optionally reading only `columns` and rows matching `filters`."""
+    return pd.read_parquet(path, engine='pyarrow', columns=columns, filters=filters)
 
 def compute_hash(obj: Any) -> str:
     """Compute stable hash for an object (df, dict, file)."""
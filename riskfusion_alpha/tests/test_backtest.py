@@ -0,0 +1,51 @@
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from riskfusion.backtest.engine import Backtester
+
+
+def _features():
+    rng = np.random.default_rng(0)
+    dates = pd.date_range("2024-01-01", periods=30)
+    tickers = [f"T{i}" for i in range(25)]
+    df = pd.DataFrame(
+        [(d, t) for d in dates for t in tickers], columns=['date', 'ticker']
+    )
+    df['f1'] = rng.standard_normal(len(df))
+    df['realized_vol_20d'] = rng.uniform(0.1, 0.4, len(df))
+    return df
+
+
+def _run(predict):
+    with patch("riskfusion.backtest.engine.FeatureStore") as mock_store_class, \
+         patch("riskfusion.backtest.engine.AlphaModel") as mock_model_class:
+        mock_store = mock_store_class.return_value
+        mock_store.load_features.return_value = _features()
+        mock_model = mock_model_class.return_value
+        mock_model.predict.side_effect = predict
+        
+        res = Backtester("2024-01-05", "2024-01-25").run()
+        return res, mock_model.predict.call_count
+
+
+def test_backtest_batch_predict_matches_per_day():
+    def score(df_in):
+        return df_in['f1'].to_numpy() * 2
+    
+    batched, calls = _run(score)
+    assert calls == 1
+    
+    # Fail the batch call so the engine falls back to one predict per day
+    state = {'first': True}
+    def flaky(df_in):
+        if state.pop('first', False):
+            raise RuntimeError("batch failed")
+        return score(df_in)
+    per_day, calls = _run(flaky)
+    assert calls == 1 + 21
+    
+    pd.testing.assert_frame_equal(batched, per_day)
+    assert batched['date'].nunique() == 21
+    assert np.allclose(batched.groupby('date')['weight'].sum(), 1.0)
@@ -0,0 +1,85 @@
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+
+from riskfusion.features import build_features as bf_module
+
+
+def _raw_prices():
+    rng = np.random.default_rng(1)
+    dates = pd.bdate_range('2022-01-03', periods=80)
+    frames = []
+    for ticker in ['AAA', 'BBB', 'CCC', 'DDD']:
+        close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+        frames.append(pd.DataFrame({'date': dates, 'ticker': ticker, 'close': close}))
+    return pd.concat(frames).sort_values(['date', 'ticker']).reset_index(drop=True)
+
+
+def _build(prices, events=None):
+    store = MagicMock()
+    store.load_raw_prices.return_value = prices
+    events = pd.DataFrame() if events is None else events
+    with patch.object(bf_module, 'FeatureStore', return_value=store), \
+         patch('riskfusion.features.event_features.aggregate_events', return_value=events):
+        bf_module.build_features()
+    return store.save_features.call_args[0][0]
+
+
+def test_cross_sectional_zscores_match_per_date_callback():
+    df = _build(_raw_prices())
+    
+    for col, xs_col in [('ret_20d', 'xs_mom_20d'), ('realized_vol_20d', 'xs_vol_20d')]:
+        values = df[col].astype(np.float64).groupby(df['date'])
+        expected = values.transform(lambda x: (x - x.mean()) / x.std())
+        # Features are stored as float32
+        np.testing.assert_allclose(df[xs_col], expected, rtol=1e-5, atol=1e-5)
+
+
+def test_targets_stay_within_ticker():
+    df = _build(_raw_prices())
+    
+    for _, group in df.groupby('ticker'):
+        close = group['close'].to_numpy()
+        np.testing.assert_allclose(group['target_fwd_5d'].to_numpy()[:-5], close[5:] / close[:-5] - 1)
+        assert group['target_fwd_5d'].iloc[-5:].isna().all()
+
+
+def test_event_counts_merge_without_filling_features():
+    prices = _raw_prices()
+    day = prices['date'].iloc[-1]
+    events = pd.DataFrame(
+        {'news_count': [3], 'filings_count': [1]},
+        index=pd.MultiIndex.from_tuples([(day, 'BBB')], names=['date', 'ticker']),
+    )
+    df = _build(prices, events)
+    
+    hit = (df['date'] == day) & (df['ticker'] == 'BBB')
+    assert df.loc[hit, ['news_count', 'filings_count']].values.tolist() == [[3, 1]]
+    assert df.loc[~hit, 'news_count'].eq(0).all()
+    # Only the event counts are zero-filled; targets past the panel end stay NaN
+    assert df['target_fwd_5d'].isna().sum() == 4 * 5
+    assert len(df) == len(prices) and df.index.equals(pd.RangeIndex(len(prices)))
+    assert df['news_count'].dtype == np.int32 and df['ret_20d'].dtype == np.float32
+    assert df['close'].dtype == np.float64
+
+
+def test_aggregate_events_counts_news_per_ticker():
+    from riskfusion.features import event_features
+    news = pd.DataFrame({
+        'event_id': ['a', 'b', 'c', None],
+        'timestamp': pd.to_datetime(['2024-01-02T10:00', '2024-01-02T12:00', '2024-01-03T09:00', '2024-01-03T10:00']),
+        'tickers': ['AAPL,MSFT', 'AAPL', None, 'SPY'],
+    })
+    store = MagicMock()
+    store.load_raw_news.return_value = news
+    store.load_raw_filings.return_value = pd.DataFrame()
+    
+    with patch.object(event_features, 'FeatureStore', return_value=store):
+        events = event_features.aggregate_events(pd.DataFrame({'date': pd.to_datetime(['2024-01-02'])}))
+    
+    assert events['news_count'].to_dict() == {
+        (pd.Timestamp('2024-01-02'), 'AAPL'): 2,
+        (pd.Timestamp('2024-01-02'), 'MSFT'): 1,
+    }
+    assert store.load_raw_news.call_args.kwargs['since'] == pd.Timestamp('2024-01-02')
@@ -16,6 +16,16 @@ def test_cli_ingest_help():
     res = run_cmd(["ingest", "--help"])
     assert res.returncode == 0
 
+def test_cli_import_is_light():
+    # Command modules are imported by their handler, not at CLI import
+    code = (
+        "import sys, riskfusion.cli; "
+        "print(','.join(m for m in ('pandas', 'lightgbm', 'yaml') if m in sys.modules))"
+    )
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert res.returncode == 0
+    assert res.stdout.strip() == ""
+
 def test_cli_daily_fail_no_data():
     # Should fail elegantly or log error if no data
     # We expect it to run but maybe fail inside pipeline, which logs error but exits ?
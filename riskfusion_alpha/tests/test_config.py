@@ -0,0 +1,70 @@
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from riskfusion import config as config_module
+from riskfusion.config import Config, get_config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    cfg_dir = tmp_path / "configs"
+    cfg_dir.mkdir()
+    path = cfg_dir / "test.yaml"
+    path.write_text(
+        "paths:\n"
+        "  outputs: data/outputs\n"
+        "alpha:\n"
+        "  use_quantiles: true\n"
+        "  horizon: null\n"
+    )
+    return path
+
+
+def test_get_dotted_keys(config_file):
+    config = Config(config_file)
+    assert config.get("alpha.use_quantiles") is True
+    assert config.get("alpha") == {"use_quantiles": True, "horizon": None}
+    assert config.get("paths.outputs").endswith("outputs")
+    assert config.get("alpha.horizon", 5) == 5
+    assert config.get("alpha.use_quantiles.deeper", "x") == "x"
+    assert config.get("missing", "x") == "x"
+
+
+def test_get_config_builds_once_under_concurrency(config_file):
+    barrier = threading.Barrier(8)
+    results = []
+    
+    def worker():
+        barrier.wait()
+        results.append(get_config(str(config_file)))
+    
+    with patch.dict(config_module._config_instances, clear=True):
+        with patch.object(config_module, "Config", wraps=Config) as mock_config:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert mock_config.call_count == 1
+    
+    assert len({id(c) for c in results}) == 1
+
+
+def test_yaml_parse_is_reused_per_path_and_mtime(config_file):
+    config_module._parse_yaml.cache_clear()
+    first = Config(config_file)
+    second = Config(config_file)
+    assert config_module._parse_yaml.cache_info().hits == 1
+    
+    # Each Config owns its params
+    first.params["alpha"]["use_quantiles"] = False
+    assert second.params["alpha"]["use_quantiles"] is True
+    
+    # Rewriting the file invalidates the cached parse
+    st = config_file.stat()
+    config_file.write_text("alpha:\n  use_quantiles: false\n")
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert Config(config_file).get("alpha.use_quantiles") is False
@@ -24,3 +24,11 @@ def test_check_feature_drift():
     report = check_feature_drift(df_train, df_curr, ['f1'])
     assert 'f1' in report
     assert report['f1'] > 0.2
+
+def test_check_feature_drift_skips_empty_baseline():
+    df_train = pd.DataFrame({'f1': [np.nan] * 3})
+    df_curr = pd.DataFrame({'f1': [0.1, 0.2, 0.3]})
+    
+    # All-NaN and empty baselines both give no PSI instead of raising
+    assert check_feature_drift(df_train, df_curr, ['f1']) == {}
+    assert check_feature_drift(df_train.iloc[:0], df_curr, ['f1']) == {}
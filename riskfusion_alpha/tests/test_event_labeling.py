@@ -94,3 +94,32 @@ def test_label_events(mock_store_cls):
     r2 = labeled[labeled['event_id'] == 'evt2'].iloc[0]
     assert r2['high_impact'] == 0
     assert r2['ar_1d'] < 0.02
+
+@patch("riskfusion.labeling.event_impact.FeatureStore")
+def test_label_events_date_major_prices(mock_store_cls):
+    # Forward returns stay within each ticker whatever the row order,
+    # and the (cached) raw prices frame is left untouched
+    dates = pd.date_range('2023-01-02', periods=3, freq='B')
+    prices = pd.DataFrame({
+        'date': np.repeat(dates, 2),
+        'ticker': ['AAPL', 'SPY'] * 3,
+        'close': [100.0, 100.0, 110.0, 101.0, 110.0, 102.0],
+    })
+    news_df = pd.DataFrame([{
+        'event_id': 'evt1', 'timestamp': dates[0] + pd.Timedelta(hours=10),
+        'ticker': 'AAPL', 'title': 'AM News', 'description': 'Desc',
+    }])
+    
+    mock_store = mock_store_cls.return_value
+    mock_store.load_raw_prices.return_value = prices
+    mock_store.load_raw_news.return_value = news_df
+    mock_store.load_raw_filings.return_value = pd.DataFrame()
+    
+    labeled = EventLabeler().label_events()
+    
+    assert list(prices.columns) == ['date', 'ticker', 'close']
+    r1 = labeled.iloc[0]
+    assert r1['ar_1d'] == pytest.approx(0.09)
+    assert r1['label_1d'] == 1
+    # No 5-day forward window inside the sample
+    assert np.isnan(r1['ar_5d'])
@@ -10,8 +10,28 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("ALPACA_API_KEY", "pk_test")
     monkeypatch.setenv("ALPACA_SECRET_KEY", "sk_test")
 
-@patch("riskfusion.execution.alpaca_connector.requests.post")
-@patch("riskfusion.execution.alpaca_connector.requests.get")
+def _alpaca_gets(orders, account, positions, *later_orders):
+    """
+    Session.get side effect answering by endpoint, since the OMS fetches
+    account and positions concurrently. /v2/orders returns `orders`, then
+    each of `later_orders` in turn (the last one repeats).
+    """
+    order_pages = [orders, *later_orders]
+    
+    def get(url, headers=None):
+        resp = MagicMock(status_code=200)
+        if "/v2/orders" in url:
+            resp.json.return_value = order_pages.pop(0) if len(order_pages) > 1 else order_pages[0]
+        elif url.endswith("/v2/account"):
+            resp.json.return_value = account
+        else:
+            resp.json.return_value = positions
+        return resp
+    
+    return get
+
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
 def test_alpaca_orders(mock_get, mock_post, mock_env):
     # Setup Mocks
     mock_get.return_value.json.return_value = {"status": "ACTIVE"}
@@ -30,17 +50,17 @@ def test_alpaca_orders(mock_get, mock_post, mock_env):
     assert kwargs['json']['symbol'] == "SPY"
 
 
-@patch("riskfusion.execution.alpaca_connector.requests.delete")
-@patch("riskfusion.execution.alpaca_connector.requests.post")
-@patch("riskfusion.execution.alpaca_connector.requests.get")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
 def test_oms_executes_sell_orders(mock_get, mock_post, mock_delete, mock_env):
     """Test that OMS sells positions when target is lower than current."""
-    # Mock responses in order: get_orders, get_account, get_positions
-    mock_get.return_value.json.side_effect = [
+    # Mock responses: get_orders, get_account, get_positions
+    mock_get.side_effect = _alpaca_gets(
         [],  # get_orders - no pending orders
         {"equity": "10000"},  # get_account
         [{"symbol": "AAPL", "market_value": "5000"}]  # get_positions
-    ]
+    )
     mock_get.return_value.raise_for_status = MagicMock()
     mock_post.return_value.json.return_value = {"id": "sell_order_1", "status": "new"}
     mock_post.return_value.status_code = 200
@@ -55,16 +75,16 @@ def test_oms_executes_sell_orders(mock_get, mock_post, mock_delete, mock_env):
     assert result["sells"] >= 0
 
 
-@patch("riskfusion.execution.alpaca_connector.requests.delete")
-@patch("riskfusion.execution.alpaca_connector.requests.post")
-@patch("riskfusion.execution.alpaca_connector.requests.get")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
 def test_oms_closes_positions(mock_get, mock_post, mock_delete, mock_env):
     """Test that OMS closes positions when target weight is 0 (not in target)."""
-    mock_get.return_value.json.side_effect = [
+    mock_get.side_effect = _alpaca_gets(
         [],  # get_orders - no pending orders
         {"equity": "10000"},  # get_account
         [{"symbol": "TSLA", "market_value": "3000"}]  # Currently holding TSLA
-    ]
+    )
     mock_get.return_value.raise_for_status = MagicMock()
     mock_post.return_value.json.return_value = {"id": "buy_order", "status": "new"}
     mock_post.return_value.status_code = 200
@@ -82,19 +102,19 @@ def test_oms_closes_positions(mock_get, mock_post, mock_delete, mock_env):
     assert result["orders_submitted"] >= 0
 
 
-@patch("riskfusion.execution.alpaca_connector.requests.delete")
-@patch("riskfusion.execution.alpaca_connector.requests.post")
-@patch("riskfusion.execution.alpaca_connector.requests.get")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
 def test_oms_buys_and_sells_together(mock_get, mock_post, mock_delete, mock_env):
     """Test that OMS can buy new positions and sell old ones in same rebalance."""
-    mock_get.return_value.json.side_effect = [
+    mock_get.side_effect = _alpaca_gets(
         [],  # get_orders - no pending orders
         {"equity": "10000"},
         [
             {"symbol": "AAPL", "market_value": "4000"},  # Hold AAPL
             {"symbol": "MSFT", "market_value": "4000"}   # Hold MSFT
         ]
-    ]
+    )
     mock_get.return_value.raise_for_status = MagicMock()
     mock_post.return_value.json.return_value = {"id": "order", "status": "new"}
     mock_post.return_value.status_code = 200
@@ -113,3 +133,141 @@ def test_oms_buys_and_sells_together(mock_get, mock_post, mock_delete, mock_env)
     assert "sells" in result
 
 
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
+def test_oms_submits_sells_before_buys(mock_get, mock_post, mock_delete, mock_env):
+    """Orders are fanned out concurrently, with the sell wave finishing before any buy."""
+    mock_get.side_effect = _alpaca_gets(
+        [],
+        {"equity": "10000"},
+        [
+            {"symbol": "AAPL", "market_value": "4000"},
+            {"symbol": "TSLA", "market_value": "3000"},
+        ]
+    )
+    calls = []
+    
+    def post(url, headers=None, json=None):
+        calls.append((json["side"], json["symbol"]))
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"symbol": json["symbol"], "side": json["side"]}
+        return resp
+    
+    def delete(url, headers=None):
+        calls.append(("close", url.rsplit("/", 1)[-1]))
+        resp = MagicMock(status_code=200)
+        resp.json.return_value = {"symbol": "TSLA"}
+        return resp
+    
+    mock_post.side_effect = post
+    mock_delete.side_effect = delete
+    
+    # AAPL 40% -> 10% (sell), TSLA -> 0 (close), GOOGL/MSFT new (buy)
+    target_weights = pd.DataFrame({
+        "weight": [0.1, 0.2, 0.3]
+    }, index=["AAPL", "GOOGL", "MSFT"])
+    result = OMS().execute_rebalance(target_weights)
+    
+    assert result["orders_submitted"] == 4
+    assert result["buys"] == 2
+    assert result["sells"] == 2
+    sides = [side for side, _ in calls]
+    assert sorted(sides[:2]) == ["close", "sell"]
+    assert sides[2:] == ["buy", "buy"]
+    # Results come back in plan order, not completion order
+    assert [o["symbol"] for o in result["details"][2:]] == ["GOOGL", "MSFT"]
+
+
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
+def test_oms_full_exit_uses_close_all(mock_get, mock_post, mock_delete, mock_env):
+    """When every holding is closed, one DELETE /v2/positions replaces per-ticker closes."""
+    mock_get.side_effect = _alpaca_gets(
+        [],
+        {"equity": "10000"},
+        [
+            {"symbol": "AAPL", "market_value": "4000"},
+            {"symbol": "TSLA", "market_value": "3000"},
+        ]
+    )
+    mock_post.return_value.json.return_value = {"id": "order", "status": "new"}
+    mock_post.return_value.status_code = 200
+    mock_delete.return_value.json.return_value = [
+        {"symbol": "AAPL", "status": 200},
+        {"symbol": "TSLA", "status": 200},
+    ]
+    
+    target_weights = pd.DataFrame({"weight": [0.5]}, index=["SPY"])
+    result = OMS().execute_rebalance(target_weights)
+    
+    mock_delete.assert_called_once()
+    assert mock_delete.call_args[0][0].endswith("/v2/positions")
+    assert result["sells"] == 2
+    assert result["buys"] == 1
+
+
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
+def test_oms_waits_for_cancels_before_reading_positions(mock_get, mock_post, mock_delete, mock_env):
+    """Positions are read only once no order is left open (pending_cancel can still fill)."""
+    pending = [{"id": "o1", "status": "pending_cancel"}]
+    route = _alpaca_gets(
+        pending, {"equity": "10000"}, [{"symbol": "AAPL", "market_value": "5000"}],
+        pending, pending, [],
+    )
+    calls = []
+    
+    def get(url, headers=None):
+        calls.append(url.rsplit("/", 1)[-1])
+        return route(url, headers)
+    
+    mock_get.side_effect = get
+    mock_delete.return_value.json.return_value = []
+    mock_post.return_value.json.return_value = {"id": "order", "status": "new"}
+    mock_post.return_value.status_code = 200
+    
+    oms = OMS()
+    oms.CANCEL_POLL_SECONDS = 0
+    oms.execute_rebalance(pd.DataFrame({"weight": [0.2]}, index=["AAPL"]))
+    
+    mock_delete.assert_called_once()
+    assert calls[:4] == ["orders?status=open"] * 4
+    assert sorted(calls[4:6]) == ["account", "positions"]
+
+
+@patch("riskfusion.execution.alpaca_connector.requests.Session.delete")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.post")
+@patch("riskfusion.execution.alpaca_connector.requests.Session.get")
+def test_oms_full_exit_retries_failed_symbols(mock_get, mock_post, mock_delete, mock_env):
+    """Symbols whose bulk close failed (207 entry status != 200) are closed one by one."""
+    mock_get.side_effect = _alpaca_gets(
+        [],
+        {"equity": "10000"},
+        [
+            {"symbol": "AAPL", "market_value": "4000"},
+            {"symbol": "TSLA", "market_value": "3000"},
+        ]
+    )
+    deleted = []
+    
+    def delete(url, headers=None):
+        deleted.append(url.rsplit("/v2/", 1)[-1])
+        resp = MagicMock(status_code=200)
+        if url.endswith("/v2/positions"):
+            resp.json.return_value = [
+                {"symbol": "AAPL", "status": 200},
+                {"symbol": "TSLA", "status": 500, "body": {"message": "error"}},
+            ]
+        else:
+            resp.json.return_value = {"symbol": "TSLA", "status": "new"}
+        return resp
+    
+    mock_delete.side_effect = delete
+    
+    result = OMS().execute_rebalance(pd.DataFrame({"weight": [0.0]}, index=["SPY"]))
+    
+    assert deleted == ["positions", "positions/TSLA"]
+    assert result["sells"] == 2
@@ -0,0 +1,78 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from riskfusion.features import store as store_module
+from riskfusion.features.store import FeatureStore
+
+
+def test_load_features_is_cached_until_file_changes(tmp_path):
+    store = FeatureStore()
+    store.processed_path = tmp_path
+    df = pd.DataFrame({'ticker': ['A', 'B'], 'ret_1d': [0.1, 0.2]})
+    store.save_features(df)
+    
+    with patch.object(store_module, "load_parquet", wraps=store_module.load_parquet) as mock_load:
+        first = store.load_features()
+        other_store = FeatureStore()
+        other_store.processed_path = tmp_path
+        second = other_store.load_features()
+        assert mock_load.call_count == 1
+        
+        # Callers get independent copies
+        first.loc[0, 'ret_1d'] = 99.0
+        pd.testing.assert_frame_equal(second, df)
+        pd.testing.assert_frame_equal(store.load_features(), df)
+        assert mock_load.call_count == 1
+        
+        # Rewriting the file invalidates the cached frame
+        updated = df.assign(ret_1d=[0.3, 0.4])
+        store.save_features(updated)
+        path = tmp_path / "features_latest.parquet"
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        pd.testing.assert_frame_equal(store.load_features(), updated)
+        assert mock_load.call_count == 2
+
+
+def test_load_raw_events_pushes_down_time_window(tmp_path):
+    store = FeatureStore()
+    store.config = MagicMock(params={'paths': {'raw': str(tmp_path)}})
+    news = pd.DataFrame({
+        'event_id': ['a', 'b', 'c'],
+        'timestamp': pd.to_datetime(['2024-01-01T15:00Z', '2024-01-02T09:30Z', '2024-01-03T01:00Z']),
+        'tickers': ['AAPL', 'AAPL,MSFT', 'SPY'],
+        'title': ['x', 'y', 'z'],
+    })
+    news.to_parquet(tmp_path / "news.parquet")
+    # SEC filing dates are stored as strings: nothing is pushed down
+    filings = pd.DataFrame({'event_id': ['f1'], 'timestamp': ['2023-12-01'], 'ticker': ['AAPL']})
+    filings.to_parquet(tmp_path / "filings.parquet")
+    
+    day = store.load_raw_news(since=pd.Timestamp('2024-01-02'), until=pd.Timestamp('2024-01-03'))
+    assert list(day['event_id']) == ['b']
+    
+    recent = store.load_raw_news(since='2024-01-02', columns=['event_id', 'tickers'])
+    assert list(recent.columns) == ['event_id', 'tickers']
+    assert list(recent['event_id']) == ['b', 'c']
+    
+    assert len(store.load_raw_filings(since='2024-01-01')) == 1
+
+
+def test_load_features_window_and_columns(tmp_path):
+    store = FeatureStore()
+    store.processed_path = tmp_path
+    df = pd.DataFrame({
+        'date': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04']),
+        'ticker': ['A', 'A', 'A', 'A'],
+        'ret_1d': [0.1, 0.2, 0.3, 0.4],
+    })
+    store.save_features(df)
+    
+    window = store.load_features(start='2024-01-02', end='2024-01-03')
+    assert list(window['ret_1d']) == [0.2, 0.3]
+    
+    narrow = store.load_features(end=pd.Timestamp('2024-01-01'), columns=['date', 'ret_1d'])
+    assert list(narrow.columns) == ['date', 'ret_1d']
+    assert len(narrow) == 1
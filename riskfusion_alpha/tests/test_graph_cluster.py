@@ -146,3 +146,21 @@ class TestIsGraphEnabled:
         from riskfusion.features.graph_features import is_graph_enabled
         mock_config.return_value.params = {'graph': {'enabled': True}}
         assert is_graph_enabled() == True
+
+
+class TestCorrelation:
+    """GEMM correlation matches DataFrame.corr."""
+    
+    def test_matches_pandas_corr(self):
+        from riskfusion.features.graph_features import _correlation
+        
+        rng = np.random.default_rng(0)
+        factor = rng.normal(size=(60, 1))
+        returns = pd.DataFrame(factor * rng.normal(size=(1, 8)) + rng.normal(size=(60, 8)))
+        returns[3] = 0.01  # constant column -> NaN row/column
+        
+        pd.testing.assert_frame_equal(_correlation(returns), returns.corr(), rtol=1e-12, atol=1e-12)
+        
+        # Gaps fall back to pairwise-complete correlation
+        returns.iloc[5, 2] = np.nan
+        pd.testing.assert_frame_equal(_correlation(returns), returns.corr())
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from riskfusion.features import sentiment
+
+
+def test_rolling_sentiment_stays_within_ticker(monkeypatch):
+    monkeypatch.setattr(sentiment, 'calculate_sentiment', lambda text: float(text.split()[0]))
+    events = pd.DataFrame({
+        'date': pd.to_datetime(['2024-01-01', '2024-01-03', '2024-01-02', '2024-01-20', '2024-01-02']),
+        'ticker': ['AAA', 'AAA', 'BBB', 'AAA', 'AAA'],
+        'title': ['1', '3', '-1', '5', '2'],
+        'description': None,
+    })
+    
+    out = sentiment.build_sentiment_features(events).set_index(['ticker', 'date'])
+    
+    # Same-day events are averaged first: AAA on 01-01 = 1, 01-02 = 2, 01-03 = 3
+    assert out.loc[('AAA', pd.Timestamp('2024-01-03')), 'sentiment_7d_avg'] == 2.0
+    # 01-20 is more than 7 days after the rest, so it stands alone
+    assert out.loc[('AAA', pd.Timestamp('2024-01-20')), 'sentiment_7d_avg'] == 5.0
+    assert out.loc[('AAA', pd.Timestamp('2024-01-20')), 'sentiment_shock'] == 5.0 - 11 / 4
+    assert out.loc[('BBB', pd.Timestamp('2024-01-02')), 'sentiment_7d_avg'] == -1.0
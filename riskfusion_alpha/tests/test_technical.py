@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+
+from riskfusion.features.technical import (
+    compute_macd,
+    compute_returns,
+    compute_rsi,
+    compute_volatility,
+    compute_zscores,
+)
+
+
+def _stacked_prices():
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range('2022-01-03', periods=120)
+    frames = []
+    for ticker, n in [('AAA', 120), ('BBB', 120), ('CCC', 25)]:
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        frames.append(pd.DataFrame({'date': dates[:n], 'ticker': ticker, 'close': close}))
+    return pd.concat(frames).sort_values(['ticker', 'date']).reset_index(drop=True)
+
+
+def test_grouped_kernels_match_per_ticker():
+    prices = _stacked_prices()
+    kernels = [
+        compute_returns,
+        compute_volatility,
+        compute_rsi,
+        compute_macd,
+        lambda df, **kw: compute_zscores(df, window=20, **kw),
+    ]
+    
+    for kernel in kernels:
+        grouped = kernel(prices, by='ticker')
+        looped = pd.concat([kernel(group) for _, group in prices.groupby('ticker')])
+        if isinstance(looped, pd.Series):
+            pd.testing.assert_series_equal(grouped, looped)
+        else:
+            pd.testing.assert_frame_equal(grouped, looped)
+    
+    # Windows never reach across tickers: the short ticker has no 60d vol
+    vols = compute_volatility(prices, by='ticker')
+    assert vols.loc[prices['ticker'] == 'CCC', 'realized_vol_60d'].isna().all()
+
+
+def test_interleaved_rows_match_contiguous():
+    # Date-major rows take the groupby fallback; gaps are filled per ticker
+    prices = _stacked_prices()
+    prices.loc[[5, 130], 'close'] = np.nan
+    interleaved = prices.sort_values(['date', 'ticker'])
+    
+    for kernel in [compute_returns, compute_volatility, compute_rsi, compute_macd]:
+        contiguous = kernel(prices, by='ticker')
+        fallback = kernel(interleaved, by='ticker').loc[prices.index]
+        pd.testing.assert_frame_equal(pd.DataFrame(contiguous), pd.DataFrame(fallback))
+
+
+def test_macd_recurrence_matches_pandas_ewm():
+    prices = _stacked_prices()
+    macd = compute_macd(prices, by='ticker')
+    
+    for _, group in prices.groupby('ticker'):
+        fast = group['close'].ewm(span=12, adjust=False).mean()
+        slow = group['close'].ewm(span=26, adjust=False).mean()
+        line = fast - slow
+        signal = line.ewm(span=9, adjust=False).mean()
+        np.testing.assert_allclose(macd.loc[group.index, 'macd'], line, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(macd.loc[group.index, 'macd_signal'], signal, rtol=1e-9, atol=1e-12)